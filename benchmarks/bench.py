@@ -0,0 +1,305 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from model.config import MachineConfig
+from model.memory import MemorySimulator
+from model.workload import generate_addresses, RANDOM_PATTERN, SEQUENTIAL_PATTERN, ZIPF_PATTERN
+
+BENCHMARK_SCENARIOS = ("all-hit", "all-fault", "sequential", "random", "zipf")
+BENCHMARK_APIS = ("scalar", "batch")
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+PID = "bench"
+# Las cargas que no son de aciertos recorren un espacio varias veces mayor que la memoria.
+FOOTPRINT_FACTOR = 4
+# Repeticiones mínimas al guardar o comparar una línea base: con menos, la mejor ejecución y
+# la dispersión no son estables.
+MIN_GATE_REPEATS = 5
+# El umbral de regresión de throughput de un caso nunca es menor que NOISE_FACTOR veces su
+# dispersión entre repeticiones (la mayor entre la línea base y la ejecución actual).
+NOISE_FACTOR = 2.0
+
+
+def scenario_addresses(scenario, frames, accesses, page_size, seed):
+    """
+    Obtiene las páginas del proceso y las direcciones de un escenario. Los escenarios están
+    pensados para aislar un camino: all-hit nunca sale del conjunto residente, all-fault
+    recorre en ciclo una página más de las que caben (con FIFO o LRU cada acceso es un fallo
+    con reemplazo) y los demás mezclan ambos.
+    Args:
+        scenario (str): Uno de BENCHMARK_SCENARIOS.
+        frames (int): Marcos físicos.
+        accesses (int): Accesos a generar.
+        page_size (int): Tamaño de página.
+        seed (int): Semilla.
+    Returns:
+        tuple: (páginas del proceso, direcciones).
+    """
+    if scenario == "all-hit":
+        return frames, generate_addresses(RANDOM_PATTERN, accesses, frames, page_size, seed)
+    if scenario == "all-fault":
+        return frames + 1, generate_addresses(SEQUENTIAL_PATTERN, accesses, frames + 1, page_size, seed)
+    pages = frames * FOOTPRINT_FACTOR
+    pattern = {"sequential": SEQUENTIAL_PATTERN, "random": RANDOM_PATTERN, "zipf": ZIPF_PATTERN}[scenario]
+    return pages, generate_addresses(pattern, accesses, pages, page_size, seed)
+
+
+def prepare(scenario, frames, algorithm, accesses, page_size, seed):
+    """
+    Crea el simulador y la carga de un caso, dejando la memoria en estado estable: se tocan
+    primero todas las páginas del proceso, fuera de la medición.
+    Returns:
+        tuple: (simulador, direcciones).
+    """
+    pages, addresses = scenario_addresses(scenario, frames, accesses, page_size, seed)
+    simulator = MemorySimulator(MachineConfig(page_size=page_size, physical_pages=frames,
+                                              virtual_pages=max(pages, 1)))
+    simulator.set_replacement_algorithm(algorithm)
+    simulator.create_process(PID, pages * page_size // 1024)
+    simulator.current_process = PID
+    warmup = range(pages - frames, pages) if scenario == "all-hit" else range(pages)
+    for page in warmup:
+        simulator.translate_virtual_to_physical(page * page_size)
+    return simulator, addresses
+
+
+def drive(simulator, addresses, api):
+    """
+    Alimenta el simulador con las direcciones por la API indicada.
+    """
+    if api == "batch":
+        simulator.access_batch(PID, addresses)
+    else:
+        translate = simulator.translate_virtual_to_physical
+        for address in addresses:
+            translate(address)
+
+
+def time_case(scenario, frames, algorithm, api, accesses, page_size=4096, seed=1):
+    """
+    Cronometra una ejecución de un caso sobre un simulador nuevo.
+    Returns:
+        tuple: (segundos, fallos durante la medición).
+    """
+    simulator, addresses = prepare(scenario, frames, algorithm, accesses, page_size, seed)
+    faults_before = simulator.page_faults
+    gc.collect()
+    start = time.perf_counter()
+    drive(simulator, addresses, api)
+    elapsed = time.perf_counter() - start
+    return elapsed, simulator.page_faults - faults_before
+
+
+def peak_memory(scenario, frames, algorithm, api, accesses, page_size=4096, seed=1):
+    """
+    Mide el pico de memoria asignada durante una ejecución con tracemalloc. No se cronometra
+    porque tracemalloc la hace varias veces más lenta.
+    Returns:
+        float: Pico en KB.
+    """
+    tracemalloc.start()
+    try:
+        simulator, addresses = prepare(scenario, frames, algorithm, accesses, page_size, seed)
+        tracemalloc.reset_peak()
+        drive(simulator, addresses, api)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def summarize(accesses, timings, faults, peak_kb=None):
+    """
+    Resume las ejecuciones de un caso: el throughput es el de la mejor, y la dispersión es
+    cuánto más lenta que la mejor fue la mediana (0 con una sola), que compare() usa para no
+    tomar ruido por regresión.
+    Args:
+        accesses (int): Accesos por ejecución.
+        timings (list): Segundos de cada ejecución.
+        faults (int): Fallos por ejecución (las cargas son sembradas: son siempre los mismos).
+        peak_kb (float, opcional): Pico de memoria.
+    Returns:
+        dict: accesses_per_second, faults_per_second, faults, repeat, spread y peak_kb.
+    """
+    elapsed = min(timings)
+    return {
+        'accesses_per_second': accesses / elapsed if elapsed > 0 else 0.0,
+        'faults_per_second': faults / elapsed if elapsed > 0 else 0.0,
+        'faults': faults,
+        'repeat': len(timings),
+        'spread': (statistics.median(timings) - elapsed) / elapsed if elapsed > 0 else 0.0,
+        'peak_kb': peak_kb,
+    }
+
+
+def case_id(scenario, frames, algorithm, api):
+    return f"{scenario}/{frames}/{algorithm}/{api}"
+
+
+def run_suite(scenarios, sizes, algorithms, apis, accesses, seed=1, repeat=3, measure_memory=True, log=None):
+    """
+    Ejecuta todos los casos de la combinación de escenarios, tamaños, algoritmos y APIs. Las
+    repeticiones se hacen por rondas (cada ronda ejecuta una vez todos los casos), de modo
+    que las muestras de un caso quedan repartidas a lo largo de toda la ejecución y su
+    dispersión incluye la deriva de velocidad de la máquina, no solo el ruido inmediato.
+    Returns:
+        dict: Metadatos de la máquina y resultados por identificador de caso.
+    """
+    cases = [(scenario, frames, algorithm, api) for scenario in scenarios for frames in sizes
+             for algorithm in algorithms for api in apis]
+    timings = {case: [] for case in cases}
+    faults = {}
+    for _ in range(repeat):
+        for case in cases:
+            elapsed, faults[case] = time_case(*case, accesses, seed=seed)
+            timings[case].append(elapsed)
+    results = {}
+    for case in cases:
+        key = case_id(*case)
+        peak_kb = peak_memory(*case, accesses, seed=seed) if measure_memory else None
+        results[key] = summarize(accesses, timings[case], faults[case], peak_kb)
+        if log:
+            log(key, results[key])
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'accesses': accesses,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=0.10, noise_factor=NOISE_FACTOR):
+    """
+    Compara una ejecución con la línea base. Un caso es regresión si su pico de memoria crece
+    más de threshold o si su throughput cae más que el mayor entre threshold y noise_factor
+    veces la dispersión entre repeticiones del caso (la mayor de las dos ejecuciones).
+    Returns:
+        list: (caso, métrica, base, actual, cambio relativo, umbral, es regresión) por métrica
+        comparada.
+    """
+    rows = []
+    for key, result in current['results'].items():
+        reference = baseline['results'].get(key)
+        if reference is None:
+            continue
+        noise = noise_factor * max(result.get('spread', 0.0), reference.get('spread', 0.0))
+        for metric, higher_is_better in (('accesses_per_second', True), ('peak_kb', False)):
+            old, new = reference.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if higher_is_better:
+                limit = max(threshold, noise)
+                regression = change < -limit
+            else:
+                limit = threshold
+                regression = change > limit
+            rows.append((key, metric, old, new, change, limit, regression))
+    return rows
+
+
+def compare_apis(current, noise_factor=NOISE_FACTOR):
+    """
+    Compara, dentro de una misma ejecución, la API por lotes con la escalar en cada caso
+    medido con ambas. El lote es más lento si su throughput queda por debajo del escalar más
+    que noise_factor veces la dispersión del caso (la mayor de las dos APIs).
+    Returns:
+        list: (caso, escalar, lote, cambio relativo, umbral, es más lento) por caso.
+    """
+    rows = []
+    for key, batch in current['results'].items():
+        if not key.endswith("/batch"):
+            continue
+        scalar = current['results'].get(key[:-len("batch")] + "scalar")
+        if scalar is None or not scalar['accesses_per_second']:
+            continue
+        old, new = scalar['accesses_per_second'], batch['accesses_per_second']
+        change = (new - old) / old
+        limit = noise_factor * max(scalar.get('spread', 0.0), batch.get('spread', 0.0))
+        rows.append((key[:-len("/batch")], old, new, change, limit, change < -limit))
+    return rows
+
+
+def format_result(key, result):
+    peak = "-" if result['peak_kb'] is None else f"{result['peak_kb']:.0f} KB"
+    return (f"{key:40} {result['accesses_per_second']:>12,.0f} acc/s {result['faults_per_second']:>12,.0f} "
+            f"fallos/s {peak:>12}")
+
+
+def main(argv=None):
+    """
+    Punto de entrada del benchmark de los caminos críticos (acierto, fallo, reemplazo).
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    Returns:
+        int: 1 si --compare encontró regresiones o --check-batch un caso donde el lote es
+        más lento que el acceso escalar, 0 en otro caso.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de traducción y atención de fallos del simulador MMU.")
+    parser.add_argument("--scenarios", nargs="+", choices=BENCHMARK_SCENARIOS, default=list(BENCHMARK_SCENARIOS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[64, 4096, 65536], help="Marcos físicos")
+    parser.add_argument("--algorithms", nargs="+", default=["FIFO", "LRU"], help="Algoritmos de reemplazo")
+    parser.add_argument("--apis", nargs="+", choices=BENCHMARK_APIS, default=list(BENCHMARK_APIS))
+    parser.add_argument("--accesses", type=int, default=50000, help="Accesos por caso")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help=f"Repeticiones por caso (se toma la mejor); al menos {MIN_GATE_REPEATS} "
+                             "con --save o --compare")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="No medir el pico de memoria")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, default=None,
+                        help="Guardar los resultados como línea base")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, default=None,
+                        help="Comparar con una línea base guardada")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Cambio relativo mínimo que se considera regresión (el de throughput se "
+                             "agranda con la dispersión del caso)")
+    parser.add_argument("--check-batch", action="store_true",
+                        help="Fallar si en algún caso la API por lotes es más lenta que la escalar")
+    args = parser.parse_args(argv)
+    if args.check_batch and set(args.apis) != set(BENCHMARK_APIS):
+        parser.error("--check-batch necesita medir ambas APIs")
+    if (args.save or args.compare) and args.repeat < MIN_GATE_REPEATS:
+        print(f"Se usan {MIN_GATE_REPEATS} repeticiones en vez de {args.repeat} para la línea base.",
+              file=sys.stderr)
+        args.repeat = MIN_GATE_REPEATS
+
+    current = run_suite(args.scenarios, args.sizes, args.algorithms, args.apis, args.accesses, args.seed,
+                        args.repeat, not args.no_memory,
+                        log=lambda key, result: print(format_result(key, result), flush=True))
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        print(f"Línea base guardada en {args.save}")
+    failed = False
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        rows = compare(current, baseline, args.threshold)
+        regressions = [row for row in rows if row[6]]
+        print(f"\nComparación con {args.compare} (umbral mínimo {args.threshold:.0%}):")
+        for key, metric, old, new, change, limit, regression in rows:
+            mark = "REGRESIÓN" if regression else ""
+            print(f"{key:40} {metric:20} {old:>14,.1f} -> {new:>14,.1f} {change:+8.1%} "
+                  f"(±{limit:.0%}) {mark}")
+        print(f"{len(regressions)} regresiones de {len(rows)} métricas comparadas.")
+        failed = failed or bool(regressions)
+    if args.check_batch:
+        rows = compare_apis(current)
+        slower = [row for row in rows if row[5]]
+        print("\nLote frente a escalar:")
+        for key, old, new, change, limit, is_slower in rows:
+            mark = "MÁS LENTO" if is_slower else ""
+            print(f"{key:40} {old:>14,.1f} -> {new:>14,.1f} {change:+8.1%} (±{limit:.0%}) {mark}")
+        print(f"{len(slower)} casos de {len(rows)} con el lote más lento que el acceso escalar.")
+        failed = failed or bool(slower)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
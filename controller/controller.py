@@ -1,15 +1,38 @@
 import random
 import time
 from model.memory import MemorySimulator, ReplacementAlgorithm, PageStatus
+from model.config import MachineConfig
+from model.trace import TraceReader, replay_trace
+from model.stack_distance import analyze_trace
+from model.policies import available_policies
+from model.workload import generate_addresses, generate_writes
 
-__all__ = ["Controller", "ReplacementAlgorithm", "PageStatus"]
+__all__ = ["Controller", "ReplacementAlgorithm", "PageStatus", "MachineConfig"]
 
 class Controller:
-    def __init__(self):
+    def __init__(self, config=None):
         """
         Inicializa el controlador y la instancia del simulador de memoria.
+        Args:
+            config (MachineConfig, opcional): Geometría de la máquina simulada.
+        """
+        self.simulator = MemorySimulator(config)
+
+    def get_config(self):
+        """
+        Obtiene la configuración de la máquina simulada.
+        Returns:
+            MachineConfig: Configuración vigente.
         """
-        self.simulator = MemorySimulator()
+        return self.simulator.config
+
+    def apply_config(self, config):
+        """
+        Cambia la geometría de la máquina; reinicia el sistema.
+        Args:
+            config (MachineConfig): Nueva configuración.
+        """
+        self.simulator.apply_config(config)
 
     def create_process(self, pid, size_kb):
         """
@@ -35,23 +58,16 @@ class Controller:
         """
         Cambia el algoritmo de reemplazo de páginas.
         Args:
-            algorithm (str): "FIFO" o "LRU".
+            algorithm (str): Nombre de una política registrada ("FIFO", "LRU", "LFU", "Clock", ...).
         """
-        if algorithm == "FIFO":
-            self.simulator.replacement_algorithm = ReplacementAlgorithm.FIFO
-            self.simulator.fifo_queue.clear()
-            for i, frame_content in enumerate(self.simulator.physical_memory):
-                if frame_content is not None:
-                    pid, page_num = frame_content
-                    key = (pid, page_num)
-                    if key not in self.simulator.fifo_queue:
-                        self.simulator.fifo_queue.append(key)
-        elif algorithm == "LRU":
-            self.simulator.replacement_algorithm = ReplacementAlgorithm.LRU
+        if algorithm in available_policies():
+            self.simulator.set_replacement_algorithm(algorithm)
 
-    def random_access(self):
+    def random_access(self, write=False):
         """
         Realiza un acceso aleatorio a una dirección virtual del proceso activo.
+        Args:
+            write (bool): El acceso es una escritura.
         Returns:
             int or None: Dirección virtual accedida, o None si no hay proceso activo.
         """
@@ -68,50 +84,121 @@ class Controller:
             max_address = process_data['pages_needed'] * self.simulator.page_size - 1
             random_address = random.randint(0, max_address)
         
-        self.simulate_memory_access(random_address)
+        self.simulate_memory_access(random_address, write)
         return random_address
 
-    def simulate_memory_access(self, address):
+    def simulate_memory_access(self, address, write=False):
         """
-        Simula el acceso a una dirección virtual, gestionando page faults y posibles escrituras.
+        Simula el acceso a una dirección virtual, gestionando page faults. Una escritura deja
+        la página modificada, de modo que al desalojarla hay que escribirla en swap.
         Args:
             address (int): Dirección virtual a acceder.
+            write (bool): El acceso es una escritura.
+        Returns:
+            int or None: Dirección física, o None si el acceso falló.
         """
         if not self.simulator.current_process:
-            return
+            return None
+        return self.simulator.translate_virtual_to_physical(address, write)
 
-        physical_address = self.simulator.translate_virtual_to_physical(address)
-        if physical_address is not None:
-            if random.random() < 0.3:
-                page_num = address // self.simulator.page_size
-                current_pid = self.simulator.current_process
-                if current_pid in self.simulator.processes:
-                    process_page_table = self.simulator.processes[current_pid]['page_table']
-                    if page_num in process_page_table:
-                        process_page_table[page_num]['modified'] = True
+    def access_batch(self, pid, addresses, writes=None):
+        """
+        Procesa un lote de direcciones virtuales de un proceso.
+        Args:
+            pid (str): Identificador del proceso.
+            addresses (numpy.ndarray | array.array | list): Direcciones virtuales.
+            writes (secuencia de bool, opcional): Marca de escritura por acceso.
+        Returns:
+            tuple: (direcciones físicas, máscara de aciertos).
+        """
+        return self.simulator.access_batch(pid, addresses, writes)
 
-    def intensive_load(self, update_callback=None):
+    def replay_trace(self, path, trace_format="lackey", default_pid="1", process_size_kb=None):
         """
-        Realiza múltiples accesos aleatorios para simular carga intensiva.
+        Reproduce un archivo de traza sobre el simulador.
         Args:
-            update_callback (callable, optional): Función para actualizar la interfaz.
+            path (str): Ruta del archivo de traza.
+            trace_format (str): "lackey", "raw" o "tagged".
+            default_pid (str): PID para registros que no indican proceso.
+            process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        Returns:
+            dict: Resultado de la reproducción con throughput y estadísticas.
         """
-        if not self.simulator.current_process:
-            return
+        reader = TraceReader(path, trace_format, default_pid)
+        return replay_trace(self.simulator, reader, process_size_kb)
 
-        num_accesses = 50
-        for i in range(num_accesses):
-            process_data = self.simulator.processes.get(self.simulator.current_process)
-            if not process_data or process_data['pages_needed'] == 0:
-                continue
+    def run_workload(self, pattern, accesses, seed=None, chunk_size=4096, write_ratio=0.0):
+        """
+        Ejecuta una carga sintética repartida por turnos entre todos los procesos, en bloques
+        de chunk_size accesos procesados con access_batch.
+        Args:
+            pattern (str): "random" o "sequential".
+            accesses (int): Accesos totales.
+            seed (int, opcional): Semilla para reproducir la carga.
+            chunk_size (int): Accesos por bloque y por turno.
+            write_ratio (float): Fracción de accesos que son escrituras.
+        Returns:
+            dict: Accesos procesados, tiempo transcurrido, accesos por segundo y estadísticas.
+        """
+        rng = random.Random(seed)
+        pids = [pid for pid, data in self.simulator.processes.items() if data['pages_needed'] > 0]
+        page_size = self.simulator.page_size
+        done = 0
+        positions = dict.fromkeys(pids, 0)
+        start = time.perf_counter()
+        while pids and done < accesses:
+            for pid in pids:
+                count = min(chunk_size, accesses - done)
+                if count <= 0:
+                    break
+                pages = self.simulator.processes[pid]['pages_needed']
+                addresses = generate_addresses(pattern, count, pages, page_size,
+                                               rng.getrandbits(64), positions[pid])
+                positions[pid] += count
+                writes = generate_writes(count, write_ratio, rng.getrandbits(64)) if write_ratio else None
+                self.simulator.access_batch(pid, addresses, writes)
+                done += count
+        elapsed = time.perf_counter() - start
+        return {
+            'accesses': done,
+            'elapsed_seconds': elapsed,
+            'accesses_per_second': done / elapsed if elapsed > 0 else 0.0,
+            'statistics': self.simulator.get_statistics()
+        }
 
-            max_address = process_data['pages_needed'] * self.simulator.page_size - 1
-            random_address = random.randint(0, max_address)
-            self.simulate_memory_access(random_address)
+    def miss_ratio_curve(self, path, trace_format="lackey", max_frames=None):
+        """
+        Calcula en una sola pasada la curva de tasa de fallos de LRU de una traza para todos
+        los tamaños de memoria, sin modificar el estado del simulador.
+        Args:
+            path (str): Ruta del archivo de traza.
+            trace_format (str): "lackey", "raw" o "tagged".
+            max_frames (int, opcional): Mayor cantidad de marcos de la curva.
+        Returns:
+            tuple: (curva de tasa de fallos indexada por marcos, accesos analizados).
+        """
+        scratch = MemorySimulator(self.simulator.config)
+        scratch.virtual_address_bits = self.simulator.virtual_address_bits
+        scratch.configure_page_table(**self.simulator.page_table_config)
+        analyzer, curve = analyze_trace(TraceReader(path, trace_format), scratch, max_frames)
+        return curve, analyzer.accesses
 
-            time.sleep(0.05)
-            if update_callback:
-                update_callback()
+    def random_accesses(self, count, write_ratio=0.0):
+        """
+        Realiza varios accesos aleatorios seguidos sobre el proceso activo.
+        Args:
+            count (int): Número de accesos.
+            write_ratio (float): Fracción de accesos que son escrituras.
+        Returns:
+            int: Accesos realizados (0 si no hay proceso activo con páginas).
+        """
+        process_data = self.simulator.processes.get(self.simulator.current_process)
+        if not process_data or process_data['pages_needed'] == 0:
+            return 0
+        max_address = process_data['pages_needed'] * self.simulator.page_size - 1
+        for _ in range(count):
+            self.simulate_memory_access(random.randint(0, max_address), random.random() < write_ratio)
+        return count
 
     def reset_system(self):
         """
@@ -119,6 +206,44 @@ class Controller:
         """
         self.simulator.reset_system()
 
+    def configure_tlb(self, entries=16, associativity=4, replacement="LRU", asid_tagging=True):
+        """
+        Configura el TLB del simulador.
+        Args:
+            entries (int): Número de entradas; 0 lo desactiva.
+            associativity (int): Vías por conjunto.
+            replacement (str): "LRU", "FIFO" o "Random".
+            asid_tagging (bool): Etiquetar por PID en vez de vaciar al cambiar de proceso.
+        """
+        self.simulator.configure_tlb(entries, associativity, replacement, asid_tagging)
+
+    def configure_page_table(self, organization="flat", bits_per_level=(9, 9, 9, 9)):
+        """
+        Elige la organización de las tablas de páginas de los procesos nuevos.
+        Args:
+            organization (str): "flat", "radix" o "inverted".
+            bits_per_level (tuple): Bits de índice de cada nivel de la tabla multinivel.
+        """
+        self.simulator.configure_page_table(organization, bits_per_level)
+
+    def configure_prefetch(self, enabled=False, initial_window=4, max_window=64):
+        """
+        Configura la lectura anticipada del simulador.
+        Args:
+            enabled (bool): Activarla.
+            initial_window (int): Ventana inicial en páginas.
+            max_window (int): Ventana máxima en páginas.
+        """
+        self.simulator.configure_prefetch(enabled, initial_window, max_window)
+
+    def get_page_table_memory(self):
+        """
+        Obtiene la memoria de la tabla de páginas de cada proceso.
+        Returns:
+            dict: {pid: bytes}.
+        """
+        return self.simulator.get_page_table_memory()
+
     def get_statistics(self):
         """
         Obtiene las estadísticas actuales del simulador.
@@ -127,6 +252,47 @@ class Controller:
         """
         return self.simulator.get_statistics()
 
+    def subscribe(self, callback, event_types=None):
+        """
+        Suscribe un observador a los eventos del simulador (por lotes agrupados).
+        Args:
+            callback (callable): Recibe una lista de MemoryEvent por lote.
+            event_types (iterable, opcional): Tipos que le interesan; por defecto todos.
+        """
+        self.simulator.subscribe(callback, event_types)
+
+    def unsubscribe(self, callback):
+        """
+        Quita un observador.
+        Args:
+            callback (callable): El mismo objeto pasado a subscribe.
+        """
+        self.simulator.unsubscribe(callback)
+
+    def flush_events(self):
+        """
+        Entrega a los observadores los eventos pendientes.
+        Returns:
+            int: Eventos entregados.
+        """
+        return self.simulator.flush_events()
+
+    def enable_profiling(self, enabled=True):
+        """
+        Activa o desactiva la instrumentación por fases del simulador.
+        Args:
+            enabled (bool): True para activarla.
+        """
+        self.simulator.enable_profiling(enabled)
+
+    def get_profile(self):
+        """
+        Obtiene las llamadas y tiempos acumulados por fase.
+        Returns:
+            dict: {fase: {'calls', 'total_ns', 'mean_ns'}}, vacío si está desactivada.
+        """
+        return self.simulator.get_profile()
+
     def detect_thrashing(self):
         """
         Detecta si hay hiperpaginación en el sistema.
@@ -189,7 +355,7 @@ class Controller:
         """
         Obtiene el espacio de intercambio (swap).
         Returns:
-            dict: Páginas en swap.
+            SwapDevice: Dispositivo de swap; se recorre como claves (pid, página).
         """
         return self.simulator.swap_space
 
@@ -199,7 +365,7 @@ class Controller:
         Args:
             pid (str): Identificador del proceso.
         Returns:
-            dict: Tabla de páginas del proceso.
+            PageTable: Tabla de páginas del proceso (se consulta como dict {página: entrada}).
         """
         process = self.simulator.processes.get(pid)
         if process:
@@ -213,6 +379,14 @@ class Controller:
             ReplacementAlgorithm: Algoritmo de reemplazo.
         """
         return self.simulator.replacement_algorithm
+
+    def get_available_algorithms(self):
+        """
+        Obtiene los nombres de las políticas de reemplazo registradas.
+        Returns:
+            list: Nombres de las políticas.
+        """
+        return available_policies()
         
     def get_physical_pages(self): 
         """
@@ -1,14 +1,27 @@
-from view.gui import MMUSimulatorGUI
-import tkinter as tk
+import sys
 
-def main():
+def main(argv=None):
     """
     Punto de entrada principal de la aplicación.
-    Inicializa la ventana raíz de Tkinter, crea la interfaz gráfica del simulador MMU y ejecuta el bucle principal de la GUI.
+    Sin argumentos inicializa la ventana raíz de Tkinter, crea la interfaz gráfica del simulador MMU
+    y ejecuta el bucle principal de la GUI. Con argumentos (o --headless) ejecuta el simulador sin
+    interfaz gráfica (ver view/cli.py); tkinter solo se importa en el camino de la GUI.
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    Returns:
+        int: Código de salida.
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from view.cli import main as cli_main
+        return cli_main([arg for arg in argv if arg != "--headless"])
+
+    import tkinter as tk
+    from view.gui import MMUSimulatorGUI
     root = tk.Tk()
     app = MMUSimulatorGUI(root)
     root.mainloop()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
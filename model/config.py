@@ -0,0 +1,104 @@
+import json
+
+
+class MachineConfig:
+    """
+    Geometría de la máquina simulada: tamaño de página, marcos físicos, páginas virtuales
+    por proceso (tope de las tablas planas) y capacidad de swap en páginas (None = ilimitada).
+    Se construye con argumentos, desde un diccionario o desde un archivo JSON, y siempre
+    se valida al crearse.
+    """
+    FIELDS = ('page_size', 'physical_pages', 'virtual_pages', 'swap_pages')
+
+    def __init__(self, page_size=4096, physical_pages=10, virtual_pages=64, swap_pages=None):
+        """
+        Args:
+            page_size (int): Tamaño de página en bytes (potencia de dos).
+            physical_pages (int): Número de marcos físicos.
+            virtual_pages (int): Máximo de páginas de un proceso con tabla plana.
+            swap_pages (int, opcional): Páginas que caben en swap; None para no limitar.
+        """
+        self.page_size = page_size
+        self.physical_pages = physical_pages
+        self.virtual_pages = virtual_pages
+        self.swap_pages = swap_pages
+        self.validate()
+
+    def validate(self):
+        """
+        Comprueba que los valores sean coherentes.
+        Raises:
+            ValueError: Si algún valor no es válido.
+        """
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if name == 'swap_pages' and value is None:
+                continue
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ValueError(f"'{name}' debe ser un entero, se recibió {value!r}.")
+        if self.page_size < 1 or self.page_size & (self.page_size - 1):
+            raise ValueError(f"El tamaño de página debe ser una potencia de dos, se recibió {self.page_size}.")
+        if self.physical_pages < 1:
+            raise ValueError("Debe haber al menos un marco físico.")
+        if self.virtual_pages < 1:
+            raise ValueError("Debe haber al menos una página virtual por proceso.")
+        if self.swap_pages is not None and self.swap_pages < 0:
+            raise ValueError("La capacidad de swap no puede ser negativa.")
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Crea una configuración desde un diccionario; las claves ausentes toman su valor por defecto.
+        Args:
+            data (dict): Valores por nombre de campo.
+        Returns:
+            MachineConfig: Configuración validada.
+        Raises:
+            ValueError: Si hay claves desconocidas o valores inválidos.
+        """
+        unknown = set(data) - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"Claves de configuración desconocidas: {', '.join(sorted(unknown))}")
+        return cls(**data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Lee una configuración de un archivo JSON.
+        Args:
+            path (str): Ruta del archivo.
+        Returns:
+            MachineConfig: Configuración validada.
+        """
+        with open(path, encoding='utf-8') as config_file:
+            data = json.load(config_file)
+        if not isinstance(data, dict):
+            raise ValueError("El archivo de configuración debe contener un objeto JSON.")
+        return cls.from_dict(data)
+
+    def to_dict(self):
+        """
+        Obtiene la configuración como diccionario.
+        Returns:
+            dict: Valores por nombre de campo.
+        """
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def save(self, path):
+        """
+        Guarda la configuración en un archivo JSON.
+        Args:
+            path (str): Ruta del archivo.
+        """
+        with open(path, 'w', encoding='utf-8') as config_file:
+            json.dump(self.to_dict(), config_file, indent=2)
+
+    def replace(self, **changes):
+        """
+        Crea una copia con algunos valores cambiados.
+        Args:
+            **changes: Valores nuevos por nombre de campo.
+        Returns:
+            MachineConfig: Nueva configuración validada.
+        """
+        return self.from_dict({**self.to_dict(), **changes})
@@ -0,0 +1,147 @@
+import json
+
+PAGE_HIT = "page_hit"
+PAGE_FAULT = "page_fault"
+FRAME_LOADED = "frame_loaded"
+PAGE_EVICTED = "page_evicted"
+SWAP_IN = "swap_in"
+SWAP_OUT = "swap_out"
+# Página limpia con copia válida en swap que se desaloja sin escribirla (clean_evictions).
+PAGE_DROPPED = "page_dropped"
+PROCESS_CREATED = "process_created"
+SYSTEM_RESET = "system_reset"
+EVENT_TYPES = (PAGE_HIT, PAGE_FAULT, FRAME_LOADED, PAGE_EVICTED, SWAP_IN, SWAP_OUT, PAGE_DROPPED,
+               PROCESS_CREATED, SYSTEM_RESET)
+
+
+class MemoryEvent:
+    """
+    Cambio del estado del simulador. Tras la agrupación, count indica cuántas veces ocurrió
+    en el lote y frame es el marco de la última ocurrencia.
+    """
+    __slots__ = ('type', 'pid', 'page', 'frame', 'count')
+
+    def __init__(self, event_type, pid=None, page=None, frame=None, count=1):
+        self.type = event_type
+        self.pid = pid
+        self.page = page
+        self.frame = frame
+        self.count = count
+
+    def to_dict(self):
+        """
+        Obtiene el evento como diccionario (para exportarlo).
+        Returns:
+            dict: Campos del evento.
+        """
+        return {'type': self.type, 'pid': self.pid, 'page': self.page, 'frame': self.frame, 'count': self.count}
+
+    def __repr__(self):
+        return f"MemoryEvent({self.type}, pid={self.pid!r}, page={self.page}, frame={self.frame}, count={self.count})"
+
+
+class EventBus:
+    """
+    Distribuye eventos del simulador a suscriptores por lotes. Los eventos pendientes se
+    agrupan por clave: (tipo, pid, página) para los de página y (tipo, marco) para
+    frame_loaded, de modo que una ráfaga de accesos sobre las mismas páginas queda en un
+    evento por página con su cuenta. Cada evento agrupado ocupa la posición de su última
+    ocurrencia (salvo page_hit, que solo suma), así que aplicar el lote en orden deja el
+    estado final correcto.
+    Los suscriptores reciben una lista por lote: cuando alguien llama a flush() o cuando
+    hay max_pending claves pendientes. Así el número de notificaciones depende de cuántas
+    páginas y marcos cambiaron, no de cuántos accesos hubo.
+    """
+
+    def __init__(self, max_pending=4096):
+        """
+        Args:
+            max_pending (int): Claves pendientes que fuerzan la entrega de un lote.
+        """
+        self.max_pending = max_pending
+        self.subscribers = []
+        self.pending = {}
+
+    def subscribe(self, callback, event_types=None):
+        """
+        Registra un suscriptor.
+        Args:
+            callback (callable): Recibe una lista de MemoryEvent por lote.
+            event_types (iterable, opcional): Tipos que le interesan; por defecto todos.
+        """
+        self.subscribers.append((callback, None if event_types is None else frozenset(event_types)))
+
+    def unsubscribe(self, callback):
+        """
+        Quita un suscriptor.
+        Args:
+            callback (callable): El mismo objeto pasado a subscribe.
+        """
+        self.subscribers = [(registered, types) for registered, types in self.subscribers if registered != callback]
+
+    def emit(self, event_type, pid=None, page=None, frame=None):
+        """
+        Agrega un evento al lote pendiente.
+        Args:
+            event_type (str): Uno de EVENT_TYPES.
+            pid (str, opcional): Proceso.
+            page (int, opcional): Página virtual.
+            frame (int, opcional): Marco físico.
+        """
+        self.emit_count(event_type, pid, page, frame, 1)
+
+    def emit_count(self, event_type, pid, page, frame, count):
+        """
+        Agrega count ocurrencias de un evento al lote pendiente (para rachas de aciertos).
+        """
+        key = (event_type, frame) if event_type == FRAME_LOADED else (event_type, pid, page)
+        pending = self.pending
+        event = pending.get(key)
+        if event is None:
+            pending[key] = MemoryEvent(event_type, pid, page, frame, count)
+            if len(pending) >= self.max_pending:
+                self.flush()
+            return
+        event.count += count
+        event.frame = frame
+        if event_type != PAGE_HIT:
+            event.pid = pid
+            event.page = page
+            del pending[key]
+            pending[key] = event
+
+    def flush(self):
+        """
+        Entrega el lote pendiente a los suscriptores.
+        Returns:
+            int: Eventos entregados.
+        """
+        if not self.pending:
+            return 0
+        events = list(self.pending.values())
+        self.pending = {}
+        for callback, types in self.subscribers:
+            selected = events if types is None else [event for event in events if event.type in types]
+            if selected:
+                callback(selected)
+        return len(events)
+
+
+class EventLogger:
+    """
+    Exportador de eventos: escribe cada evento de cada lote como una línea JSON.
+    """
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Archivo de texto abierto para escritura.
+        """
+        self.stream = stream
+        self.batches = 0
+
+    def __call__(self, events):
+        self.batches += 1
+        write = self.stream.write
+        for event in events:
+            write(json.dumps(event.to_dict()) + "\n")
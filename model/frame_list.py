@@ -0,0 +1,219 @@
+from collections import OrderedDict
+from array import array
+
+NIL = -1
+
+
+class FrameList:
+    """
+    Lista doblemente enlazada intrusiva indexada por número de marco. Los enlaces viven en
+    dos arreglos int32, de modo que insertar al final, quitar un marco arbitrario, mover un
+    marco al final y extraer el primero son operaciones O(1) sin búsquedas.
+    """
+    __slots__ = ('next', 'prev', 'head', 'tail', 'size', 'linked')
+
+    def __init__(self, capacity):
+        """
+        Crea una lista vacía para marcos en [0, capacity).
+        Args:
+            capacity (int): Número de marcos físicos.
+        """
+        self.next = array('i', [NIL]) * capacity
+        self.prev = array('i', [NIL]) * capacity
+        self.linked = bytearray(capacity)
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __bool__(self):
+        return self.size > 0
+
+    def __contains__(self, frame):
+        return 0 <= frame < len(self.linked) and self.linked[frame] == 1
+
+    def __iter__(self):
+        frame = self.head
+        while frame != NIL:
+            yield frame
+            frame = self.next[frame]
+
+    def append(self, frame):
+        """
+        Inserta un marco al final de la lista.
+        Args:
+            frame (int): Número de marco (no debe estar en la lista).
+        """
+        self.prev[frame] = self.tail
+        self.next[frame] = NIL
+        if self.tail == NIL:
+            self.head = frame
+        else:
+            self.next[self.tail] = frame
+        self.tail = frame
+        self.linked[frame] = 1
+        self.size += 1
+
+    def remove(self, frame):
+        """
+        Quita un marco de cualquier posición de la lista.
+        Args:
+            frame (int): Número de marco (debe estar en la lista).
+        """
+        prev_frame = self.prev[frame]
+        next_frame = self.next[frame]
+        if prev_frame == NIL:
+            self.head = next_frame
+        else:
+            self.next[prev_frame] = next_frame
+        if next_frame == NIL:
+            self.tail = prev_frame
+        else:
+            self.prev[next_frame] = prev_frame
+        self.next[frame] = NIL
+        self.prev[frame] = NIL
+        self.linked[frame] = 0
+        self.size -= 1
+
+    def discard(self, frame):
+        """
+        Quita un marco de la lista si está en ella.
+        Args:
+            frame (int): Número de marco.
+        """
+        if self.linked[frame]:
+            self.remove(frame)
+
+    def move_to_end(self, frame):
+        """
+        Mueve un marco de la lista al final.
+        Args:
+            frame (int): Número de marco (debe estar en la lista).
+        """
+        if frame != self.tail:
+            self.remove(frame)
+            self.append(frame)
+
+    def popleft(self):
+        """
+        Extrae el primer marco de la lista.
+        Returns:
+            int or None: Número de marco o None si la lista está vacía.
+        """
+        frame = self.head
+        if frame == NIL:
+            return None
+        self.remove(frame)
+        return frame
+
+    def clear(self):
+        """
+        Vacía la lista.
+        """
+        capacity = len(self.linked)
+        self.next = array('i', [NIL]) * capacity
+        self.prev = array('i', [NIL]) * capacity
+        self.linked = bytearray(capacity)
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+
+class FrequencyBuckets:
+    """
+    Estructura LFU de costo O(1): cada frecuencia tiene un cubo ordenado de marcos (del
+    menos al más reciente) y se mantiene la frecuencia mínima exacta. Una carga la vuelve a 1
+    y un acierto que vacía su cubo la sube hasta el cubo siguiente, a lo sumo hasta el del
+    marco movido. Solo quitar el último marco del cubo mínimo fuera de un reemplazo (sin una
+    carga detrás) la deja desconocida; la siguiente elección de víctima la recalcula
+    recorriendo los cubos. La víctima es el marco más antiguo del cubo de menor frecuencia.
+    """
+    __slots__ = ('frequency', 'buckets', 'min_frequency')
+
+    def __init__(self):
+        """
+        Crea la estructura vacía.
+        """
+        self.frequency = {}
+        self.buckets = {}
+        self.min_frequency = 0
+
+    def __len__(self):
+        return len(self.frequency)
+
+    def __contains__(self, frame):
+        return frame in self.frequency
+
+    def add(self, frame, frequency=1):
+        """
+        Registra un marco recién cargado.
+        Args:
+            frame (int): Número de marco.
+            frequency (int): Frecuencia inicial.
+        """
+        self.frequency[frame] = frequency
+        self.buckets.setdefault(frequency, OrderedDict())[frame] = None
+        # Ninguna frecuencia es menor que 1, así que una carga común deja el mínimo exacto.
+        if len(self.frequency) == 1 or frequency == 1 or (self.min_frequency is not None
+                                                          and frequency < self.min_frequency):
+            self.min_frequency = frequency
+
+    def increment(self, frame, amount=1):
+        """
+        Suma accesos a un marco y lo mueve al final del cubo de su nueva frecuencia.
+        Args:
+            frame (int): Número de marco.
+            amount (int): Accesos a sumar.
+        """
+        frequency = self.frequency[frame]
+        bucket = self.buckets[frequency]
+        del bucket[frame]
+        new_frequency = frequency + amount
+        self.frequency[frame] = new_frequency
+        self.buckets.setdefault(new_frequency, OrderedDict())[frame] = None
+        if not bucket:
+            del self.buckets[frequency]
+            if frequency == self.min_frequency:
+                # El cubo de new_frequency existe: la búsqueda da a lo sumo amount pasos.
+                minimum = frequency + 1
+                while minimum not in self.buckets:
+                    minimum += 1
+                self.min_frequency = minimum
+
+    def discard(self, frame):
+        """
+        Quita un marco de la estructura si está en ella.
+        Args:
+            frame (int): Número de marco.
+        """
+        frequency = self.frequency.pop(frame, None)
+        if frequency is None:
+            return
+        bucket = self.buckets[frequency]
+        del bucket[frame]
+        if not bucket:
+            del self.buckets[frequency]
+            if frequency == self.min_frequency:
+                self.min_frequency = None
+
+    def peek_victim(self):
+        """
+        Obtiene el marco menos frecuente (y, entre ellos, el menos reciente).
+        Returns:
+            int or None: Número de marco o None si está vacía.
+        """
+        if not self.frequency:
+            return None
+        if self.min_frequency is None:
+            self.min_frequency = min(self.buckets)
+        return next(iter(self.buckets[self.min_frequency]))
+
+    def clear(self):
+        """
+        Vacía la estructura.
+        """
+        self.frequency.clear()
+        self.buckets.clear()
+        self.min_frequency = 0
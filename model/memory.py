@@ -1,37 +1,214 @@
 from enum import Enum
-from collections import deque, OrderedDict
+from collections import deque
+from array import array
 import time
+from model.config import MachineConfig
+from model.frame_list import FrameList
+from model.policies import create_policy
+from model.prefetch import Prefetcher
+from model.profiler import Profiler
+from model.swap import SwapDevice
+from model.events import (EventBus, PAGE_HIT, PAGE_FAULT, FRAME_LOADED, PAGE_EVICTED, SWAP_IN, SWAP_OUT,
+                          PAGE_DROPPED, PROCESS_CREATED, SYSTEM_RESET)
+from model.tlb import TLB
+from model.page_table import PageTable, PageStatus, STATUS_MASK, VALID, SWAPPED, REFERENCED, MODIFIED, NO_FRAME
+from model.sparse_page_table import (RadixPageTable, InvertedPageTable, HashedInvertedTable,
+                                     PAGE_TABLE_ORGANIZATIONS)
 
-class PageStatus(Enum):
-    VALID = "Válida"
-    INVALID = "Inválida"
-    SWAPPED = "En Swap"
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Largo mínimo de una racha de aciertos para registrarla agrupada en el recorrido sin NumPy.
+MIN_GROUPED_RUN = 16
 
 class ReplacementAlgorithm(Enum):
     FIFO = "FIFO"
     LRU = "LRU"
+    LFU = "LFU"
+    CLOCK = "Clock"
+    SECOND_CHANCE = "Segunda Oportunidad Mejorada"
+    NRU = "NRU"
 
 class MemorySimulator:
-    def __init__(self):
+    def __init__(self, config=None, **settings):
         """
         Inicializa el simulador de memoria, estructuras de datos y estadísticas.
+        Args:
+            config (MachineConfig, opcional): Geometría de la máquina; por defecto la de MachineConfig().
+            **settings: Valores que reemplazan a los de config (page_size, physical_pages,
+                virtual_pages, swap_pages).
         """
-        self.page_size = 4096
-        self.physical_pages = 10
-        self.virtual_pages = 64
+        config = config or MachineConfig()
+        if settings:
+            config = config.replace(**settings)
+        self.config = config
+        self.page_size = config.page_size
+        self.physical_pages = config.physical_pages
+        self.virtual_pages = config.virtual_pages
+        self.swap_pages = config.swap_pages
+        self.virtual_address_bits = 48
         self.physical_memory = [None] * self.physical_pages
+        self.free_frames = self._new_free_frame_stack()
+        self.frame_map = {}
         self.processes = {}
         self.current_process = None
         self.page_faults = 0
         self.page_hits = 0
         self.swaps_in = 0
         self.swaps_out = 0
+        self.clean_evictions = 0
+        self.swapped_pages = 0
         self.access_count = 0
-        self.replacement_algorithm = ReplacementAlgorithm.FIFO
-        self.fifo_queue = deque()
-        self.lru_usage = OrderedDict()
-        self.swap_space = {}
+        self.page_walks = 0
+        self.walk_levels = 0
+        self.prefetch_issued = 0
+        self.prefetch_useful = 0
+        self.prefetch_wasted = 0
+        self.fifo_queue = FrameList(self.physical_pages)
+        self.set_policy(create_policy(ReplacementAlgorithm.FIFO.value, self))
+        self.tlb = None
+        self.configure_tlb()
+        self.inverted_table = None
+        self.configure_page_table()
+        self.configure_prefetch()
+        self.swap_space = SwapDevice(self.page_size, self.swap_pages)
         self.recent_faults = deque(maxlen=10)
+        self.profiler = None
+        self.event_bus = EventBus()
+        self.events = None
+
+    def _new_free_frame_stack(self):
+        """
+        Crea la pila de marcos libres con todos los marcos, el 0 en la cima. Se guarda como
+        array('i') para que con millones de marcos ocupe 4 bytes por marco y no un objeto
+        entero cada uno.
+        Returns:
+            array.array: Pila de marcos libres.
+        """
+        return array('i', range(self.physical_pages - 1, -1, -1))
+
+    def apply_config(self, config):
+        """
+        Cambia la geometría de la máquina. Como los marcos y las tablas dependen de ella,
+        el sistema se reinicia (se conservan política, TLB y organización de tablas).
+        Args:
+            config (MachineConfig): Configuración validada.
+        """
+        config.validate()
+        self.config = config
+        self.page_size = config.page_size
+        self.physical_pages = config.physical_pages
+        self.virtual_pages = config.virtual_pages
+        self.swap_pages = config.swap_pages
+        self.reset_system()
+
+    def subscribe(self, callback, event_types=None):
+        """
+        Suscribe un observador a los eventos del simulador (ver model.events). Los eventos se
+        agrupan y se entregan por lotes en flush_events() o cuando se acumulan demasiados;
+        mientras no haya suscriptores no se generan.
+        Args:
+            callback (callable): Recibe una lista de MemoryEvent por lote.
+            event_types (iterable, opcional): Tipos que le interesan; por defecto todos.
+        """
+        self.event_bus.subscribe(callback, event_types)
+        self.events = self.event_bus
+
+    def unsubscribe(self, callback):
+        """
+        Quita un observador; sin observadores el simulador deja de generar eventos.
+        Args:
+            callback (callable): El mismo objeto pasado a subscribe.
+        """
+        self.event_bus.unsubscribe(callback)
+        if not self.event_bus.subscribers:
+            self.event_bus.pending.clear()
+            self.events = None
+
+    def flush_events(self):
+        """
+        Entrega a los observadores los eventos pendientes.
+        Returns:
+            int: Eventos entregados.
+        """
+        return self.event_bus.flush()
+
+    def configure_tlb(self, entries=16, associativity=4, replacement="LRU", asid_tagging=True):
+        """
+        Configura el TLB que se consulta antes de la tabla de páginas.
+        Args:
+            entries (int): Número de entradas; 0 desactiva el TLB.
+            associativity (int): Vías por conjunto (igual a entries para totalmente asociativo).
+            replacement (str): Reemplazo dentro del conjunto: "LRU", "FIFO" o "Random".
+            asid_tagging (bool): Etiquetar entradas con el PID en vez de vaciar al cambiar de proceso.
+        """
+        tlb = TLB(entries, associativity, replacement, asid_tagging) if entries else None
+        self.tlb_config = {'entries': entries, 'associativity': associativity,
+                           'replacement': replacement, 'asid_tagging': asid_tagging}
+        self.tlb = tlb
+
+    def configure_page_table(self, organization="flat", bits_per_level=(9, 9, 9, 9)):
+        """
+        Elige la organización de las tablas de páginas de los procesos que se creen después.
+        Args:
+            organization (str): "flat" (un arreglo por proceso, hasta virtual_pages páginas),
+                "radix" (multinivel) o "inverted" (invertida con hash, compartida y del tamaño
+                de la memoria física). Las dos últimas solo guardan las páginas tocadas y
+                admiten espacios de direcciones de virtual_address_bits bits.
+            bits_per_level (tuple): Bits de índice de cada nivel de la tabla multinivel.
+        """
+        if organization not in PAGE_TABLE_ORGANIZATIONS:
+            raise ValueError(f"Organización de tabla de páginas desconocida: {organization}")
+        self.page_table_config = {'organization': organization, 'bits_per_level': tuple(bits_per_level)}
+        if organization == "inverted" and self.inverted_table is None:
+            self.inverted_table = HashedInvertedTable(self.physical_pages)
+
+    def configure_prefetch(self, enabled=False, initial_window=4, max_window=64):
+        """
+        Configura la lectura anticipada en la atención de fallos (ver model.prefetch).
+        Args:
+            enabled (bool): Activarla.
+            initial_window (int): Páginas que se anticipan al detectar un recorrido.
+            max_window (int): Ventana máxima; además nunca supera la cuarta parte de los marcos.
+                Mientras la política sea fuera de línea (OPT) la lectura anticipada no actúa.
+        """
+        prefetcher = Prefetcher(initial_window, max_window) if enabled else None
+        self.prefetch_config = {'enabled': enabled, 'initial_window': initial_window,
+                                'max_window': max_window}
+        self.prefetcher = prefetcher
+        # Marcos cargados por anticipado que todavía no se usaron.
+        self.prefetched = bytearray(self.physical_pages) if enabled else None
+
+    def virtual_page_limit(self):
+        """
+        Obtiene el máximo de páginas virtuales de un proceso con la organización actual.
+        Returns:
+            int: Número máximo de páginas.
+        """
+        organization = self.page_table_config['organization']
+        if organization == "radix":
+            return 1 << sum(self.page_table_config['bits_per_level'])
+        if organization == "inverted":
+            return (1 << self.virtual_address_bits) // self.page_size
+        return self.virtual_pages
+
+    def _new_page_table(self, pid, pages_needed):
+        """
+        Crea la tabla de páginas de un proceso según la organización configurada.
+        Args:
+            pid (str): Identificador del proceso.
+            pages_needed (int): Número de páginas virtuales.
+        Returns:
+            PageTable | RadixPageTable | InvertedPageTable: Tabla creada.
+        """
+        organization = self.page_table_config['organization']
+        if organization == "radix":
+            return RadixPageTable(pages_needed, self.page_table_config['bits_per_level'])
+        if organization == "inverted":
+            return InvertedPageTable(pid, pages_needed, self.inverted_table)
+        return PageTable(pages_needed)
 
     def create_process(self, pid, size_kb):
         """
@@ -45,20 +222,12 @@ class MemorySimulator:
         pages_needed = (size_kb * 1024 + self.page_size - 1) // self.page_size
         if pid in self.processes:
             return False, f"El PID '{pid}' ya existe."
-        if pages_needed > self.virtual_pages:
-            return False, f"Proceso {pid} requiere {pages_needed} páginas, máximo {self.virtual_pages} permitido."
+        page_limit = self.virtual_page_limit()
+        if pages_needed > page_limit:
+            return False, f"Proceso {pid} requiere {pages_needed} páginas, máximo {page_limit} permitido."
         if pages_needed == 0:
             return False, f"Proceso {pid} con tamaño {size_kb}KB resulta en 0 páginas, lo cual no es práctico."
-        page_table = {}
-        for i in range(pages_needed):
-            page_table[i] = {
-                'physical_frame': None,
-                'status': PageStatus.INVALID,
-                'referenced': False,
-                'modified': False,
-                'access_time': 0,
-                'access_count': 0
-            }
+        page_table = self._new_page_table(pid, pages_needed)
         self.processes[pid] = {
             'size_kb': size_kb,
             'pages_needed': pages_needed,
@@ -67,6 +236,8 @@ class MemorySimulator:
         }
         if not self.current_process:
             self.current_process = pid
+        if self.events is not None:
+            self.events.emit(PROCESS_CREATED, pid)
         return True, f"Proceso {pid} creado - Tamaño: {size_kb}KB, Páginas: {pages_needed}"
 
     def simulate_address_translation_stages(self, symbolic_address):
@@ -79,7 +250,7 @@ class MemorySimulator:
         """
         stages = []
         stages.append(f"1. Dirección Simbólica: {symbolic_address}")
-        logical_address_raw = abs(hash(symbolic_address)) % (self.virtual_pages * self.page_size)
+        logical_address_raw = abs(hash(symbolic_address)) % (self.virtual_page_limit() * self.page_size)
         current_pid = self.current_process
         if not current_pid or current_pid not in self.processes:
             stages.append(f"2. Dirección Relativa (Simulada desde simbólica): 0x{logical_address_raw:08X}")
@@ -101,27 +272,59 @@ class MemorySimulator:
             stages.append(f"4. Dirección Física (MMU): ❌ Error de Segmentación: Dirección lógica 0x{logical_address:08X} (página {page_number}) está fuera de los límites del proceso {current_pid} (tiene {process_data['pages_needed']} páginas).")
             return stages, logical_address
         page_table = process_data['page_table']
-        initial_page_status = page_table[page_number]['status']
+        initial_page_status = page_table.status(page_number)
+        tlb_frame = self.tlb.probe(current_pid, page_number) if self.tlb is not None else None
         physical_address = self.translate_virtual_to_physical(logical_address)
+        if self.tlb is None:
+            stages.append("4. TLB: desactivado, se recorre la tabla de páginas.")
+        elif tlb_frame is not None:
+            stages.append(f"4. TLB: ✅ Acierto (página {page_number} → marco {tlb_frame}), sin recorrer la tabla de páginas.")
+        else:
+            stages.append(f"4. TLB: ❌ Fallo para la página {page_number}, se recorre la tabla de páginas.")
         if physical_address is not None:
-            stages.append(f"4. Dirección Física (MMU): 0x{physical_address:08X}")
-            current_page_entry = page_table[page_number]
+            stages.append(f"5. Dirección Física (MMU): 0x{physical_address:08X}")
             if initial_page_status == PageStatus.VALID:
                 stages.append("✅ Traducción exitosa (Page Hit). La página ya estaba en memoria.")
             else:
-                stages.append(f"✅ Traducción exitosa (Page Fault resuelto). Página {page_number} cargada/traída de swap al marco {current_page_entry['physical_frame']}.")
+                stages.append(f"✅ Traducción exitosa (Page Fault resuelto). Página {page_number} cargada/traída de swap al marco {page_table.frame(page_number)}.")
         else:
-            stages.append(f"4. Dirección Física (MMU): ❌ Page Fault Irresoluble. No se pudo cargar la página {page_number} del proceso {current_pid} en memoria física.")
+            stages.append(f"5. Dirección Física (MMU): ❌ Page Fault Irresoluble. No se pudo cargar la página {page_number} del proceso {current_pid} en memoria física.")
         return stages, logical_address
 
-    def translate_virtual_to_physical(self, virtual_address):
+    def translate_virtual_to_physical(self, virtual_address, write=False):
         """
-        Traduce una dirección virtual a física para el proceso activo.
+        Traduce una dirección virtual a física para el proceso activo. El TLB se consulta
+        primero; si acierta, el marco se obtiene sin leer la entrada de la tabla de páginas.
         Args:
             virtual_address (int): Dirección virtual a traducir.
+            write (bool): El acceso es una escritura (la página queda modificada).
         Returns:
             int or None: Dirección física resultante o None si falla.
         """
+        tlb = self.tlb
+        if tlb is not None and self.current_process == tlb.current_asid:
+            page_number, offset = divmod(virtual_address, self.page_size)
+            entry = tlb.current.get(page_number)
+            if entry is not None:
+                # Acierto de TLB: la entrada solo existe para páginas válidas del proceso,
+                # así que no hace falta validar el rango ni leer el estado en la tabla.
+                tlb.hits += 1
+                if tlb.tracks_use:
+                    tlb.clock += 1
+                    entry[1] = tlb.clock
+                self.access_count += 1
+                self.page_hits += 1
+                page_table = entry[2]
+                page_table.flags[page_number] |= REFERENCED
+                page_table.access_time[page_number] = self.access_count
+                page_table.access_count[page_number] += 1
+                if self.policy_on_hit is not None:
+                    self.policy_on_hit(entry[0])
+                if write:
+                    self.mark_modified(self.current_process, page_table, page_number)
+                if self.events is not None:
+                    self.events.emit(PAGE_HIT, self.current_process, page_number, entry[0])
+                return entry[0] * self.page_size + offset
         if not self.current_process or self.current_process not in self.processes:
             return None
         page_number = virtual_address // self.page_size
@@ -130,34 +333,349 @@ class MemorySimulator:
         page_table = process_data['page_table']
         if page_number >= process_data['pages_needed']:
             return None
+        if page_number < 0:
+            return None
         self.access_count += 1
-        current_time = time.time()
-        if page_number in page_table:
-            page_entry = page_table[page_number]
-            if page_entry['status'] == PageStatus.VALID:
-                self.page_hits += 1
-                physical_frame = page_entry['physical_frame']
-                page_entry['access_time'] = self.access_count
-                page_entry['referenced'] = True
-                page_entry['access_count'] += 1
-                key = (self.current_process, page_number)
-                if key in self.lru_usage:
-                    del self.lru_usage[key]
-                self.lru_usage[key] = self.access_count
-                return physical_frame * self.page_size + offset
+        flags = page_table.flags
+        frame = tlb.lookup(self.current_process, page_number) if tlb is not None else None
+        if frame is None:
+            self.page_walks += 1
+            self.walk_levels += page_table.walk_depth(page_number)
+            if flags[page_number] & STATUS_MASK == VALID:
+                frame = page_table.frames[page_number]
+                if tlb is not None:
+                    tlb.insert(self.current_process, page_number, frame, page_table)
+        if frame is not None:
+            self.page_hits += 1
+            if self.prefetched is not None and self.prefetched[frame]:
+                self.prefetch_used(frame)
+            flags[page_number] |= REFERENCED
+            page_table.access_time[page_number] = self.access_count
+            page_table.access_count[page_number] += 1
+            if self.policy_on_hit is not None:
+                self.policy_on_hit(frame)
+            if write:
+                self.mark_modified(self.current_process, page_table, page_number)
+            if self.events is not None:
+                self.events.emit(PAGE_HIT, self.current_process, page_number, frame)
+            return frame * self.page_size + offset
+        self.page_faults += 1
+        if self.events is not None:
+            self.events.emit(PAGE_FAULT, self.current_process, page_number)
+        self.recent_faults.append(time.time())
+        if self.load_page_on_demand(page_number) and page_table.is_valid(page_number):
+            if write:
+                self.mark_modified(self.current_process, page_table, page_number)
+            return page_table.frames[page_number] * self.page_size + offset
+        return None
+
+    def mark_modified(self, pid, page_table, page_number):
+        """
+        Marca una página residente como modificada. Si tenía una copia en swap, la copia
+        deja de ser válida y su ranura se libera.
+        Args:
+            pid (str): PID del proceso.
+            page_table (PageTable): Tabla de páginas del proceso.
+            page_number (int): Número de página.
+        """
+        flags = page_table.flags
+        if not flags[page_number] & MODIFIED:
+            flags[page_number] |= MODIFIED
+            self.swap_space.free((pid, page_number))
+
+    def access_batch(self, pid, addresses, writes=None):
+        """
+        Procesa un lote de direcciones virtuales de un proceso en una sola llamada.
+        Los números de página y desplazamientos se calculan en bloque, las rachas de
+        aciertos se contabilizan juntas y solo los fallos pasan por la ruta lenta
+        (load_page_on_demand). Las estadísticas quedan igual que con llamadas
+        sucesivas a translate_virtual_to_physical.
+        Args:
+            pid (str): Identificador del proceso que realiza los accesos.
+            addresses (numpy.ndarray | array.array | list): Direcciones virtuales.
+            writes (secuencia de bool, opcional): Marca de escritura por acceso; los
+                accesos exitosos marcados se registran como páginas modificadas.
+        Returns:
+            tuple: (direcciones físicas, máscara de aciertos). Con NumPy son arreglos
+            int64 y bool; sin NumPy, array('q') y bytearray. Los accesos fuera de
+            rango o no resueltos tienen dirección física -1.
+        """
+        pages, offsets = self._split_addresses(addresses)
+        n = len(pages)
+        if np is not None:
+            physical = np.full(n, -1, dtype=np.int64)
+            hit_mask = np.zeros(n, dtype=bool)
+        else:
+            physical = array('q', [-1]) * n
+            hit_mask = bytearray(n)
+        process_data = self.processes.get(pid)
+        if process_data is None or n == 0:
+            return physical, hit_mask
+        if writes is not None and np is not None:
+            writes = np.asarray(writes, dtype=bool)
+        previous_process = self.current_process
+        self.current_process = pid
+        try:
+            if np is not None and process_data['page_table'].contiguous:
+                self._access_batch_vectorized(process_data, pages, offsets, writes, physical, hit_mask)
             else:
+                if np is not None:
+                    # Las tablas dispersas no se pueden ver como arreglos: se recorren como sin NumPy.
+                    pages, offsets = array('q', pages.tolist()), array('q', offsets.tolist())
+                self._access_batch_scalar(process_data, pages, offsets, writes, physical, hit_mask)
+        finally:
+            self.current_process = previous_process
+        return physical, hit_mask
+
+    def _split_addresses(self, addresses):
+        """
+        Separa un lote de direcciones en números de página y desplazamientos.
+        Args:
+            addresses (numpy.ndarray | array.array | list): Direcciones virtuales.
+        Returns:
+            tuple: (páginas, desplazamientos) como arreglos del mismo largo.
+        """
+        if np is not None:
+            return np.divmod(np.asarray(addresses, dtype=np.int64), self.page_size)
+        page_size = self.page_size
+        pages = array('q', [address // page_size for address in addresses])
+        offsets = array('q', [address % page_size for address in addresses])
+        return pages, offsets
+
+    def _access_batch_scalar(self, process_data, pages, offsets, writes, physical, hit_mask):
+        """
+        Recorre el lote sin NumPy. Sin operaciones vectorizadas, agrupar una racha de
+        aciertos solo compensa si la política cuenta aciertos y la racha es larga; los
+        demás aciertos y los fallos se registran en línea, por la misma ruta que el acceso
+        escalar.
+        """
+        page_table = process_data['page_table']
+        flags = page_table.flags
+        frames = page_table.frames
+        access_time = page_table.access_time
+        access_count = page_table.access_count
+        limit = process_data['pages_needed']
+        pid = self.current_process
+        tlb = self.tlb
+        on_hit = self.policy_on_hit
+        events = self.events
+        page_size = self.page_size
+        load_page_on_demand = self.load_page_on_demand
+        n = len(pages)
+        i = 0
+        while i < n:
+            page = pages[i]
+            if page < 0 or page >= limit:
+                i += 1
+                continue
+            if flags[page] & STATUS_MASK != VALID:
+                if tlb is None or tlb.lookup(pid, page) is None:
+                    self.page_walks += 1
+                    self.walk_levels += page_table.walk_depth(page)
+                self.access_count += 1
                 self.page_faults += 1
-                self.recent_faults.append(current_time)
-                if self.load_page_on_demand(page_number):
-                    if page_table[page_number]['status'] == PageStatus.VALID:
-                        physical_frame = page_table[page_number]['physical_frame']
-                        return physical_frame * self.page_size + offset
-                return None
-        return None
+                self.recent_faults.append(time.time())
+                if events is not None:
+                    events.emit(PAGE_FAULT, pid, page)
+                if load_page_on_demand(page):
+                    physical[i] = frames[page] * page_size + offsets[i]
+                    if writes is not None and writes[i]:
+                        self.mark_modified(pid, page_table, page)
+                i += 1
+                continue
+            end = i + 1
+            if on_hit is not None:
+                while end < n and end - i < MIN_GROUPED_RUN:
+                    page = pages[end]
+                    if page < 0 or page >= limit or flags[page] & STATUS_MASK != VALID:
+                        break
+                    end += 1
+                if end - i >= MIN_GROUPED_RUN:
+                    while end < n:
+                        page = pages[end]
+                        if page < 0 or page >= limit or flags[page] & STATUS_MASK != VALID:
+                            break
+                        end += 1
+                    self._apply_hit_run(page_table, pages, offsets, writes, i, end, physical, hit_mask)
+                    i = end
+                    continue
+            # Racha corta: un acierto no cambia qué páginas son válidas, así que se registra
+            # entera acceso por acceso sin volver a sondearla.
+            for k in range(i, end):
+                page = pages[k]
+                self.access_count += 1
+                self.page_hits += 1
+                entry = tlb.current.get(page) if tlb is not None and pid == tlb.current_asid else None
+                if entry is not None:
+                    tlb.hits += 1
+                    if tlb.tracks_use:
+                        tlb.clock += 1
+                        entry[1] = tlb.clock
+                    frame = entry[0]
+                else:
+                    frame = tlb.lookup(pid, page) if tlb is not None else None
+                    if frame is None:
+                        self.page_walks += 1
+                        self.walk_levels += page_table.walk_depth(page)
+                        frame = frames[page]
+                        if tlb is not None:
+                            tlb.insert(pid, page, frame, page_table)
+                    if self.prefetched is not None and self.prefetched[frame]:
+                        self.prefetch_used(frame)
+                flags[page] |= REFERENCED
+                access_time[page] = self.access_count
+                access_count[page] += 1
+                if on_hit is not None:
+                    on_hit(frame)
+                if writes is not None and writes[k]:
+                    self.mark_modified(pid, page_table, page)
+                if events is not None:
+                    events.emit(PAGE_HIT, pid, page, frame)
+                physical[k] = frame * page_size + offsets[k]
+                hit_mask[k] = 1
+            i = end
+
+    def _access_batch_vectorized(self, process_data, pages, offsets, writes, physical, hit_mask):
+        """
+        Recorre el lote con NumPy: el final de cada racha de aciertos se localiza con
+        operaciones vectorizadas sobre una ventana de accesos.
+        """
+        page_table = process_data['page_table']
+        limit = process_data['pages_needed']
+        flags = np.frombuffer(page_table.flags, dtype=np.uint8)
+        n = len(pages)
+        window = 1024
+        i = 0
+        while i < n:
+            page = int(pages[i])
+            if page < 0 or page >= limit:
+                i += 1
+                continue
+            if flags[page] & STATUS_MASK == VALID:
+                chunk = pages[i:i + window]
+                in_range = (chunk >= 0) & (chunk < limit)
+                ok = in_range & ((flags[np.clip(chunk, 0, limit - 1)] & STATUS_MASK) == VALID)
+                run = len(chunk) if ok.all() else int(np.argmin(ok))
+                self._apply_hit_run(page_table, pages, offsets, writes, i, i + run, physical, hit_mask)
+                window = min(window * 2, 1 << 16) if run == len(chunk) else max(64, run * 2)
+                i += run
+            else:
+                self._apply_fault(page_table, page, int(offsets[i]), writes, i, physical)
+                i += 1
+
+    def _apply_hit_run(self, page_table, pages, offsets, writes, start, end, physical, hit_mask):
+        """
+        Registra de una vez una racha de aciertos [start, end) del lote, dejando las
+        entradas de página y la política de reemplazo como lo harían accesos individuales.
+        """
+        base = self.access_count
+        page_size = self.page_size
+        if not isinstance(pages, array):
+            run_pages = pages[start:end]
+            unique_pages, reversed_first, counts = np.unique(run_pages[::-1], return_index=True,
+                                                              return_counts=True)
+            last_offsets = (end - start - 1) - reversed_first
+            frames = np.frombuffer(page_table.frames, dtype=np.int32)
+            physical[start:end] = frames[run_pages].astype(np.int64) * page_size + offsets[start:end]
+            hit_mask[start:end] = True
+            order = np.argsort(last_offsets)
+            touched = [(int(unique_pages[u]), int(last_offsets[u]), int(counts[u])) for u in order]
+            written = () if writes is None else np.unique(run_pages[writes[start:end]]).tolist()
+        else:
+            last_seen = {}
+            hits_per_page = {}
+            for k in range(start, end):
+                page = pages[k]
+                last_seen[page] = k - start
+                hits_per_page[page] = hits_per_page.get(page, 0) + 1
+                physical[k] = page_table.frames[page] * page_size + offsets[k]
+                hit_mask[k] = 1
+            touched = [(page, last_seen[page], hits_per_page[page])
+                       for page in sorted(last_seen, key=last_seen.get)]
+            written = () if writes is None else {pages[k] for k in range(start, end) if writes[k]}
+        if self.tlb is not None:
+            self._tlb_hit_run(page_table, pages, start, end)
+        else:
+            # Sin TLB cada acceso recorre la tabla; la racha no cambia su forma.
+            self.page_walks += end - start
+            self.walk_levels += sum(page_table.walk_depth(page) * hits for page, _, hits in touched)
+        on_hit = self.policy_on_hit
+        events = self.events
+        pid = self.current_process
+        frames = page_table.frames
+        flags = page_table.flags
+        access_time = page_table.access_time
+        access_count = page_table.access_count
+        prefetched = self.prefetched
+        for page, last_offset, hits in touched:
+            if prefetched is not None and prefetched[frames[page]]:
+                self.prefetch_used(frames[page])
+            access_index = base + last_offset + 1
+            access_time[page] = access_index
+            flags[page] |= REFERENCED
+            access_count[page] += hits
+            if on_hit is not None:
+                # La política ve el contador como tras el último acceso de esta página.
+                self.access_count = access_index
+                on_hit(frames[page], hits)
+            if events is not None:
+                events.emit_count(PAGE_HIT, pid, page, frames[page], hits)
+        for page in written:
+            self.mark_modified(pid, page_table, page)
+        self.access_count = base + end - start
+        self.page_hits += end - start
+
+    def _tlb_hit_run(self, page_table, pages, start, end):
+        """
+        Pasa por el TLB una racha de aciertos del lote. Solo se consultan los accesos cuya
+        página difiere de la anterior: una repetición inmediata siempre acierta en el TLB
+        y no cambia su orden, así que se cuenta en bloque.
+        """
+        tlb = self.tlb
+        pid = self.current_process
+        frames = page_table.frames
+        if not isinstance(pages, array):
+            run_pages = pages[start:end]
+            changes = np.flatnonzero(run_pages[1:] != run_pages[:-1]) + 1
+            leaders = [int(run_pages[0])] + run_pages[changes].tolist()
+        else:
+            leaders = []
+            previous = None
+            for k in range(start, end):
+                page = pages[k]
+                if page != previous:
+                    leaders.append(page)
+                    previous = page
+        for page in leaders:
+            if not tlb.access(pid, page, frames[page], page_table):
+                self.page_walks += 1
+                self.walk_levels += page_table.walk_depth(page)
+        tlb.hits += (end - start) - len(leaders)
+
+    def _apply_fault(self, page_table, page, offset, writes, index, physical):
+        """
+        Atiende un fallo de página del lote por la misma ruta que el acceso escalar.
+        """
+        if self.tlb is None or self.tlb.lookup(self.current_process, page) is None:
+            self.page_walks += 1
+            self.walk_levels += page_table.walk_depth(page)
+        self.access_count += 1
+        self.page_faults += 1
+        self.recent_faults.append(time.time())
+        if self.events is not None:
+            self.events.emit(PAGE_FAULT, self.current_process, page)
+        if self.load_page_on_demand(page):
+            physical[index] = page_table.frames[page] * self.page_size + offset
+            if writes is not None and writes[index]:
+                self.mark_modified(self.current_process, page_table, page)
 
     def load_page_on_demand(self, page_number):
         """
         Carga una página en memoria física bajo demanda, usando reemplazo si es necesario.
+        Con lectura anticipada activa, antes se cargan las páginas que siguen al recorrido
+        detectado; así el desalojo que necesiten nunca alcanza a la página pedida. Con una
+        política fuera de línea (OPT) no se anticipa: su índice de próximo uso solo conoce
+        los accesos de la traza y no sabría ubicar una página cargada sin pedirla.
         Args:
             page_number (int): Número de página a cargar.
         Returns:
@@ -167,122 +685,236 @@ class MemorySimulator:
             return False
         process_data = self.processes[self.current_process]
         page_table = process_data['page_table']
+        if self.prefetcher is not None and not self.policy.offline:
+            self.prefetch(process_data, page_number)
+        return self.load_page(page_table, page_number, True)
+
+    def load_page(self, page_table, page_number, demand):
+        """
+        Carga una página del proceso activo en un marco libre, desalojando una víctima si
+        no queda ninguno.
+        Args:
+            page_table (PageTable): Tabla de páginas del proceso activo.
+            page_number (int): Número de página a cargar.
+            demand (bool): La carga atiende un fallo. Una página anticipada queda válida pero
+                sin referenciar ni contar accesos, fuera del TLB y marcada hasta que se use.
+        Returns:
+            bool: True si la página fue cargada, False si no hubo marco.
+        """
         free_frame = self.find_free_frame()
+        if free_frame is None and self.replace_page() is not None:
+            free_frame = self.find_free_frame()
         if free_frame is None:
-            free_frame = self.replace_page()
-        if free_frame is not None:
-            swap_key = f"{self.current_process}_{page_number}"
-            if swap_key in self.swap_space:
-                del self.swap_space[swap_key]
-                self.swaps_in += 1
-            page_table[page_number]['physical_frame'] = free_frame
-            page_table[page_number]['status'] = PageStatus.VALID
-            page_table[page_number]['access_time'] = self.access_count
-            page_table[page_number]['referenced'] = True
-            page_table[page_number]['access_count'] += 1
-            self.physical_memory[free_frame] = (self.current_process, page_number)
-            key = (self.current_process, page_number)
-            if key not in self.fifo_queue:
-                self.fifo_queue.append(key)
-            if self.replacement_algorithm == ReplacementAlgorithm.LRU:
-                if key in self.lru_usage:
-                    del self.lru_usage[key]
-                self.lru_usage[key] = self.access_count
-            return True
-        return False
+            return False
+        self.free_frames.pop()
+        self.swap_in(self.current_process, page_number)
+        page_table.frames[page_number] = free_frame
+        # La página recién cargada (de swap o nueva) está limpia.
+        status = VALID | REFERENCED if demand else VALID
+        page_table.flags[page_number] = (page_table.flags[page_number] & ~(STATUS_MASK | MODIFIED)) | status
+        page_table.access_time[page_number] = self.access_count
+        if demand:
+            page_table.access_count[page_number] += 1
+        else:
+            self.prefetched[free_frame] = 1
+        key = (self.current_process, page_number)
+        self.physical_memory[free_frame] = key
+        self.frame_map[key] = free_frame
+        self.fifo_queue.append(free_frame)
+        self.policy.on_load(free_frame)
+        if self.events is not None:
+            self.events.emit(FRAME_LOADED, self.current_process, page_number, free_frame)
+        if demand and self.tlb is not None:
+            self.tlb.insert(self.current_process, page_number, free_frame, page_table)
+        return True
+
+    def prefetch(self, process_data, page_number):
+        """
+        Registra el fallo en el detector de recorridos y carga por anticipado las páginas que
+        propone y no están residentes. Se detiene si no consigue marco.
+        Args:
+            process_data (dict): Datos del proceso activo.
+            page_number (int): Página que falló.
+        Returns:
+            int: Páginas cargadas por anticipado.
+        """
+        candidates = self.prefetcher.on_fault(self.current_process, page_number,
+                                              process_data['pages_needed'], self.physical_pages // 4)
+        page_table = process_data['page_table']
+        flags = page_table.flags
+        issued = 0
+        for page in candidates:
+            if flags[page] & STATUS_MASK == VALID:
+                continue
+            if not self.load_page(page_table, page, False):
+                break
+            issued += 1
+        self.prefetch_issued += issued
+        return issued
+
+    def prefetch_used(self, frame):
+        """
+        Registra el primer uso de una página cargada por anticipado: la ventana de su
+        proceso crece.
+        Args:
+            frame (int): Marco de la página.
+        """
+        self.prefetched[frame] = 0
+        self.prefetch_useful += 1
+        self.prefetcher.on_useful(self.physical_memory[frame][0])
+
+    def swap_in(self, process_pid, page_number):
+        """
+        Lee una página de swap si estaba allí, porque vuelve a memoria física. La ranura se
+        conserva: mientras la página no se modifique, la copia en swap sigue siendo válida y
+        un desalojo posterior no necesita escribirla.
+        Args:
+            process_pid (str): PID del proceso.
+            page_number (int): Número de página.
+        Returns:
+            bool: True si la página estaba en swap.
+        """
+        if self.swap_space.read((process_pid, page_number), release=False) is None:
+            return False
+        self.swaps_in += 1
+        self.swapped_pages -= 1
+        if self.events is not None:
+            self.events.emit(SWAP_IN, process_pid, page_number)
+        return True
 
     def find_free_frame(self):
         """
-        Busca un marco libre en la memoria física.
+        Obtiene el próximo marco libre de la pila de marcos libres, sin retirarlo.
         Returns:
             int or None: Índice del marco libre o None si no hay.
         """
-        for i, frame in enumerate(self.physical_memory):
-            if frame is None:
-                return i
+        if self.free_frames:
+            return self.free_frames[-1]
         return None
 
+    def release_frame(self, frame_number):
+        """
+        Libera un marco físico y lo deja en la cima de la pila de marcos libres.
+        Args:
+            frame_number (int): Índice del marco físico.
+        """
+        content = self.physical_memory[frame_number]
+        if content is not None:
+            if self.tlb is not None:
+                self.tlb.invalidate(*content)
+            if self.prefetched is not None and self.prefetched[frame_number]:
+                # Se desaloja una página anticipada sin haberla usado: la ventana se reduce.
+                self.prefetched[frame_number] = 0
+                self.prefetch_wasted += 1
+                self.prefetcher.on_wasted(content[0])
+            self.frame_map.pop(content, None)
+            self.fifo_queue.discard(frame_number)
+            self.policy.on_evict(frame_number)
+            if self.events is not None:
+                self.events.emit(PAGE_EVICTED, content[0], content[1], frame_number)
+            self.physical_memory[frame_number] = None
+            self.free_frames.append(frame_number)
+
     def replace_page(self):
         """
-        Ejecuta el algoritmo de reemplazo de página configurado.
+        Desaloja la víctima elegida por la política de reemplazo activa.
         Returns:
             int or None: Índice del marco liberado o None si falla.
         """
-        if self.replacement_algorithm == ReplacementAlgorithm.FIFO:
-            return self.replace_page_fifo()
-        elif self.replacement_algorithm == ReplacementAlgorithm.LRU:
-            return self.replace_page_lru()
-        return None
+        victim_frame = self.policy.pick_victim()
+        if victim_frame is None:
+            return None
+        return self.evict_frame(victim_frame)
 
-    def replace_page_fifo(self):
+    @property
+    def replacement_algorithm(self):
         """
-        Reemplaza una página usando el algoritmo FIFO.
+        Algoritmo de reemplazo activo.
         Returns:
-            int or None: Índice del marco liberado o None si falla.
+            ReplacementAlgorithm or str: Miembro del enum para las políticas incluidas, o el
+            nombre registrado para políticas externas.
         """
-        if not self.fifo_queue:
-            return None
-        victim_process_pid, victim_page_num = self.fifo_queue.popleft()
-        victim_frame = None
-        for i, frame_content in enumerate(self.physical_memory):
-            if frame_content == (victim_process_pid, victim_page_num):
-                victim_frame = i
-                break
-        if victim_frame is not None:
-            if victim_process_pid in self.processes and victim_page_num in self.processes[victim_process_pid]['page_table']:
-                self.move_page_to_swap(victim_process_pid, victim_page_num, victim_frame)
-            else:
-                self.physical_memory[victim_frame] = None
-            return victim_frame
-        else:
-            if self.fifo_queue:
-                pass
-            return None
+        try:
+            return ReplacementAlgorithm(self.policy.name)
+        except ValueError:
+            return self.policy.name
+
+    @replacement_algorithm.setter
+    def replacement_algorithm(self, algorithm):
+        self.set_replacement_algorithm(algorithm)
+
+    def set_replacement_algorithm(self, algorithm):
+        """
+        Cambia el algoritmo de reemplazo por una política registrada.
+        Args:
+            algorithm (ReplacementAlgorithm | str): Algoritmo o nombre registrado.
+        """
+        name = algorithm.value if isinstance(algorithm, ReplacementAlgorithm) else algorithm
+        if name != self.policy.name:
+            self.set_policy(create_policy(name, self))
+
+    def set_policy(self, policy):
+        """
+        Instala una política de reemplazo. Las páginas residentes se le notifican en orden
+        de carga, de modo que el cambio en tiempo de ejecución no necesita reconstruir el
+        estado del simulador.
+        Args:
+            policy (ReplacementPolicy): Política a usar.
+        """
+        for frame in self.fifo_queue:
+            policy.on_load(frame)
+        self.policy = policy
+        self.policy_on_hit = policy.on_hit if policy.tracks_hits else None
 
-    def replace_page_lru(self):
+    def evict_frame(self, victim_frame):
         """
-        Reemplaza una página usando el algoritmo LRU (menos accesada).
+        Desaloja la página que ocupa un marco, enviándola a swap.
+        Args:
+            victim_frame (int): Índice del marco víctima.
         Returns:
-            int or None: Índice del marco liberado o None si falla.
+            int or None: Índice del marco liberado, o None si el swap está lleno.
         """
-        candidates = []
-        for i, frame_content in enumerate(self.physical_memory):
-            if frame_content is not None:
-                pid, page_num = frame_content
-                page_table = self.processes[pid]['page_table']
-                access_count = page_table[page_num].get('access_count', 0)
-                candidates.append((access_count, i, pid, page_num))
-        if not candidates:
-            return None
-        candidates.sort()
-        _, victim_frame, victim_pid, victim_page_num = candidates[0]
+        victim_pid, victim_page_num = self.physical_memory[victim_frame]
         if victim_pid in self.processes and victim_page_num in self.processes[victim_pid]['page_table']:
-            self.move_page_to_swap(victim_pid, victim_page_num, victim_frame)
+            if not self.move_page_to_swap(victim_pid, victim_page_num, victim_frame):
+                return None
         else:
-            self.physical_memory[victim_frame] = None
+            self.release_frame(victim_frame)
         return victim_frame
 
     def move_page_to_swap(self, process_pid, page_number, frame_number):
         """
-        Mueve una página de un proceso a swap y libera el marco físico.
+        Mueve una página de un proceso a swap y libera el marco físico. Solo las páginas
+        modificadas, o sin copia en swap, se escriben; una página limpia con copia válida se
+        descarta sin E/S.
         Args:
             process_pid (str): PID del proceso.
             page_number (int): Número de página.
             frame_number (int): Índice del marco físico.
+        Returns:
+            bool: True si se movió, False si el swap está lleno (la página sigue en su marco).
         """
-        if process_pid in self.processes:
-            page_table = self.processes[process_pid]['page_table']
-            if page_number in page_table:
-                page_table[page_number]['status'] = PageStatus.SWAPPED
-                page_table[page_number]['physical_frame'] = None
-                page_table[page_number]['referenced'] = False
-        swap_key = f"{process_pid}_{page_number}"
-        self.swap_space[swap_key] = f"Datos de página {page_number} del proceso {process_pid}"
-        self.physical_memory[frame_number] = None
-        self.swaps_out += 1
         key = (process_pid, page_number)
-        if key in self.fifo_queue:
-            self.fifo_queue.remove(key)
+        page_table = self.processes[process_pid]['page_table'] if process_pid in self.processes else None
+        if page_table is not None and page_number not in page_table:
+            page_table = None
+        dirty = page_table is None or page_table.flags[page_number] & MODIFIED
+        written = dirty or key not in self.swap_space
+        if written:
+            if self.swap_space.write(key) is None:
+                return False
+            self.swaps_out += 1
+        else:
+            self.clean_evictions += 1
+        if page_table is not None:
+            page_table.flags[page_number] = (page_table.flags[page_number] & ~(STATUS_MASK | REFERENCED | MODIFIED)) | SWAPPED
+            page_table.frames[page_number] = NO_FRAME
+        self.release_frame(frame_number)
+        self.swapped_pages += 1
+        if self.events is not None:
+            # swap_out solo cuando hubo escritura; el descarte de una página limpia es page_dropped.
+            self.events.emit(SWAP_OUT if written else PAGE_DROPPED, process_pid, page_number, frame_number)
+        return True
 
     def detect_thrashing(self):
         """
@@ -301,6 +933,28 @@ class MemorySimulator:
         fault_rate_display = self.page_faults / max(self.access_count, 1)
         return False, f"Sistema funcionando normalmente. Tasa de fallos: {fault_rate_display:.2%} (no se detecta hiperpaginación)."
 
+    def enable_profiling(self, enabled=True):
+        """
+        Activa o desactiva la instrumentación de los caminos críticos (ver model.profiler).
+        Desactivada no agrega ningún costo; activada no cambia los resultados de la simulación.
+        Args:
+            enabled (bool): True para activarla (con contadores en cero), False para quitarla.
+        """
+        if self.profiler is not None:
+            self.profiler.uninstall()
+            self.profiler = None
+        if enabled:
+            self.profiler = Profiler()
+            self.profiler.install(self)
+
+    def get_profile(self):
+        """
+        Obtiene las llamadas y los tiempos acumulados por fase.
+        Returns:
+            dict: {fase: {'calls', 'total_ns', 'mean_ns'}}, vacío si la instrumentación está desactivada.
+        """
+        return self.profiler.report() if self.profiler is not None else {}
+
     def get_statistics(self):
         """
         Obtiene estadísticas actuales del simulador.
@@ -313,33 +967,75 @@ class MemorySimulator:
             'page_faults': self.page_faults,
             'swaps_in': self.swaps_in,
             'swaps_out': self.swaps_out,
-            'pages_in_swap': len(self.swap_space),
-            'algorithm': self.replacement_algorithm.value
+            'clean_evictions': self.clean_evictions,
+            'pages_in_swap': self.swapped_pages,
+            'swap_cached_pages': len(self.swap_space) - self.swapped_pages,
+            'swap_capacity': self.swap_pages,
+            'algorithm': self.policy.name
         }
+        stats.update(self.swap_space.get_statistics())
         if self.access_count > 0:
             stats['hit_rate'] = (self.page_hits / self.access_count) * 100
             stats['fault_rate'] = (self.page_faults / self.access_count) * 100
         else:
             stats['hit_rate'] = 0
             stats['fault_rate'] = 0
+        stats['prefetch_issued'] = self.prefetch_issued
+        stats['prefetch_useful'] = self.prefetch_useful
+        stats['prefetch_wasted'] = self.prefetch_wasted
+        # Precisión: anticipadas que se usaron. Cobertura: fallos que la anticipación evitó.
+        stats['prefetch_accuracy'] = (self.prefetch_useful / self.prefetch_issued * 100
+                                      if self.prefetch_issued else 0)
+        demand_loads = self.prefetch_useful + self.page_faults
+        stats['prefetch_coverage'] = self.prefetch_useful / demand_loads * 100 if demand_loads else 0
+        stats['page_walks'] = self.page_walks
+        stats['avg_walk_depth'] = self.walk_levels / self.page_walks if self.page_walks else 0
+        stats['page_table_bytes'] = sum(self.get_page_table_memory().values())
+        if self.inverted_table is not None:
+            # Las anclas de la tabla invertida son del sistema, no de un proceso.
+            stats['page_table_bytes'] += self.inverted_table.anchors.itemsize * len(self.inverted_table.anchors)
+        if self.tlb is not None:
+            stats.update(self.tlb.get_statistics())
+        else:
+            stats.update({'tlb_hits': 0, 'tlb_misses': 0, 'tlb_hit_rate': 0,
+                          'tlb_flushes': 0, 'tlb_shootdowns': 0})
         return stats
 
     def reset_system(self):
         """
-        Reinicia el simulador, eliminando procesos, memoria y estadísticas.
+        Reinicia el simulador, eliminando procesos, memoria y estadísticas. La geometría
+        es la de la configuración vigente (ver apply_config).
         """
         self.physical_memory = [None] * self.physical_pages
+        self.free_frames = self._new_free_frame_stack()
+        self.frame_map = {}
         self.processes = {}
         self.current_process = None
         self.page_faults = 0
         self.page_hits = 0
         self.swaps_in = 0
         self.swaps_out = 0
+        self.clean_evictions = 0
+        self.swapped_pages = 0
         self.access_count = 0
-        self.fifo_queue.clear()
-        self.lru_usage.clear()
-        self.swap_space.clear()
+        self.page_walks = 0
+        self.walk_levels = 0
+        self.prefetch_issued = 0
+        self.prefetch_useful = 0
+        self.prefetch_wasted = 0
+        self.fifo_queue = FrameList(self.physical_pages)
+        self.set_policy(create_policy(self.policy.name, self))
+        self.configure_tlb(**self.tlb_config)
+        self.inverted_table = None
+        self.configure_page_table(**self.page_table_config)
+        self.configure_prefetch(**self.prefetch_config)
+        self.swap_space.configure(self.page_size, self.swap_pages)
         self.recent_faults.clear()
+        if self.profiler is not None:
+            self.profiler.reset()
+        if self.events is not None:
+            self.events.pending.clear()
+            self.events.emit(SYSTEM_RESET)
 
     def get_processes(self):
         """
@@ -379,15 +1075,23 @@ class MemorySimulator:
         Args:
             pid (str): Identificador del proceso.
         Returns:
-            dict: Tabla de páginas del proceso.
+            PageTable: Tabla de páginas del proceso (se consulta como dict {página: entrada}).
         """
         return self.processes.get(pid, {}).get('page_table', {})
 
+    def get_page_table_memory(self):
+        """
+        Obtiene la memoria que ocupan las tablas de páginas de cada proceso.
+        Returns:
+            dict: {pid: bytes}.
+        """
+        return {pid: data['page_table'].nbytes() for pid, data in self.processes.items()}
+
     def get_swap_space(self):
         """
         Obtiene el espacio de intercambio (swap).
         Returns:
-            dict: Páginas en swap.
+            SwapDevice: Dispositivo de swap; se recorre como claves (pid, página).
         """
         return self.swap_space
 
@@ -0,0 +1,217 @@
+from enum import Enum
+from array import array
+from collections.abc import Mapping
+
+class PageStatus(Enum):
+    VALID = "Válida"
+    INVALID = "Inválida"
+    SWAPPED = "En Swap"
+
+# Bits de la bandera de cada entrada: estado en los 2 bits bajos, luego referenciada y modificada.
+STATUS_MASK = 0b0011
+INVALID = 0
+VALID = 1
+SWAPPED = 2
+REFERENCED = 0b0100
+MODIFIED = 0b1000
+
+STATUS_BY_CODE = {INVALID: PageStatus.INVALID, VALID: PageStatus.VALID, SWAPPED: PageStatus.SWAPPED}
+CODE_BY_STATUS = {status: code for code, status in STATUS_BY_CODE.items()}
+NO_FRAME = -1
+
+# Campos de una entrada, para leerla y escribirla sin conocer la organización de la tabla.
+FRAME, FLAGS, ACCESS_TIME, ACCESS_COUNT = range(4)
+COLUMNS = ('frames', 'flags', 'access_time', 'access_count')
+
+
+class PageTable(Mapping):
+    """
+    Tabla de páginas compacta organizada como estructura de arreglos: marco (int32),
+    banderas de estado/referencia/modificación (uint8) y contadores (uint64).
+    Se comporta como un diccionario de solo lectura {página: entrada} para la interfaz,
+    mientras el simulador trabaja directamente sobre los arreglos.
+    Los arreglos se crean la primera vez que el simulador los usa, así que crear la tabla
+    es O(1); hasta entonces todas las páginas se leen como inválidas.
+    """
+    __slots__ = ('size', 'touched') + COLUMNS
+    contiguous = True
+
+    def __init__(self, size):
+        """
+        Crea una tabla con todas las páginas inválidas, sin reservar sus arreglos.
+        Args:
+            size (int): Número de páginas virtuales del proceso.
+        """
+        self.size = size
+        self.touched = False
+
+    def __getattr__(self, name):
+        # Solo se llama mientras los arreglos no existen: el primer uso los crea.
+        if name in COLUMNS:
+            self.materialize()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def materialize(self):
+        """
+        Reserva los arreglos de la tabla, con todas las páginas inválidas.
+        """
+        if not self.touched:
+            self.frames = array('i', [NO_FRAME]) * self.size
+            self.flags = bytearray(self.size)
+            self.access_time = array('Q', [0]) * self.size
+            self.access_count = array('Q', [0]) * self.size
+            self.touched = True
+
+    def read(self, field, page):
+        """
+        Lee un campo de la entrada de una página sin reservar los arreglos.
+        Args:
+            field (int): FRAME, FLAGS, ACCESS_TIME o ACCESS_COUNT.
+            page (int): Número de página.
+        Returns:
+            int: Valor del campo (NO_FRAME o 0 si la tabla no fue tocada).
+        """
+        if not self.touched:
+            return NO_FRAME if field == FRAME else 0
+        return getattr(self, COLUMNS[field])[page]
+
+    def write(self, field, page, value):
+        """
+        Escribe un campo de la entrada de una página.
+        Args:
+            field (int): FRAME, FLAGS, ACCESS_TIME o ACCESS_COUNT.
+            page (int): Número de página.
+            value (int): Valor a escribir.
+        """
+        getattr(self, COLUMNS[field])[page] = value
+
+    def __getitem__(self, page):
+        if not 0 <= page < self.size:
+            raise KeyError(page)
+        return PageTableEntry(self, page)
+
+    def __contains__(self, page):
+        return isinstance(page, int) and 0 <= page < self.size
+
+    def __iter__(self):
+        return iter(range(self.size))
+
+    def __len__(self):
+        return self.size
+
+    def status(self, page):
+        """
+        Obtiene el estado de una página.
+        Args:
+            page (int): Número de página.
+        Returns:
+            PageStatus: Estado de la página.
+        """
+        return STATUS_BY_CODE[self.read(FLAGS, page) & STATUS_MASK]
+
+    def is_valid(self, page):
+        """
+        Indica si la página está cargada en memoria física.
+        Args:
+            page (int): Número de página.
+        Returns:
+            bool: True si la página es válida.
+        """
+        return self.read(FLAGS, page) & STATUS_MASK == VALID
+
+    def frame(self, page):
+        """
+        Obtiene el marco físico de una página.
+        Args:
+            page (int): Número de página.
+        Returns:
+            int or None: Marco físico o None si la página no está cargada.
+        """
+        frame = self.read(FRAME, page)
+        return None if frame == NO_FRAME else frame
+
+    def walk_depth(self, page):
+        """
+        Obtiene cuántos accesos a memoria necesita recorrer la tabla para una página.
+        Args:
+            page (int): Número de página.
+        Returns:
+            int: Siempre 1, la tabla plana se indexa directamente.
+        """
+        return 1
+
+    def nbytes(self):
+        """
+        Obtiene la memoria ocupada por los arreglos de la tabla.
+        Returns:
+            int: Bytes usados por las entradas (0 si la tabla no fue tocada).
+        """
+        if not self.touched:
+            return 0
+        return (self.frames.itemsize * len(self.frames) + len(self.flags)
+                + self.access_time.itemsize * len(self.access_time)
+                + self.access_count.itemsize * len(self.access_count))
+
+
+class PageTableEntry:
+    """
+    Vista de una entrada de la tabla de páginas con la interfaz de diccionario
+    ('physical_frame', 'status', 'referenced', 'modified', 'access_time', 'access_count').
+    """
+    __slots__ = ('table', 'page')
+
+    KEYS = ('physical_frame', 'status', 'referenced', 'modified', 'access_time', 'access_count')
+
+    def __init__(self, table, page):
+        self.table = table
+        self.page = page
+
+    def __getitem__(self, key):
+        table, page = self.table, self.page
+        if key == 'physical_frame':
+            return table.frame(page)
+        if key == 'status':
+            return table.status(page)
+        if key == 'referenced':
+            return bool(table.read(FLAGS, page) & REFERENCED)
+        if key == 'modified':
+            return bool(table.read(FLAGS, page) & MODIFIED)
+        if key == 'access_time':
+            return table.read(ACCESS_TIME, page)
+        if key == 'access_count':
+            return table.read(ACCESS_COUNT, page)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        table, page = self.table, self.page
+        flags = table.read(FLAGS, page)
+        if key == 'physical_frame':
+            table.write(FRAME, page, NO_FRAME if value is None else value)
+        elif key == 'status':
+            table.write(FLAGS, page, (flags & ~STATUS_MASK) | CODE_BY_STATUS[value])
+        elif key == 'referenced':
+            table.write(FLAGS, page, flags | REFERENCED if value else flags & ~REFERENCED)
+        elif key == 'modified':
+            table.write(FLAGS, page, flags | MODIFIED if value else flags & ~MODIFIED)
+        elif key == 'access_time':
+            table.write(ACCESS_TIME, page, value)
+        elif key == 'access_count':
+            table.write(ACCESS_COUNT, page, value)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.KEYS
+
+    def items(self):
+        return [(key, self[key]) for key in self.KEYS]
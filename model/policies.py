@@ -0,0 +1,355 @@
+import heapq
+from array import array
+
+from model.frame_list import FrameList, FrequencyBuckets, NIL
+from model.page_table import REFERENCED, MODIFIED
+
+POLICY_REGISTRY = {}
+NEVER = (1 << 63) - 1
+
+
+def register_policy(name):
+    """
+    Decorador que registra una política de reemplazo bajo un nombre.
+    Args:
+        name (str): Nombre con el que se selecciona la política.
+    Returns:
+        callable: Decorador de clase.
+    """
+    def decorator(cls):
+        cls.name = name
+        POLICY_REGISTRY[name] = cls
+        return cls
+    return decorator
+
+
+def create_policy(name, simulator):
+    """
+    Crea una instancia de la política registrada con ese nombre.
+    Args:
+        name (str): Nombre de la política.
+        simulator (MemorySimulator): Simulador al que se asocia.
+    Returns:
+        ReplacementPolicy: Política creada.
+    """
+    if name not in POLICY_REGISTRY:
+        raise ValueError(f"Política de reemplazo desconocida: {name}")
+    return POLICY_REGISTRY[name](simulator)
+
+
+def available_policies(include_offline=False):
+    """
+    Obtiene los nombres de las políticas registradas.
+    Args:
+        include_offline (bool): Si es True, incluye políticas que requieren conocer la traza
+            completa de antemano (OPT).
+    Returns:
+        list: Nombres en orden de registro.
+    """
+    return [name for name, cls in POLICY_REGISTRY.items() if include_offline or not cls.offline]
+
+
+def build_next_use(keys):
+    """
+    Construye el índice de próximo uso de una traza en una sola pasada hacia atrás.
+    Args:
+        keys (secuencia): Identificador de página (hashable) de cada acceso, en orden.
+    Returns:
+        array.array: Para cada posición, la posición del siguiente acceso a la misma página,
+        o NEVER si no vuelve a usarse.
+    """
+    next_use = array('q', [NEVER]) * len(keys)
+    last_position = {}
+    for position in range(len(keys) - 1, -1, -1):
+        key = keys[position]
+        next_use[position] = last_position.get(key, NEVER)
+        last_position[key] = position
+    return next_use
+
+
+class ReplacementPolicy:
+    """
+    Interfaz de las políticas de reemplazo. El simulador notifica cada carga, acierto y
+    desalojo por número de marco y pide una víctima cuando no hay marcos libres.
+    Las políticas con tracks_hits en False no reciben on_hit, lo que deja el camino de
+    acierto sin costo extra.
+    """
+    name = None
+    tracks_hits = True
+    offline = False
+
+    def __init__(self, simulator):
+        """
+        Args:
+            simulator (MemorySimulator): Simulador al que pertenece la política.
+        """
+        self.simulator = simulator
+
+    def on_load(self, frame):
+        """
+        Notifica que una página fue cargada en un marco.
+        Args:
+            frame (int): Número de marco.
+        """
+
+    def on_hit(self, frame, hits=1):
+        """
+        Notifica aciertos sobre la página de un marco.
+        Args:
+            frame (int): Número de marco.
+            hits (int): Aciertos acumulados (más de uno en el procesamiento por lotes).
+        """
+
+    def on_evict(self, frame):
+        """
+        Notifica que un marco quedó libre.
+        Args:
+            frame (int): Número de marco.
+        """
+
+    def pick_victim(self):
+        """
+        Elige el marco a desalojar.
+        Returns:
+            int or None: Número de marco o None si no hay candidatos.
+        """
+        raise NotImplementedError
+
+    def page_flags(self, frame):
+        """
+        Obtiene el byte de banderas de la página que ocupa un marco.
+        Args:
+            frame (int): Número de marco.
+        Returns:
+            tuple: (tabla de páginas, página, banderas) o None si el marco está libre.
+        """
+        content = self.simulator.physical_memory[frame]
+        if content is None:
+            return None
+        pid, page = content
+        page_table = self.simulator.processes[pid]['page_table']
+        return page_table, page, page_table.flags[page]
+
+
+@register_policy("FIFO")
+class FIFOPolicy(ReplacementPolicy):
+    """
+    Desaloja la página cargada hace más tiempo, usando el orden de carga que el simulador
+    mantiene siempre.
+    """
+    tracks_hits = False
+
+    def pick_victim(self):
+        frame = self.simulator.fifo_queue.head
+        return None if frame == NIL else frame
+
+
+@register_policy("LRU")
+class LRUPolicy(ReplacementPolicy):
+    """
+    Desaloja la página usada hace más tiempo: cada acierto mueve el marco al final de una
+    lista de recencia y la víctima es la cabeza.
+    """
+
+    def __init__(self, simulator):
+        super().__init__(simulator)
+        self.recency = FrameList(simulator.physical_pages)
+
+    def on_load(self, frame):
+        self.recency.append(frame)
+
+    def on_hit(self, frame, hits=1):
+        self.recency.move_to_end(frame)
+
+    def on_evict(self, frame):
+        self.recency.discard(frame)
+
+    def pick_victim(self):
+        frame = self.recency.head
+        return None if frame == NIL else frame
+
+
+@register_policy("LFU")
+class LFUPolicy(ReplacementPolicy):
+    """
+    Desaloja la página con menos accesos desde su carga, con cubos de frecuencia O(1) y
+    desempate por recencia.
+    """
+
+    def __init__(self, simulator):
+        super().__init__(simulator)
+        self.buckets = FrequencyBuckets()
+
+    def on_load(self, frame):
+        self.buckets.add(frame)
+
+    def on_hit(self, frame, hits=1):
+        self.buckets.increment(frame, hits)
+
+    def on_evict(self, frame):
+        self.buckets.discard(frame)
+
+    def pick_victim(self):
+        return self.buckets.peek_victim()
+
+
+@register_policy("Clock")
+class ClockPolicy(ReplacementPolicy):
+    """
+    Segunda oportunidad con reloj: la manecilla recorre los marcos, limpia el bit de
+    referencia de las páginas usadas y desaloja la primera que lo tenga apagado. Los
+    aciertos solo encienden el bit en la tabla de páginas.
+    """
+    tracks_hits = False
+
+    def __init__(self, simulator):
+        super().__init__(simulator)
+        self.hand = 0
+
+    def pick_victim(self):
+        frame_count = self.simulator.physical_pages
+        for _ in range(2 * frame_count + 1):
+            frame = self.hand
+            self.hand = (self.hand + 1) % frame_count
+            entry = self.page_flags(frame)
+            if entry is None:
+                continue
+            page_table, page, flags = entry
+            if not flags & REFERENCED:
+                return frame
+            page_table.flags[page] = flags & ~REFERENCED
+        return None
+
+
+@register_policy("Segunda Oportunidad Mejorada")
+class EnhancedSecondChancePolicy(ClockPolicy):
+    """
+    Reloj mejorado con el par (referenciada, modificada): prefiere (0, 0), luego (0, 1)
+    limpiando bits de referencia a su paso, y repite; así evita desalojar páginas sucias
+    que obligarían a escribir en swap.
+    """
+
+    def pick_victim(self):
+        frame_count = self.simulator.physical_pages
+        for _ in range(2):
+            for wanted in (0, MODIFIED):
+                clear_references = wanted == MODIFIED
+                for _ in range(frame_count):
+                    frame = self.hand
+                    self.hand = (self.hand + 1) % frame_count
+                    entry = self.page_flags(frame)
+                    if entry is None:
+                        continue
+                    page_table, page, flags = entry
+                    if flags & (REFERENCED | MODIFIED) == wanted:
+                        return frame
+                    if clear_references and flags & REFERENCED:
+                        page_table.flags[page] = flags & ~REFERENCED
+        return None
+
+
+@register_policy("NRU")
+class NRUPolicy(ReplacementPolicy):
+    """
+    No usada recientemente: clasifica las páginas por (referenciada, modificada) y desaloja
+    una de la clase más baja. Los bits de referencia se limpian cada reset_interval accesos,
+    como lo haría la interrupción de reloj del sistema; con más marcos que reset_interval el
+    periodo pasa a ser el número de marcos, para que limpiar (que recorre todos) cueste O(1)
+    amortizado por acceso.
+    """
+    tracks_hits = False
+    reset_interval = 1000
+
+    def __init__(self, simulator):
+        super().__init__(simulator)
+        self.start = 0
+        self.last_reset = simulator.access_count
+
+    def pick_victim(self):
+        simulator = self.simulator
+        frame_count = simulator.physical_pages
+        interval = max(self.reset_interval, frame_count)
+        clear_references = simulator.access_count - self.last_reset >= interval
+        if clear_references:
+            self.last_reset = simulator.access_count
+        best_frame = None
+        best_class = 4
+        for step in range(frame_count):
+            frame = (self.start + step) % frame_count
+            entry = self.page_flags(frame)
+            if entry is None:
+                continue
+            page_table, page, flags = entry
+            page_class = (2 if flags & REFERENCED else 0) + (1 if flags & MODIFIED else 0)
+            if clear_references:
+                page_table.flags[page] = flags & ~REFERENCED
+            if page_class < best_class:
+                best_frame, best_class = frame, page_class
+                if page_class == 0 and not clear_references:
+                    break
+        if best_frame is not None:
+            self.start = (best_frame + 1) % frame_count
+        return best_frame
+
+
+@register_policy("OPT")
+class OptimalPolicy(ReplacementPolicy):
+    """
+    Reemplazo óptimo de Belady (fuera de línea): desaloja la página cuyo próximo uso está
+    más lejos. Requiere el índice de próximo uso de la traza (set_future) y ubica cada
+    acceso por el contador de accesos del simulador. Las víctimas salen de un montículo
+    de máximos con invalidación perezosa, O(log k) por operación.
+    """
+    offline = True
+
+    def __init__(self, simulator):
+        super().__init__(simulator)
+        self.next_use = array('q')
+        self.base = simulator.access_count
+        self.heap = []
+        self.next_of = {}
+
+    def set_future(self, next_use, base=None):
+        """
+        Asigna el índice de próximo uso de la traza que se va a simular.
+        Args:
+            next_use (array.array): Resultado de build_next_use sobre los accesos contados.
+            base (int, opcional): Valor de access_count antes del primer acceso de la traza;
+                por defecto el actual.
+        """
+        self.next_use = next_use
+        self.base = self.simulator.access_count if base is None else base
+
+    def upcoming_use(self):
+        """
+        Obtiene la posición del próximo uso de la página accedida en este momento.
+        Returns:
+            int: Posición en la traza o NEVER.
+        """
+        position = self.simulator.access_count - 1 - self.base
+        if 0 <= position < len(self.next_use):
+            return self.next_use[position]
+        return NEVER
+
+    def on_load(self, frame):
+        upcoming = self.upcoming_use()
+        self.next_of[frame] = upcoming
+        heapq.heappush(self.heap, (-upcoming, frame))
+        if len(self.heap) > 4 * len(self.next_of) + 64:
+            self.heap = [(-upcoming, frame) for frame, upcoming in self.next_of.items()]
+            heapq.heapify(self.heap)
+
+    def on_hit(self, frame, hits=1):
+        self.on_load(frame)
+
+    def on_evict(self, frame):
+        self.next_of.pop(frame, None)
+
+    def pick_victim(self):
+        heap = self.heap
+        while heap:
+            negative_use, frame = heap[0]
+            if self.next_of.get(frame) == -negative_use:
+                return frame
+            heapq.heappop(heap)
+        return None
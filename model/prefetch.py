@@ -0,0 +1,94 @@
+class StreamState:
+    """
+    Flujo de fallos de un proceso: la última página que atendió (fallo o final de la última
+    lectura anticipada), el paso entre fallos y la ventana de lectura anticipada actual.
+    """
+    __slots__ = ('last', 'stride', 'window')
+
+    def __init__(self, page, window):
+        self.last = page
+        self.stride = 0
+        self.window = window
+
+
+class Prefetcher:
+    """
+    Lectura anticipada por proceso en el camino de atención de fallos. Cada proceso tiene
+    un flujo; cuando dos fallos seguidos avanzan con el mismo paso (1 es el recorrido
+    secuencial, otro valor un recorrido con paso fijo), el fallo siguiente trae además las
+    próximas window páginas del flujo. El flujo continúa desde el final de lo anticipado,
+    así que el fallo que sigue a una lectura anticipada ya aprovechada vuelve a coincidir.
+    La ventana es adaptativa: crece en uno por cada página anticipada que llega a usarse y
+    se reduce a la mitad por cada una que se desaloja sin haberse usado.
+    """
+
+    def __init__(self, initial_window=4, max_window=64):
+        """
+        Args:
+            initial_window (int): Ventana con la que empieza cada flujo.
+            max_window (int): Ventana máxima en páginas.
+        """
+        if initial_window < 1 or max_window < initial_window:
+            raise ValueError(f"Ventana de lectura anticipada inválida: {initial_window}..{max_window}")
+        self.initial_window = initial_window
+        self.max_window = max_window
+        self.streams = {}
+        self.sequential_readaheads = 0
+        self.stride_readaheads = 0
+
+    def on_fault(self, pid, page, limit, budget):
+        """
+        Registra un fallo y obtiene las páginas a anticipar.
+        Args:
+            pid (str): Proceso.
+            page (int): Página que falló.
+            limit (int): Páginas del proceso (no se anticipa fuera de [0, limit)).
+            budget (int): Máximo de páginas a anticipar, además de la ventana.
+        Returns:
+            range: Páginas candidatas, vacío si el flujo no está confirmado.
+        """
+        stream = self.streams.get(pid)
+        if stream is None:
+            self.streams[pid] = StreamState(page, self.initial_window)
+            return range(0)
+        stride = page - stream.last
+        if stride == 0 or stride != stream.stride:
+            stream.stride = stride
+            stream.window = self.initial_window
+            stream.last = page
+            return range(0)
+        end = page + stride * (min(stream.window, budget) + 1)
+        end = min(end, limit) if stride > 0 else max(end, -1)
+        candidates = range(page + stride, end, stride)
+        stream.last = candidates[-1] if candidates else page
+        if candidates:
+            if stride == 1:
+                self.sequential_readaheads += 1
+            else:
+                self.stride_readaheads += 1
+        return candidates
+
+    def on_useful(self, pid):
+        """
+        Una página anticipada se usó: la ventana del proceso crece.
+        """
+        stream = self.streams.get(pid)
+        if stream is not None and stream.window < self.max_window:
+            stream.window += 1
+
+    def on_wasted(self, pid):
+        """
+        Una página anticipada se desalojó sin usarse: la ventana del proceso se reduce.
+        """
+        stream = self.streams.get(pid)
+        if stream is not None:
+            stream.window = max(1, stream.window // 2)
+
+    def window(self, pid):
+        """
+        Obtiene la ventana actual de un proceso.
+        Returns:
+            int: Páginas de la ventana (la inicial si el proceso aún no tiene flujo).
+        """
+        stream = self.streams.get(pid)
+        return stream.window if stream is not None else self.initial_window
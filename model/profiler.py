@@ -0,0 +1,119 @@
+from time import perf_counter_ns
+
+# Fase -> método del simulador que la delimita. Los métodos se llaman siempre como
+# self.metodo(...), así que un atributo de instancia con el mismo nombre los reemplaza.
+PROFILED_METHODS = {
+    'hit': 'translate_virtual_to_physical',
+    'hit_run': '_apply_hit_run',
+    'fault': 'load_page_on_demand',
+    'prefetch': 'prefetch',
+    'free_frame_search': 'find_free_frame',
+    'replacement': 'replace_page',
+    'eviction': 'evict_frame',
+    'swap_out': 'move_page_to_swap',
+    'swap_in': 'swap_in',
+}
+PROFILE_PHASES = tuple(PROFILED_METHODS) + ('victim_selection',)
+
+
+class Profiler:
+    """
+    Instrumentación opcional de los caminos críticos del simulador: cuenta llamadas y
+    acumula perf_counter_ns por fase. Se instala envolviendo los métodos del simulador con
+    atributos de instancia y se desinstala borrándolos, de modo que desactivada no cuesta
+    nada y activada no cambia ningún resultado.
+    Fases: hit (aciertos de translate_virtual_to_physical), hit_run (rachas de aciertos de
+    access_batch, contadas por acceso), fault (atención completa de un fallo), prefetch (lectura
+    anticipada dentro de fault), free_frame_search, replacement (elegir y desalojar víctima),
+    eviction, swap_out, swap_in y victim_selection (replacement sin eviction).
+    """
+
+    def __init__(self):
+        self.calls = dict.fromkeys(PROFILE_PHASES, 0)
+        self.nanoseconds = dict.fromkeys(PROFILE_PHASES, 0)
+        self.simulator = None
+
+    def install(self, simulator):
+        """
+        Envuelve los métodos instrumentados del simulador.
+        Args:
+            simulator (MemorySimulator): Simulador a instrumentar.
+        """
+        self.simulator = simulator
+        for phase, name in PROFILED_METHODS.items():
+            original = getattr(type(simulator), name).__get__(simulator)
+            if phase == 'hit':
+                wrapper = self._translate_wrapper(original)
+            elif phase == 'hit_run':
+                wrapper = self._hit_run_wrapper(original)
+            else:
+                wrapper = self._wrapper(phase, original)
+            setattr(simulator, name, wrapper)
+
+    def uninstall(self):
+        """
+        Devuelve al simulador sus métodos originales.
+        """
+        if self.simulator is not None:
+            for name in PROFILED_METHODS.values():
+                self.simulator.__dict__.pop(name, None)
+            self.simulator = None
+
+    def reset(self):
+        """
+        Pone en cero contadores y tiempos.
+        """
+        for phase in PROFILE_PHASES:
+            self.calls[phase] = 0
+            self.nanoseconds[phase] = 0
+
+    def _wrapper(self, phase, method):
+        calls, nanoseconds = self.calls, self.nanoseconds
+
+        def timed(*args):
+            start = perf_counter_ns()
+            try:
+                return method(*args)
+            finally:
+                nanoseconds[phase] += perf_counter_ns() - start
+                calls[phase] += 1
+        return timed
+
+    def _translate_wrapper(self, method):
+        # Solo los aciertos cuentan como "hit": el tiempo de un fallo ya queda en "fault".
+        calls, nanoseconds, simulator = self.calls, self.nanoseconds, self.simulator
+
+        def timed(virtual_address, write=False):
+            hits = simulator.page_hits
+            start = perf_counter_ns()
+            result = method(virtual_address, write)
+            elapsed = perf_counter_ns() - start
+            if simulator.page_hits != hits:
+                nanoseconds['hit'] += elapsed
+                calls['hit'] += 1
+            return result
+        return timed
+
+    def _hit_run_wrapper(self, method):
+        calls, nanoseconds = self.calls, self.nanoseconds
+
+        def timed(page_table, pages, offsets, writes, start, end, physical, hit_mask):
+            began = perf_counter_ns()
+            method(page_table, pages, offsets, writes, start, end, physical, hit_mask)
+            nanoseconds['hit_run'] += perf_counter_ns() - began
+            calls['hit_run'] += end - start
+        return timed
+
+    def report(self):
+        """
+        Obtiene el perfil acumulado.
+        Returns:
+            dict: {fase: {'calls', 'total_ns', 'mean_ns'}} para cada fase de PROFILE_PHASES.
+        """
+        calls = dict(self.calls)
+        nanoseconds = dict(self.nanoseconds)
+        calls['victim_selection'] = calls['replacement']
+        nanoseconds['victim_selection'] = max(0, nanoseconds['replacement'] - nanoseconds['eviction'])
+        return {phase: {'calls': calls[phase], 'total_ns': nanoseconds[phase],
+                        'mean_ns': nanoseconds[phase] / calls[phase] if calls[phase] else 0.0}
+                for phase in PROFILE_PHASES}
@@ -0,0 +1,386 @@
+from array import array
+from collections.abc import Mapping
+
+from model.page_table import (PageTable, PageTableEntry, STATUS_BY_CODE, STATUS_MASK, VALID, NO_FRAME,
+                              FRAME, FLAGS, ACCESS_TIME, ACCESS_COUNT)
+
+PAGE_TABLE_ORGANIZATIONS = ("flat", "radix", "inverted")
+
+POINTER_BYTES = 8
+NIL = -1
+# Hash multiplicativo de 64 bits de la tabla invertida: 2^64 / φ.
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+HASH_WORD = (1 << 64) - 1
+
+
+class _Column:
+    """
+    Vista de un campo de una tabla dispersa indexada por número de página, para que el
+    simulador use frames[page], flags[page] |= ..., etc. igual que con la tabla plana.
+    """
+    __slots__ = ('table', 'field')
+
+    def __init__(self, table, field):
+        self.table = table
+        self.field = field
+
+    def __getitem__(self, page):
+        return self.table.read(self.field, page)
+
+    def __setitem__(self, page, value):
+        self.table.write(self.field, page, value)
+
+    def __len__(self):
+        return self.table.size
+
+
+class SparsePageTable(Mapping):
+    """
+    Base de las tablas de páginas dispersas: solo guardan las páginas tocadas, así que su
+    memoria crece con el uso y no con el tamaño del espacio de direcciones. Como diccionario
+    recorren solo las páginas tocadas; las demás se consultan como entradas inválidas.
+    """
+    contiguous = False
+
+    def __init__(self, size):
+        """
+        Args:
+            size (int): Número de páginas virtuales del proceso.
+        """
+        self.size = size
+        self.frames = _Column(self, FRAME)
+        self.flags = _Column(self, FLAGS)
+        self.access_time = _Column(self, ACCESS_TIME)
+        self.access_count = _Column(self, ACCESS_COUNT)
+
+    def read(self, field, page):
+        """
+        Lee un campo de la entrada de una página.
+        Args:
+            field (int): FRAME, FLAGS, ACCESS_TIME o ACCESS_COUNT.
+            page (int): Número de página.
+        Returns:
+            int: Valor del campo (NO_FRAME o 0 si la página no fue tocada).
+        """
+        raise NotImplementedError
+
+    def write(self, field, page, value):
+        """
+        Escribe un campo de la entrada de una página, creándola si hace falta.
+        Args:
+            field (int): FRAME, FLAGS, ACCESS_TIME o ACCESS_COUNT.
+            page (int): Número de página.
+            value (int): Valor a escribir.
+        """
+        raise NotImplementedError
+
+    def touched_pages(self):
+        """
+        Obtiene las páginas que tienen entrada.
+        Returns:
+            iterable: Números de página en orden creciente.
+        """
+        raise NotImplementedError
+
+    def walk_depth(self, page):
+        """
+        Obtiene cuántos accesos a memoria necesita recorrer la tabla para una página.
+        Args:
+            page (int): Número de página.
+        Returns:
+            int: Profundidad del recorrido.
+        """
+        raise NotImplementedError
+
+    def nbytes(self):
+        """
+        Obtiene la memoria ocupada por la tabla.
+        Returns:
+            int: Bytes usados por los nodos y entradas creados.
+        """
+        raise NotImplementedError
+
+    def __getitem__(self, page):
+        if not 0 <= page < self.size:
+            raise KeyError(page)
+        return PageTableEntry(self, page)
+
+    def __contains__(self, page):
+        return isinstance(page, int) and 0 <= page < self.size
+
+    def __iter__(self):
+        return iter(self.touched_pages())
+
+    def __len__(self):
+        return sum(1 for _ in self.touched_pages())
+
+    def status(self, page):
+        return STATUS_BY_CODE[self.read(FLAGS, page) & STATUS_MASK]
+
+    def is_valid(self, page):
+        return self.read(FLAGS, page) & STATUS_MASK == VALID
+
+    def frame(self, page):
+        frame = self.read(FRAME, page)
+        return None if frame == NO_FRAME else frame
+
+
+class RadixPageTable(SparsePageTable):
+    """
+    Tabla de páginas multinivel (árbol radix). El número de página se parte en campos de
+    bits_per_level bits, del más significativo al menos; cada nivel intermedio es un arreglo
+    de punteros que se crea al tocar la primera página de su rango y las hojas son tablas
+    planas de estructura de arreglos.
+    """
+
+    def __init__(self, size, bits_per_level=(9, 9, 9, 9)):
+        """
+        Args:
+            size (int): Número de páginas virtuales del proceso.
+            bits_per_level (tuple): Bits de índice de cada nivel, de la raíz a las hojas.
+        """
+        if len(bits_per_level) < 2 or min(bits_per_level) <= 0:
+            raise ValueError("La tabla multinivel necesita al menos dos niveles con bits positivos.")
+        if size > 1 << sum(bits_per_level):
+            raise ValueError("El proceso no cabe en el espacio cubierto por los niveles de la tabla.")
+        super().__init__(size)
+        self.bits_per_level = tuple(bits_per_level)
+        self.levels = len(bits_per_level)
+        shifts = []
+        shift = sum(bits_per_level)
+        for bits in bits_per_level:
+            shift -= bits
+            shifts.append(shift)
+        self.shifts = tuple(shifts)
+        self.masks = tuple((1 << bits) - 1 for bits in bits_per_level)
+        self.leaf_mask = self.masks[-1]
+        self.root = [None] * (1 << bits_per_level[0])
+        self.interior_bytes = len(self.root) * POINTER_BYTES
+        self.leaves = {}
+
+    def _leaf(self, page, create):
+        """
+        Recorre el árbol hasta la hoja que contiene una página.
+        Args:
+            page (int): Número de página.
+            create (bool): Crear los nodos que falten.
+        Returns:
+            PageTable or None: Hoja de la página o None si no existe y create es False.
+        """
+        node = self.root
+        last = self.levels - 2
+        for level in range(self.levels - 1):
+            index = (page >> self.shifts[level]) & self.masks[level]
+            child = node[index]
+            if child is None:
+                if not create:
+                    return None
+                if level == last:
+                    child = PageTable(1 << self.bits_per_level[-1])
+                    self.leaves[page >> self.shifts[-2]] = child
+                else:
+                    child = [None] * (1 << self.bits_per_level[level + 1])
+                    self.interior_bytes += len(child) * POINTER_BYTES
+                node[index] = child
+            node = child
+        return node
+
+    def read(self, field, page):
+        leaf = self._leaf(page, False)
+        if leaf is None:
+            return NO_FRAME if field == FRAME else 0
+        return leaf.read(field, page & self.leaf_mask)
+
+    def write(self, field, page, value):
+        self._leaf(page, True).write(field, page & self.leaf_mask, value)
+
+    def touched_pages(self):
+        pages = []
+        leaf_bits = self.bits_per_level[-1]
+        for prefix in sorted(self.leaves):
+            leaf = self.leaves[prefix]
+            base = prefix << leaf_bits
+            pages.extend(base + index for index in range(leaf.size)
+                         if (leaf.flags[index] or leaf.access_count[index]) and base + index < self.size)
+        return pages
+
+    def walk_depth(self, page):
+        node = self.root
+        for level in range(self.levels - 1):
+            node = node[(page >> self.shifts[level]) & self.masks[level]]
+            if node is None:
+                return level + 1
+        return self.levels
+
+    def nbytes(self):
+        return self.interior_bytes + sum(leaf.nbytes() for leaf in self.leaves.values())
+
+
+class HashedInvertedTable:
+    """
+    Tabla de páginas invertida con hash, compartida por todos los procesos: una entrada por
+    marco físico con la etiqueta (pid, página) y el siguiente marco de su cadena, más un
+    arreglo de anclas indexado por el hash de la etiqueta. Su tamaño depende solo de la
+    cantidad de marcos.
+    """
+    # Etiqueta de pid (4), etiqueta de página (8) y enlace de la cadena (4) por marco.
+    ENTRY_BYTES = 16
+
+    def __init__(self, frame_count):
+        """
+        Args:
+            frame_count (int): Número de marcos físicos.
+        """
+        bits = 0
+        while 1 << bits < frame_count:
+            bits += 1
+        self.shift = 64 - bits
+        self.anchors = array('i', [NIL]) * (1 << bits)
+        self.owners = [None] * frame_count
+        self.pages = array('q', [0]) * frame_count
+        self.next = array('i', [NIL]) * frame_count
+        self.resident = {}
+        self.pid_index = {}
+
+    def _bucket(self, pid, page):
+        """
+        Cubeta de una etiqueta: hash multiplicativo del índice denso del pid (en orden de
+        aparición) y la página. A diferencia de hash(), no cambia con PYTHONHASHSEED.
+        """
+        index = self.pid_index.get(pid)
+        if index is None:
+            index = self.pid_index[pid] = len(self.pid_index)
+        key = (index << 40) ^ page
+        return ((key * HASH_MULTIPLIER) & HASH_WORD) >> self.shift
+
+    def lookup(self, pid, page):
+        """
+        Busca el marco que contiene una página.
+        Args:
+            pid (str): PID del proceso.
+            page (int): Número de página.
+        Returns:
+            int: Marco físico o NO_FRAME.
+        """
+        frame = self.anchors[self._bucket(pid, page)]
+        while frame != NIL:
+            if self.pages[frame] == page and self.owners[frame] == pid:
+                return frame
+            frame = self.next[frame]
+        return NO_FRAME
+
+    def probes(self, pid, page):
+        """
+        Cuenta los accesos de un recorrido: el ancla más cada entrada examinada de la cadena.
+        Args:
+            pid (str): PID del proceso.
+            page (int): Número de página.
+        Returns:
+            int: Profundidad del recorrido.
+        """
+        depth = 1
+        frame = self.anchors[self._bucket(pid, page)]
+        while frame != NIL:
+            depth += 1
+            if self.pages[frame] == page and self.owners[frame] == pid:
+                break
+            frame = self.next[frame]
+        return depth
+
+    def insert(self, pid, page, frame):
+        """
+        Registra que un marco contiene una página, reemplazando la etiqueta anterior del marco.
+        Args:
+            pid (str): PID del proceso.
+            page (int): Número de página.
+            frame (int): Marco físico.
+        """
+        if self.owners[frame] is not None:
+            self.remove(self.owners[frame], self.pages[frame])
+        bucket = self._bucket(pid, page)
+        self.owners[frame] = pid
+        self.pages[frame] = page
+        self.next[frame] = self.anchors[bucket]
+        self.anchors[bucket] = frame
+        self.resident[pid] = self.resident.get(pid, 0) + 1
+
+    def remove(self, pid, page):
+        """
+        Quita la etiqueta de una página de la tabla si está residente.
+        Args:
+            pid (str): PID del proceso.
+            page (int): Número de página.
+        """
+        bucket = self._bucket(pid, page)
+        previous = NIL
+        frame = self.anchors[bucket]
+        while frame != NIL:
+            if self.pages[frame] == page and self.owners[frame] == pid:
+                if previous == NIL:
+                    self.anchors[bucket] = self.next[frame]
+                else:
+                    self.next[previous] = self.next[frame]
+                self.owners[frame] = None
+                self.next[frame] = NIL
+                self.resident[pid] -= 1
+                return
+            previous = frame
+            frame = self.next[frame]
+
+    def nbytes(self):
+        """
+        Obtiene la memoria de la tabla completa.
+        Returns:
+            int: Bytes de anclas y entradas.
+        """
+        return self.anchors.itemsize * len(self.anchors) + self.ENTRY_BYTES * len(self.owners)
+
+
+class InvertedPageTable(SparsePageTable):
+    """
+    Vista de un proceso sobre la tabla invertida compartida. El marco de una página se
+    obtiene recorriendo la cadena de hash; el estado, los bits y los contadores de las
+    páginas tocadas (incluidas las que están en swap, que la tabla invertida no conoce) se
+    guardan en un diccionario del proceso.
+    """
+    # Banderas (1) y dos contadores (8 + 8) por página tocada.
+    RECORD_BYTES = 17
+
+    def __init__(self, pid, size, inverted_table):
+        """
+        Args:
+            pid (str): PID del proceso.
+            size (int): Número de páginas virtuales del proceso.
+            inverted_table (HashedInvertedTable): Tabla invertida del sistema.
+        """
+        super().__init__(size)
+        self.pid = pid
+        self.inverted_table = inverted_table
+        self.records = {}
+
+    def read(self, field, page):
+        if field == FRAME:
+            return self.inverted_table.lookup(self.pid, page)
+        record = self.records.get(page)
+        return 0 if record is None else record[field - 1]
+
+    def write(self, field, page, value):
+        if field == FRAME:
+            self.inverted_table.remove(self.pid, page)
+            if value != NO_FRAME:
+                self.inverted_table.insert(self.pid, page, value)
+            return
+        record = self.records.get(page)
+        if record is None:
+            record = self.records[page] = [0, 0, 0]
+        record[field - 1] = value
+
+    def touched_pages(self):
+        return sorted(self.records)
+
+    def walk_depth(self, page):
+        return self.inverted_table.probes(self.pid, page)
+
+    def nbytes(self):
+        resident = self.inverted_table.resident.get(self.pid, 0)
+        return resident * HashedInvertedTable.ENTRY_BYTES + len(self.records) * self.RECORD_BYTES
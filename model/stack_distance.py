@@ -0,0 +1,169 @@
+from array import array
+
+from model.trace import iter_page_keys
+
+
+class StackDistanceAnalyzer:
+    """
+    Analizador de distancias de pila de Mattson. En una sola pasada sobre una secuencia de
+    páginas calcula, para todo tamaño de memoria a la vez, cuántos aciertos y fallos tendría
+    LRU. La distancia de cada acceso se obtiene con un árbol de Fenwick sobre los instantes
+    del último uso de cada página (O(log n) por acceso); los instantes se compactan cuando el
+    árbol se llena, así que la memoria depende de las páginas distintas y no del largo de la traza.
+    """
+
+    def __init__(self, capacity=1 << 16):
+        """
+        Args:
+            capacity (int): Tamaño inicial del árbol de Fenwick (instantes antes de compactar).
+        """
+        self.capacity = max(int(capacity), 16)
+        self.tree = array('q', [0]) * (self.capacity + 1)
+        self.last_time = {}
+        self.time = 0
+        self.histogram = array('q', [0])
+        self.cold_misses = 0
+        self.accesses = 0
+
+    def access(self, key):
+        """
+        Registra un acceso.
+        Args:
+            key (hashable): Identificador de la página accedida.
+        """
+        self.feed((key,))
+
+    def feed(self, keys):
+        """
+        Registra una secuencia de accesos.
+        Args:
+            keys (iterable): Identificadores de página en orden de acceso.
+        """
+        last_time = self.last_time
+        histogram = self.histogram
+        tree = self.tree
+        capacity = self.capacity
+        time = self.time
+        for key in keys:
+            if time >= capacity:
+                self.time = time
+                self._compact()
+                tree = self.tree
+                capacity = self.capacity
+                time = self.time
+            last = last_time.get(key)
+            if last is None:
+                self.cold_misses += 1
+            else:
+                # Páginas distintas usadas después de 'last': marcas en (last, time).
+                distance = 1
+                i = time
+                while i > 0:
+                    distance += tree[i]
+                    i &= i - 1
+                i = last + 1
+                while i > 0:
+                    distance -= tree[i]
+                    i &= i - 1
+                if distance >= len(histogram):
+                    histogram.extend([0] * (distance + 1 - len(histogram)))
+                histogram[distance] += 1
+                i = last + 1
+                while i <= capacity:
+                    tree[i] -= 1
+                    i += i & -i
+            i = time + 1
+            while i <= capacity:
+                tree[i] += 1
+                i += i & -i
+            last_time[key] = time
+            time += 1
+            self.accesses += 1
+        self.time = time
+
+    def _compact(self):
+        """
+        Renumera los últimos usos de 0 a m-1 conservando su orden y reconstruye el árbol.
+        """
+        live = sorted(self.last_time, key=self.last_time.get)
+        self.capacity = max(self.capacity, 2 * len(live))
+        tree = array('q', [0]) * (self.capacity + 1)
+        for new_time, key in enumerate(live):
+            self.last_time[key] = new_time
+            tree[new_time + 1] = 1
+        for i in range(1, self.capacity + 1):
+            parent = i + (i & -i)
+            if parent <= self.capacity:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.time = len(live)
+
+    def hits_by_size(self, max_frames):
+        """
+        Obtiene los aciertos de LRU para cada cantidad de marcos.
+        Args:
+            max_frames (int): Mayor cantidad de marcos a considerar.
+        Returns:
+            array.array: Posición c = aciertos con c marcos (c de 0 a max_frames).
+        """
+        hits = array('q', [0]) * (max_frames + 1)
+        total = 0
+        histogram = self.histogram
+        for frames in range(1, max_frames + 1):
+            if frames < len(histogram):
+                total += histogram[frames]
+            hits[frames] = total
+        return hits
+
+    def fault_counts(self, max_frames):
+        """
+        Obtiene los fallos de LRU para cada cantidad de marcos.
+        Args:
+            max_frames (int): Mayor cantidad de marcos a considerar.
+        Returns:
+            array.array: Posición c = fallos con c marcos.
+        """
+        return array('q', [self.accesses - hits for hits in self.hits_by_size(max_frames)])
+
+    def miss_ratio_curve(self, max_frames):
+        """
+        Obtiene la curva de tasa de fallos de LRU.
+        Args:
+            max_frames (int): Mayor cantidad de marcos a considerar.
+        Returns:
+            array.array: Posición c = fracción de accesos que fallan con c marcos.
+        """
+        if self.accesses == 0:
+            return array('d', [0.0]) * (max_frames + 1)
+        return array('d', [faults / self.accesses for faults in self.fault_counts(max_frames)])
+
+    def distinct_pages(self):
+        """
+        Obtiene el número de páginas distintas vistas, que es el tamaño a partir del cual
+        solo quedan fallos obligatorios.
+        Returns:
+            int: Páginas distintas.
+        """
+        return len(self.last_time)
+
+
+def analyze_trace(reader, simulator, max_frames=None, process_size_kb=None, fold=True):
+    """
+    Calcula la curva de fallos de LRU de una traza en una sola pasada.
+    Args:
+        reader (TraceReader): Lector de la traza.
+        simulator (MemorySimulator): Simulador que define tamaño de página y procesos; se usa
+            solo para crear los procesos de la traza, no se simulan accesos.
+        max_frames (int, opcional): Mayor cantidad de marcos de la curva; por defecto el
+            número de páginas distintas.
+        process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+    Returns:
+        tuple: (StackDistanceAnalyzer, curva de tasa de fallos).
+    """
+    analyzer = StackDistanceAnalyzer()
+    for keys in iter_page_keys(simulator, reader, process_size_kb, fold):
+        analyzer.feed(keys)
+    if max_frames is None:
+        max_frames = max(analyzer.distinct_pages(), 1)
+    return analyzer, analyzer.miss_ratio_curve(max_frames)
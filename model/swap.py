@@ -0,0 +1,289 @@
+import mmap
+import re
+import tempfile
+
+# Ranuras por clúster: las páginas desalojadas una tras otra van a ranuras contiguas, y un
+# clúster es un byte libre del mapa de bits.
+CLUSTER_SLOTS = 8
+# Ranuras iniciales del swap sin límite de capacidad (crece al doble cuando se llena).
+INITIAL_SLOTS = 64
+_NOT_FULL_BYTE = re.compile(b'[^\xff]')
+
+
+class SwapDevice:
+    """
+    Dispositivo de intercambio: las páginas se guardan en ranuras del tamaño de una página
+    dentro de un archivo mapeado en memoria (temporal, salvo que se indique una ruta).
+    Las ranuras se asignan con un mapa de bits (un bit por ranura) y las páginas se ubican
+    por la clave (pid, página), sin armar ni partir cadenas. Las páginas desalojadas
+    seguidas se asignan dentro de un mismo clúster de CLUSTER_SLOTS ranuras contiguas
+    mientras queden libres, buscando siempre hacia adelante desde el último clúster.
+    El archivo crece al doble a medida que se usan ranuras más altas, y como es disperso solo
+    ocupa disco lo que se escribió. Con capacidad (en páginas) el swap puede llenarse: write()
+    devuelve None y la página se queda donde estaba.
+    Se acumulan lecturas, escrituras y bytes transferidos, de modo que el volumen de E/S de
+    swap es una cantidad medible.
+    Se usa como un contenedor de claves: len(), in e iteración sobre las claves (pid, página).
+    """
+
+    def __init__(self, page_size, capacity=None, path=None):
+        """
+        Args:
+            page_size (int): Tamaño de ranura en bytes (el de página).
+            capacity (int, opcional): Ranuras disponibles; None para no limitar.
+            path (str, opcional): Archivo de respaldo; por defecto uno temporal.
+        """
+        self.path = path
+        self.file = None
+        self.map = None
+        self.mapped_slots = 0
+        self.configure(page_size, capacity)
+
+    def configure(self, page_size, capacity=None):
+        """
+        Vacía el dispositivo y cambia su geometría.
+        Args:
+            page_size (int): Tamaño de ranura en bytes.
+            capacity (int, opcional): Ranuras disponibles; None para no limitar.
+        """
+        self.unmap()
+        self.page_size = page_size
+        self.capacity = capacity
+        self.blank = bytes(page_size)
+        self.slots = {}
+        self.total_slots = capacity if capacity is not None else INITIAL_SLOTS
+        self.bitmap = bytearray(-(-self.total_slots // 8))
+        # Los bits sobrantes del último byte quedan ocupados para que nunca se asignen.
+        for slot in range(self.total_slots, len(self.bitmap) * 8):
+            self.bitmap[slot >> 3] |= 1 << (slot & 7)
+        self.hint = 0
+        self.cluster_next = 0
+        self.cluster_end = 0
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.clusters = 0
+        self.full_rejections = 0
+
+    def clear(self):
+        """
+        Libera todas las ranuras y reinicia los contadores.
+        """
+        self.configure(self.page_size, self.capacity)
+
+    def close(self):
+        """
+        Cierra el archivo de respaldo.
+        """
+        self.unmap()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, key):
+        return key in self.slots
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def keys(self):
+        return self.slots.keys()
+
+    def slot_of(self, key):
+        """
+        Obtiene la ranura de una página.
+        Args:
+            key (tuple): (pid, página).
+        Returns:
+            int or None: Ranura, o None si la página no está en swap.
+        """
+        return self.slots.get(key)
+
+    def is_full(self):
+        """
+        Indica si no quedan ranuras libres (solo con capacidad limitada).
+        """
+        return self.capacity is not None and len(self.slots) >= self.capacity
+
+    # Mapa de bits
+
+    def allocate(self):
+        """
+        Reserva una ranura libre: la siguiente del clúster actual si sigue libre, si no el
+        primer clúster libre desde la última posición y, si no queda ninguno, cualquier
+        ranura libre. Sin límite de capacidad, el mapa crece al doble solo cuando está lleno.
+        Returns:
+            int or None: Ranura reservada, o None si el swap está lleno.
+        """
+        slot = self.cluster_next
+        if slot < self.cluster_end and not self.bitmap[slot >> 3] & (1 << (slot & 7)):
+            self.cluster_next = slot + 1
+        else:
+            slot = self.new_cluster()
+            if slot is None:
+                slot = self.any_free_slot()
+            if slot is None:
+                if self.capacity is not None:
+                    return None
+                self.bitmap.extend(bytes(len(self.bitmap)))
+                self.total_slots = len(self.bitmap) * 8
+                slot = self.new_cluster()
+        self.bitmap[slot >> 3] |= 1 << (slot & 7)
+        return slot
+
+    def new_cluster(self):
+        """
+        Busca un clúster completamente libre (un byte en cero del mapa de bits) desde la
+        última posición, dando la vuelta.
+        Returns:
+            int or None: Primera ranura del clúster, que pasa a ser el clúster actual.
+        """
+        bitmap = self.bitmap
+        index = bitmap.find(0, self.hint)
+        if index < 0:
+            index = bitmap.find(0, 0, self.hint)
+        if index < 0:
+            return None
+        self.hint = index + 1
+        self.clusters += 1
+        slot = index * CLUSTER_SLOTS
+        self.cluster_next = slot + 1
+        self.cluster_end = slot + CLUSTER_SLOTS
+        return slot
+
+    def any_free_slot(self):
+        """
+        Busca cualquier ranura libre (un byte del mapa de bits que no esté lleno).
+        Returns:
+            int or None: Ranura libre, o None si no hay.
+        """
+        match = _NOT_FULL_BYTE.search(self.bitmap, self.hint) or _NOT_FULL_BYTE.search(self.bitmap)
+        if match is None:
+            return None
+        index = match.start()
+        byte = self.bitmap[index]
+        return index * 8 + (~byte & (byte + 1)).bit_length() - 1
+
+    def release(self, slot):
+        self.bitmap[slot >> 3] &= ~(1 << (slot & 7))
+
+    # Archivo mapeado
+
+    def unmap(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        self.mapped_slots = 0
+        if self.file is not None:
+            self.file.truncate(0)
+
+    def ensure_mapped(self, slot):
+        """
+        Agranda el archivo y el mapeo (al doble) hasta cubrir la ranura.
+        """
+        if slot < self.mapped_slots:
+            return
+        slots = max(INITIAL_SLOTS, self.mapped_slots * 2)
+        while slots <= slot:
+            slots *= 2
+        slots = min(slots, self.total_slots)
+        if self.file is None:
+            self.file = open(self.path, 'w+b') if self.path else tempfile.TemporaryFile()
+        if self.map is not None:
+            self.map.close()
+        self.file.truncate(slots * self.page_size)
+        self.map = mmap.mmap(self.file.fileno(), slots * self.page_size)
+        self.mapped_slots = slots
+
+    def page_header(self, key):
+        """
+        Cabecera con que se escribe una página cuando no se dan sus datos (el resto va en cero).
+        """
+        return f"{key[0]}:{key[1]}\n".encode()[:self.page_size]
+
+    # E/S
+
+    def write(self, key, data=None):
+        """
+        Escribe una página en su ranura, reservándola si no tenía.
+        Args:
+            key (tuple): (pid, página).
+            data (bytes, opcional): Contenido; se completa o recorta al tamaño de página.
+        Returns:
+            int or None: Ranura escrita, o None si el swap está lleno.
+        """
+        slot = self.slots.get(key)
+        if slot is None:
+            slot = self.allocate()
+            if slot is None:
+                self.full_rejections += 1
+                return None
+            self.slots[key] = slot
+        page_size = self.page_size
+        self.ensure_mapped(slot)
+        offset = slot * page_size
+        if data is None:
+            header = self.page_header(key)
+            self.map[offset:offset + page_size] = self.blank
+            self.map[offset:offset + len(header)] = header
+        else:
+            if len(data) != page_size:
+                data = bytes(data[:page_size]).ljust(page_size, b'\0')
+            self.map[offset:offset + page_size] = data
+        self.writes += 1
+        self.bytes_written += page_size
+        return slot
+
+    def read(self, key, release=True):
+        """
+        Lee una página de su ranura.
+        Args:
+            key (tuple): (pid, página).
+            release (bool): Liberar la ranura después de leerla.
+        Returns:
+            bytes or None: Contenido de la página, o None si no estaba en swap.
+        """
+        slot = self.slots.get(key)
+        if slot is None:
+            return None
+        offset = slot * self.page_size
+        data = self.map[offset:offset + self.page_size]
+        self.reads += 1
+        self.bytes_read += self.page_size
+        if release:
+            del self.slots[key]
+            self.release(slot)
+        return data
+
+    def free(self, key):
+        """
+        Libera la ranura de una página sin leerla.
+        Returns:
+            bool: True si la página estaba en swap.
+        """
+        slot = self.slots.pop(key, None)
+        if slot is None:
+            return False
+        self.release(slot)
+        return True
+
+    def get_statistics(self):
+        """
+        Obtiene las estadísticas de E/S y ocupación del dispositivo.
+        Returns:
+            dict: Lecturas, escrituras, bytes transferidos, clústeres, rechazos por swap
+            lleno y tamaño del archivo.
+        """
+        return {
+            'swap_reads': self.reads,
+            'swap_writes': self.writes,
+            'swap_bytes_read': self.bytes_read,
+            'swap_bytes_written': self.bytes_written,
+            'swap_clusters': self.clusters,
+            'swap_full_rejections': self.full_rejections,
+            'swap_file_bytes': self.mapped_slots * self.page_size,
+        }
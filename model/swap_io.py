@@ -0,0 +1,413 @@
+import argparse
+import asyncio
+import json
+import random
+import selectors
+import sys
+
+from model.config import MachineConfig
+from model.memory import MemorySimulator
+from model.policies import available_policies
+from model.workload import WORKLOAD_PATTERNS, RANDOM_PATTERN, generate_addresses, generate_writes
+
+# Límites superiores (en µs) de los intervalos del histograma de tiempos de servicio.
+HISTOGRAM_BOUNDS_US = tuple(2 ** exponent for exponent in range(0, 24))
+
+
+class _VirtualSelector(selectors.BaseSelector):
+    """
+    Selector que nunca espera: en vez de bloquearse hasta el próximo temporizador adelanta
+    el reloj virtual del bucle. Guarda los registros (el bucle registra su self-pipe) pero
+    nunca informa eventos de E/S.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.keys = {}
+
+    def register(self, fileobj, events, data=None):
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        key = selectors.SelectorKey(fileobj, fd, events, data)
+        self.keys[fd] = key
+        return key
+
+    def unregister(self, fileobj):
+        return self.keys.pop(fileobj if isinstance(fileobj, int) else fileobj.fileno())
+
+    def select(self, timeout=None):
+        if timeout is None:
+            raise RuntimeError("La simulación quedó bloqueada: ninguna tarea puede avanzar.")
+        self.loop.virtual_time += timeout
+        return []
+
+    def get_map(self):
+        return self.keys
+
+    def close(self):
+        self.keys.clear()
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    Bucle de asyncio con reloj virtual: asyncio.sleep() y los temporizadores avanzan un
+    contador en lugar de esperar tiempo real, así que una simulación de horas de latencias
+    de disco corre tan rápido como el código que la ejecuta, y las corrutinas, semáforos y
+    colas de asyncio funcionan sin cambios.
+    """
+
+    def __init__(self):
+        self.virtual_time = 0.0
+        super().__init__(_VirtualSelector(self))
+
+    def time(self):
+        return self.virtual_time
+
+
+class SwapDeviceModel:
+    """
+    Modelo temporal de un dispositivo de swap. Cada operación tarda latency segundos más lo
+    que lleva transferir sus bytes; las latencias de hasta queue_depth operaciones en curso
+    se solapan, pero las transferencias comparten el ancho de banda y van una tras otra.
+    Las operaciones que exceden queue_depth esperan su turno en orden de llegada.
+    Se miden utilización (fracción del tiempo con alguna operación en curso), uso del ancho
+    de banda, ocupación media de la cola y espera antes de entrar al dispositivo.
+    """
+
+    def __init__(self, latency=100e-6, bandwidth=500e6, queue_depth=32):
+        """
+        Args:
+            latency (float): Latencia por operación en segundos.
+            bandwidth (float): Ancho de banda en bytes por segundo.
+            queue_depth (int): Operaciones que el dispositivo atiende a la vez.
+        """
+        if latency < 0:
+            raise ValueError(f"La latencia no puede ser negativa: {latency}")
+        if bandwidth <= 0:
+            raise ValueError(f"El ancho de banda debe ser positivo: {bandwidth}")
+        if queue_depth < 1:
+            raise ValueError(f"La profundidad de cola debe ser al menos 1: {queue_depth}")
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.queue_depth = queue_depth
+        self.slots = None
+        self.channel_free_at = 0.0
+        self.in_flight = 0
+        self.last_change = 0.0
+        self.busy_time = 0.0
+        self.in_flight_area = 0.0
+        self.transfer_time = 0.0
+        self.queue_wait = 0.0
+        self.max_queue_wait = 0.0
+        self.operations = {'read': 0, 'write': 0}
+        self.bytes = {'read': 0, 'write': 0}
+
+    def _track(self, now, delta):
+        elapsed = now - self.last_change
+        if self.in_flight:
+            self.busy_time += elapsed
+            self.in_flight_area += self.in_flight * elapsed
+        self.in_flight += delta
+        self.last_change = now
+
+    async def submit(self, operation, nbytes):
+        """
+        Envía una operación al dispositivo y espera a que termine.
+        Args:
+            operation (str): "read" o "write".
+            nbytes (int): Bytes a transferir.
+        Returns:
+            float: Segundos desde el envío hasta el final (espera en cola incluida).
+        """
+        loop = asyncio.get_running_loop()
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.queue_depth)
+        submitted = loop.time()
+        async with self.slots:
+            start = loop.time()
+            wait = start - submitted
+            self.queue_wait += wait
+            self.max_queue_wait = max(self.max_queue_wait, wait)
+            self._track(start, 1)
+            transfer = nbytes / self.bandwidth
+            finish = max(start + self.latency, self.channel_free_at) + transfer
+            self.channel_free_at = finish
+            self.transfer_time += transfer
+            await asyncio.sleep(finish - start)
+            self._track(loop.time(), -1)
+        self.operations[operation] += 1
+        self.bytes[operation] += nbytes
+        return loop.time() - submitted
+
+    def get_statistics(self, elapsed):
+        """
+        Obtiene las estadísticas del dispositivo.
+        Args:
+            elapsed (float): Duración total de la simulación en segundos.
+        Returns:
+            dict: Operaciones, bytes, utilización, uso del ancho de banda, ocupación media y esperas.
+        """
+        operations = self.operations['read'] + self.operations['write']
+        return {
+            'latency_us': self.latency * 1e6,
+            'bandwidth_bytes_per_second': self.bandwidth,
+            'queue_depth': self.queue_depth,
+            'reads': self.operations['read'],
+            'writes': self.operations['write'],
+            'bytes_read': self.bytes['read'],
+            'bytes_written': self.bytes['write'],
+            'utilization': self.busy_time / elapsed if elapsed > 0 else 0.0,
+            'bandwidth_utilization': self.transfer_time / elapsed if elapsed > 0 else 0.0,
+            'mean_in_flight': self.in_flight_area / elapsed if elapsed > 0 else 0.0,
+            'mean_queue_wait_us': self.queue_wait / operations * 1e6 if operations else 0.0,
+            'max_queue_wait_us': self.max_queue_wait * 1e6,
+        }
+
+
+def summarize_service_times(times):
+    """
+    Resume una lista de tiempos de servicio.
+    Args:
+        times (list): Tiempos en segundos.
+    Returns:
+        dict: count, media, percentiles 50/90/99, máximo (en µs) e histograma [límite_us, cantidad]
+        con intervalos de potencias de dos.
+    """
+    if not times:
+        return {'count': 0, 'mean_us': 0.0, 'p50_us': 0.0, 'p90_us': 0.0, 'p99_us': 0.0, 'max_us': 0.0,
+                'histogram': []}
+    ordered = sorted(times)
+    count = len(ordered)
+
+    def percentile(fraction):
+        return ordered[min(count - 1, int(fraction * count))] * 1e6
+
+    histogram = dict.fromkeys(HISTOGRAM_BOUNDS_US, 0)
+    overflow = 0
+    bounds = iter(HISTOGRAM_BOUNDS_US)
+    bound = next(bounds)
+    for value in ordered:
+        micros = value * 1e6
+        while bound is not None and micros > bound:
+            bound = next(bounds, None)
+        if bound is None:
+            overflow += 1
+        else:
+            histogram[bound] += 1
+    rows = [[bound, hits] for bound, hits in histogram.items() if hits]
+    if overflow:
+        rows.append([None, overflow])
+    return {
+        'count': count,
+        'mean_us': sum(ordered) / count * 1e6,
+        'p50_us': percentile(0.50),
+        'p90_us': percentile(0.90),
+        'p99_us': percentile(0.99),
+        'max_us': ordered[-1] * 1e6,
+        'histogram': rows,
+    }
+
+
+class AsyncSwapPipeline:
+    """
+    Ejecuta varios procesos sobre un simulador como corrutinas que comparten cpus CPUs y un
+    SwapDeviceModel. Cada acceso cuesta access_time segundos de CPU; cuando uno produce un
+    fallo de página, el proceso suelta la CPU y envía la E/S del fallo como petición
+    asíncrona (escritura de la víctima modificada, si la hubo, y lectura de la página, si
+    estaba en swap), de modo que los demás procesos siguen ejecutando mientras el fallo está
+    pendiente. Un proceso que no falla cede la CPU cada quantum segundos.
+    El estado del simulador se actualiza en el momento del fallo (la página queda asignada
+    a su marco mientras la E/S está en curso); la E/S solo determina cuándo sigue el proceso.
+    Los fallos sin E/S (primer acceso a una página) se cuentan como menores.
+    """
+
+    def __init__(self, simulator, device, cpus=1, access_time=100e-9, quantum=1e-3):
+        """
+        Args:
+            simulator (MemorySimulator): Simulador con los procesos ya creados.
+            device (SwapDeviceModel): Modelo del dispositivo de swap.
+            cpus (int): CPUs que ejecutan procesos a la vez.
+            access_time (float): Tiempo de CPU por acceso, en segundos.
+            quantum (float): Tiempo de CPU tras el cual un proceso cede la CPU.
+        """
+        if cpus < 1:
+            raise ValueError(f"Debe haber al menos una CPU: {cpus}")
+        self.simulator = simulator
+        self.device = device
+        self.cpus = cpus
+        self.access_time = access_time
+        self.quantum = quantum
+        self.cpu = None
+        self.cpu_time = 0.0
+        self.service_times = []
+        self.minor_faults = 0
+        self.finish_times = {}
+
+    async def run_process(self, pid, addresses, writes=None):
+        """
+        Corrutina de un proceso: ejecuta sus accesos y espera la E/S de cada fallo.
+        Args:
+            pid (str): Proceso.
+            addresses (secuencia): Direcciones virtuales.
+            writes (secuencia, opcional): Marca de escritura por acceso.
+        """
+        loop = asyncio.get_running_loop()
+        simulator = self.simulator
+        swap = simulator.swap_space
+        translate = simulator.translate_virtual_to_physical
+        access_time = self.access_time
+        await self.cpu.acquire()
+        pending = 0.0
+        for index, address in enumerate(addresses):
+            faults = simulator.page_faults
+            written = swap.bytes_written
+            read = swap.bytes_read
+            simulator.current_process = pid
+            translate(address, bool(writes[index]) if writes is not None else False)
+            pending += access_time
+            if simulator.page_faults != faults:
+                await self._run_cpu(pending)
+                pending = 0.0
+                self.cpu.release()
+                issued = loop.time()
+                written = swap.bytes_written - written
+                read = swap.bytes_read - read
+                if written:
+                    await self.device.submit('write', written)
+                if read:
+                    await self.device.submit('read', read)
+                if written or read:
+                    self.service_times.append(loop.time() - issued)
+                else:
+                    self.minor_faults += 1
+                await self.cpu.acquire()
+            elif pending >= self.quantum:
+                await self._run_cpu(pending)
+                pending = 0.0
+                self.cpu.release()
+                await self.cpu.acquire()
+        await self._run_cpu(pending)
+        self.cpu.release()
+        self.finish_times[pid] = loop.time()
+
+    async def _run_cpu(self, seconds):
+        if seconds > 0:
+            self.cpu_time += seconds
+            await asyncio.sleep(seconds)
+
+    async def _run_all(self, workloads):
+        self.cpu = asyncio.Semaphore(self.cpus)
+        await asyncio.gather(*(self.run_process(pid, addresses, writes)
+                               for pid, addresses, writes in workloads))
+
+    def run(self, workloads):
+        """
+        Ejecuta los procesos hasta que todos terminan, en tiempo virtual.
+        Args:
+            workloads (list): (pid, direcciones, marcas de escritura o None) por proceso.
+        Returns:
+            dict: Tiempo virtual, accesos, fallos mayores y menores, distribución del tiempo de
+            servicio de fallos, uso de CPU, estadísticas del dispositivo, fin de cada proceso y
+            estadísticas del simulador.
+        """
+        loop = VirtualTimeLoop()
+        try:
+            loop.run_until_complete(self._run_all(workloads))
+            elapsed = loop.time()
+        finally:
+            loop.close()
+        return {
+            'elapsed_seconds': elapsed,
+            'accesses': sum(len(addresses) for _, addresses, _ in workloads),
+            'major_faults': len(self.service_times),
+            'minor_faults': self.minor_faults,
+            'fault_service': summarize_service_times(self.service_times),
+            'cpu_utilization': self.cpu_time / (elapsed * self.cpus) if elapsed > 0 else 0.0,
+            'device': self.device.get_statistics(elapsed),
+            'process_finish_seconds': dict(self.finish_times),
+            'statistics': self.simulator.get_statistics(),
+        }
+
+
+def synthetic_workloads(simulator, processes, pattern, accesses, write_ratio=0.0, seed=None, size_kb=None):
+    """
+    Crea procesos en el simulador y genera la carga sintética de cada uno.
+    Args:
+        simulator (MemorySimulator): Simulador vacío.
+        processes (int): Número de procesos.
+        pattern (str): Uno de WORKLOAD_PATTERNS.
+        accesses (int): Accesos por proceso.
+        write_ratio (float): Fracción de escrituras.
+        seed (int, opcional): Semilla.
+        size_kb (int, opcional): Tamaño de cada proceso; por defecto el máximo espacio virtual.
+    Returns:
+        list: (pid, direcciones, marcas de escritura o None) por proceso.
+    """
+    rng = random.Random(seed)
+    if size_kb is None:
+        size_kb = simulator.virtual_page_limit() * simulator.page_size // 1024
+    workloads = []
+    for index in range(1, processes + 1):
+        pid = str(index)
+        success, message = simulator.create_process(pid, size_kb)
+        if not success:
+            raise ValueError(message)
+        pages = simulator.processes[pid]['pages_needed']
+        addresses = generate_addresses(pattern, accesses, pages, simulator.page_size, rng.getrandbits(64))
+        writes = generate_writes(accesses, write_ratio, rng.getrandbits(64))
+        workloads.append((pid, addresses, writes))
+    return workloads
+
+
+def main(argv=None):
+    """
+    Punto de entrada: simula la E/S de swap de una carga sintética con un dispositivo de
+    latencia, ancho de banda y profundidad de cola dados, e imprime el resultado en JSON.
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    Returns:
+        int: Código de salida.
+    """
+    parser = argparse.ArgumentParser(description="Simula la E/S asíncrona de swap y el tiempo de servicio de fallos.")
+    parser.add_argument("--frames", type=int, default=256, help="Marcos físicos")
+    parser.add_argument("--page-size", type=int, default=4096, help="Tamaño de página en bytes")
+    parser.add_argument("--virtual-pages", type=int, default=1024, help="Páginas virtuales por proceso")
+    parser.add_argument("--swap-pages", type=int, default=None, help="Capacidad de swap en páginas")
+    parser.add_argument("--algorithm", default="LRU", choices=available_policies(), help="Algoritmo de reemplazo")
+    parser.add_argument("--processes", type=int, default=4, help="Procesos concurrentes")
+    parser.add_argument("--accesses", type=int, default=20000, help="Accesos por proceso")
+    parser.add_argument("--pattern", choices=WORKLOAD_PATTERNS, default=RANDOM_PATTERN, help="Patrón de acceso")
+    parser.add_argument("--write-ratio", type=float, default=0.3, help="Fracción de escrituras")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--latency-us", type=float, default=100.0, help="Latencia por operación en µs")
+    parser.add_argument("--bandwidth-mbps", type=float, default=500.0, help="Ancho de banda en MB/s")
+    parser.add_argument("--queue-depth", type=int, default=32, help="Operaciones simultáneas en el dispositivo")
+    parser.add_argument("--cpus", type=int, default=1, help="CPUs")
+    parser.add_argument("--access-ns", type=float, default=100.0, help="Tiempo de CPU por acceso en ns")
+    parser.add_argument("--output", default=None, help="Archivo donde escribir el JSON (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        config = MachineConfig(page_size=args.page_size, physical_pages=args.frames,
+                               virtual_pages=args.virtual_pages, swap_pages=args.swap_pages)
+        simulator = MemorySimulator(config)
+        simulator.set_replacement_algorithm(args.algorithm)
+        workloads = synthetic_workloads(simulator, args.processes, args.pattern, args.accesses,
+                                        args.write_ratio, args.seed)
+        device = SwapDeviceModel(args.latency_us * 1e-6, args.bandwidth_mbps * 1e6, args.queue_depth)
+        pipeline = AsyncSwapPipeline(simulator, device, args.cpus, args.access_ns * 1e-9)
+        result = pipeline.run(workloads)
+    except ValueError as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    result['config'] = config.to_dict()
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from model.config import MachineConfig
+from model.memory import MemorySimulator
+from model.policies import available_policies
+from model.trace import TraceReader, TRACE_FORMATS, TEXT_FORMAT, RAW_FORMAT, run_trace, write_raw_trace
+from model.workload import WORKLOAD_PATTERNS, generate_addresses
+
+# Parámetros que puede barrer una grilla, además de la carga ('workload').
+SWEEP_PARAMETERS = ('algorithm',) + MachineConfig.FIELDS
+RESULT_COLUMNS = ('accesses', 'page_faults', 'hit_rate', 'fault_rate', 'swaps_in', 'swaps_out',
+                  'clean_evictions', 'swap_bytes_read', 'swap_bytes_written', 'elapsed_seconds',
+                  'accesses_per_second')
+
+
+class Workload:
+    """
+    Carga de un barrido: un archivo de traza que cada proceso de trabajo abre por su cuenta
+    (TraceReader lo mapea en memoria), así que las direcciones nunca se serializan hacia
+    los procesos y todos comparten las mismas páginas de la caché del sistema.
+    """
+
+    def __init__(self, name, path, trace_format=TEXT_FORMAT, process_size_kb=None):
+        """
+        Args:
+            name (str): Nombre de la carga en la tabla de resultados.
+            path (str): Ruta del archivo de traza.
+            trace_format (str): Uno de TRACE_FORMATS.
+            process_size_kb (int, opcional): Tamaño de los procesos de la traza; por defecto
+                el máximo espacio virtual de cada configuración.
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Formato de traza desconocido: {trace_format}")
+        self.name = name
+        self.path = path
+        self.trace_format = trace_format
+        self.process_size_kb = process_size_kb
+
+
+def synthetic_workloads(patterns, accesses, span_kb, directory, seed=None, page_size=4096):
+    """
+    Genera una vez cada carga sintética y la guarda como traza "raw" en un directorio.
+    Args:
+        patterns (list): Patrones de model.workload.
+        accesses (int): Accesos por carga.
+        span_kb (int): Tamaño del espacio de direcciones recorrido (y de los procesos).
+        directory (str): Directorio donde escribir las trazas.
+        seed (int, opcional): Semilla de las cargas aleatorias.
+        page_size (int): Granularidad con la que se generan las direcciones.
+    Returns:
+        list: Workload por patrón.
+    """
+    workloads = []
+    pages = max(1, span_kb * 1024 // page_size)
+    for pattern in patterns:
+        path = os.path.join(directory, f"{pattern}.raw")
+        write_raw_trace(path, generate_addresses(pattern, accesses, pages, page_size, seed))
+        workloads.append(Workload(pattern, path, RAW_FORMAT, span_kb))
+    return workloads
+
+
+def expand_grid(grid, workloads):
+    """
+    Obtiene todas las combinaciones de la grilla para cada carga.
+    Args:
+        grid (dict): {parámetro: lista de valores}, con parámetros de SWEEP_PARAMETERS.
+        workloads (list): Workload a evaluar.
+    Returns:
+        list: Un diccionario de parámetros por ejecución, con la clave 'workload'.
+    Raises:
+        ValueError: Si la grilla tiene parámetros desconocidos.
+    """
+    unknown = set(grid) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parámetros de barrido desconocidos: {', '.join(sorted(unknown))}")
+    names = [name for name in SWEEP_PARAMETERS if name in grid]
+    points = []
+    for workload in workloads:
+        for values in itertools.product(*(grid[name] for name in names)):
+            point = {'workload': workload.name}
+            point.update(zip(names, values))
+            points.append(point)
+    return points
+
+
+def run_point(point, workload, base_config=None):
+    """
+    Ejecuta una combinación de la grilla sobre un simulador nuevo. Es la unidad de trabajo
+    de los procesos del barrido.
+    Args:
+        point (dict): Parámetros de la ejecución (ver expand_grid).
+        workload (Workload): Carga a reproducir.
+        base_config (dict, opcional): Valores de MachineConfig para lo que la grilla no fija.
+    Returns:
+        dict: Parámetros más las columnas de RESULT_COLUMNS.
+    """
+    settings = dict(base_config or {})
+    settings.update((name, point[name]) for name in MachineConfig.FIELDS if name in point)
+    config = MachineConfig.from_dict(settings)
+    if workload.process_size_kb is not None:
+        # La carga fija el tamaño de los procesos: las tablas planas deben alcanzarlo.
+        pages = (workload.process_size_kb * 1024 + config.page_size - 1) // config.page_size
+        if pages > config.virtual_pages:
+            config = config.replace(virtual_pages=pages)
+    reader = TraceReader(workload.path, workload.trace_format)
+    result = run_trace(reader, point.get('algorithm', "FIFO"), workload.process_size_kb,
+                       simulator=MemorySimulator(config))
+    statistics = result['statistics']
+    row = dict(point)
+    for column in RESULT_COLUMNS:
+        row[column] = result[column] if column in result else statistics[column]
+    return row
+
+
+def run_sweep(grid, workloads, base_config=None, workers=None, progress_callback=None):
+    """
+    Ejecuta todas las combinaciones de la grilla repartidas en un grupo de procesos. Cada
+    ejecución es independiente, así que el barrido escala con los núcleos disponibles.
+    Args:
+        grid (dict): {parámetro: lista de valores}.
+        workloads (list): Workload a evaluar.
+        base_config (MachineConfig, opcional): Valores para lo que la grilla no fija.
+        workers (int, opcional): Procesos de trabajo; por defecto uno por núcleo, y con 1 se
+            ejecuta todo en el proceso actual.
+        progress_callback (callable, opcional): Recibe (terminadas, total).
+    Returns:
+        list: Una fila por combinación, en el orden de expand_grid.
+    """
+    points = expand_grid(grid, workloads)
+    by_name = {workload.name: workload for workload in workloads}
+    base = base_config.to_dict() if base_config is not None else None
+    rows = [None] * len(points)
+    if workers == 1:
+        for index, point in enumerate(points):
+            rows[index] = run_point(point, by_name[point['workload']], base)
+            if progress_callback:
+                progress_callback(index + 1, len(points))
+        return rows
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_point, point, by_name[point['workload']], base): index
+                   for index, point in enumerate(points)}
+        for finished, future in enumerate(as_completed(futures), 1):
+            rows[futures[future]] = future.result()
+            if progress_callback:
+                progress_callback(finished, len(points))
+    return rows
+
+
+def format_table(rows):
+    """
+    Da formato de tabla de texto a los resultados de un barrido.
+    Args:
+        rows (list): Filas de run_sweep.
+    Returns:
+        str: Tabla con una línea por ejecución.
+    """
+    if not rows:
+        return ""
+    columns = list(rows[0])
+    cells = [[f"{row[column]:.4g}" if isinstance(row[column], float) else str(row[column])
+              for column in columns] for row in rows]
+    widths = [max(len(column), *(len(line[i]) for line in cells)) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines.extend("  ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in cells)
+    return "\n".join(lines)
+
+
+def write_results(path, rows):
+    """
+    Guarda los resultados de un barrido en CSV o, si la ruta termina en .json, en JSON.
+    Args:
+        path (str): Ruta del archivo.
+        rows (list): Filas de run_sweep.
+    """
+    with open(path, 'w', encoding='utf-8', newline='') as output_file:
+        if path.endswith('.json'):
+            json.dump(rows, output_file, indent=2)
+        elif rows:
+            writer = csv.DictWriter(output_file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+def main(argv=None):
+    """
+    Punto de entrada sin interfaz gráfica: barre políticas × marcos × tamaños de página × cargas.
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del simulador MMU en paralelo.")
+    parser.add_argument("--algorithms", nargs="+", default=["FIFO", "LRU"],
+                        choices=available_policies(include_offline=True), help="Algoritmos de reemplazo")
+    parser.add_argument("--frames", nargs="+", type=int, default=[16, 64, 256], help="Marcos físicos")
+    parser.add_argument("--page-sizes", nargs="+", type=int, default=[4096], help="Tamaños de página")
+    parser.add_argument("--trace", action="append", default=[], help="Traza a incluir (repetible)")
+    parser.add_argument("--format", choices=TRACE_FORMATS, default=TEXT_FORMAT, help="Formato de las trazas")
+    parser.add_argument("--patterns", nargs="*", default=None, choices=WORKLOAD_PATTERNS,
+                        help="Cargas sintéticas (por defecto todas si no se da --trace)")
+    parser.add_argument("--accesses", type=int, default=100000, help="Accesos de cada carga sintética")
+    parser.add_argument("--span-kb", type=int, default=4096, help="Espacio recorrido por las cargas sintéticas")
+    parser.add_argument("--size-kb", type=int, default=None, help="Tamaño de los procesos de las trazas")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla de las cargas sintéticas")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos de trabajo (por defecto, núcleos)")
+    parser.add_argument("--output", default=None, help="Archivo CSV o JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    grid = {'algorithm': args.algorithms, 'physical_pages': args.frames, 'page_size': args.page_sizes}
+    patterns = args.patterns if args.patterns is not None else ([] if args.trace else list(WORKLOAD_PATTERNS))
+    with tempfile.TemporaryDirectory(prefix="mmu-sweep-") as directory:
+        workloads = [Workload(os.path.basename(path), path, args.format, args.size_kb) for path in args.trace]
+        workloads += synthetic_workloads(patterns, args.accesses, args.span_kb, directory, args.seed,
+                                         min(args.page_sizes))
+        start = time.perf_counter()
+        rows = run_sweep(grid, workloads, workers=args.workers,
+                         progress_callback=lambda done, total: print(f"\r{done}/{total}", end="", file=sys.stderr))
+        print(f"\n{len(rows)} ejecuciones en {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    if args.output:
+        write_results(args.output, rows)
+    else:
+        print(format_table(rows))
+
+
+if __name__ == "__main__":
+    main()
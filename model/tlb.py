@@ -0,0 +1,183 @@
+import random
+from operator import itemgetter
+
+LAST_USE = itemgetter(1)
+
+TLB_REPLACEMENTS = ("LRU", "FIFO", "Random")
+
+
+class TLB:
+    """
+    TLB asociativo por conjuntos consultado antes de la tabla de páginas. Las traducciones
+    de cada ASID viven en un diccionario {página: [marco, último uso, tabla, asid, página]}
+    y el del proceso activo queda en current, así que un acierto es una sola búsqueda por
+    entero; los conjuntos guardan las mismas entradas en orden de inserción y solo se
+    recorren al reemplazar, lo que ocurre únicamente en fallos.
+    Con etiquetado por ASID las entradas de distintos procesos conviven; sin él, cambiar de
+    proceso vacía el TLB. Como en el hardware, cada entrada recuerda dónde está su entrada de
+    la tabla de páginas para actualizar los bits de referencia sin recorrerla.
+    """
+
+    def __init__(self, entries=16, associativity=4, replacement="LRU", asid_tagging=True, seed=None):
+        """
+        Args:
+            entries (int): Número total de entradas.
+            associativity (int): Vías por conjunto; igual a entries para totalmente asociativo.
+            replacement (str): "LRU", "FIFO" o "Random".
+            asid_tagging (bool): Etiquetar las entradas con el PID en vez de vaciar al cambiar de proceso.
+            seed (int, opcional): Semilla del reemplazo aleatorio.
+        """
+        if entries <= 0:
+            raise ValueError("El TLB debe tener al menos una entrada.")
+        if associativity <= 0 or associativity > entries or entries % associativity:
+            raise ValueError("La asociatividad debe dividir el número de entradas.")
+        if replacement not in TLB_REPLACEMENTS:
+            raise ValueError(f"Reemplazo de TLB desconocido: {replacement}")
+        self.entries = entries
+        self.associativity = associativity
+        self.replacement = replacement
+        self.tracks_use = replacement == "LRU"
+        self.asid_tagging = asid_tagging
+        self.set_count = entries // associativity
+        self.sets = [[] for _ in range(self.set_count)]
+        self.translations = {}
+        self.current = {}
+        self.random = random.Random(seed)
+        self.current_asid = None
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.shootdowns = 0
+
+    def switch(self, asid):
+        """
+        Registra el proceso que usa el TLB; sin etiquetado por ASID, un cambio lo vacía.
+        Args:
+            asid (str): PID del proceso.
+        """
+        if asid != self.current_asid:
+            if not self.asid_tagging and self.current_asid is not None:
+                self.flush()
+            self.current_asid = asid
+            self.current = self.translations.setdefault(asid, {})
+
+    def lookup(self, asid, page):
+        """
+        Busca la traducción de una página.
+        Args:
+            asid (str): PID del proceso.
+            page (int): Número de página virtual.
+        Returns:
+            int or None: Marco físico o None si no está en el TLB.
+        """
+        if asid != self.current_asid:
+            self.switch(asid)
+        entry = self.current.get(page)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.tracks_use:
+            self.clock += 1
+            entry[1] = self.clock
+        return entry[0]
+
+    def probe(self, asid, page):
+        """
+        Consulta si una página está en el TLB sin alterar contadores ni orden.
+        Args:
+            asid (str): PID del proceso.
+            page (int): Número de página virtual.
+        Returns:
+            int or None: Marco físico o None.
+        """
+        if not self.asid_tagging and asid != self.current_asid:
+            return None
+        entry = self.translations.get(asid, {}).get(page)
+        return None if entry is None else entry[0]
+
+    def insert(self, asid, page, frame, page_table=None):
+        """
+        Agrega una traducción, reemplazando una entrada del conjunto si está lleno.
+        Args:
+            asid (str): PID del proceso.
+            page (int): Número de página virtual.
+            frame (int): Marco físico.
+            page_table (PageTable, opcional): Tabla de páginas que contiene la entrada.
+        """
+        if asid != self.current_asid:
+            self.switch(asid)
+        self.clock += 1
+        entry = self.current.get(page)
+        if entry is not None:
+            entry[0] = frame
+            entry[1] = self.clock
+            entry[2] = page_table
+            return
+        tlb_set = self.sets[page % self.set_count]
+        if len(tlb_set) >= self.associativity:
+            if self.replacement == "LRU":
+                victim = min(tlb_set, key=LAST_USE)
+            elif self.replacement == "FIFO":
+                victim = tlb_set[0]
+            else:
+                victim = self.random.choice(tlb_set)
+            tlb_set.remove(victim)
+            del self.translations[victim[3]][victim[4]]
+        entry = [frame, self.clock, page_table, asid, page]
+        tlb_set.append(entry)
+        self.current[page] = entry
+
+    def access(self, asid, page, frame, page_table=None):
+        """
+        Busca una página cuya traducción ya se conoce e inserta la entrada si falla.
+        Args:
+            asid (str): PID del proceso.
+            page (int): Número de página virtual.
+            frame (int): Marco físico de la página.
+            page_table (PageTable, opcional): Tabla de páginas que contiene la entrada.
+        Returns:
+            bool: True si fue acierto de TLB.
+        """
+        if self.lookup(asid, page) is None:
+            self.insert(asid, page, frame, page_table)
+            return False
+        return True
+
+    def invalidate(self, asid, page):
+        """
+        Elimina la traducción de una página desalojada (shootdown).
+        Args:
+            asid (str): PID del proceso.
+            page (int): Número de página virtual.
+        """
+        entry = self.translations.get(asid, {}).pop(page, None)
+        if entry is not None:
+            self.sets[page % self.set_count].remove(entry)
+            self.shootdowns += 1
+
+    def flush(self):
+        """
+        Vacía todas las entradas.
+        """
+        for tlb_set in self.sets:
+            tlb_set.clear()
+        for translations in self.translations.values():
+            translations.clear()
+        self.flushes += 1
+
+    def get_statistics(self):
+        """
+        Obtiene los contadores del TLB.
+        Returns:
+            dict: Aciertos, fallos, tasa de aciertos, vaciados y shootdowns.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'tlb_hits': self.hits,
+            'tlb_misses': self.misses,
+            'tlb_hit_rate': (self.hits / lookups) * 100 if lookups else 0,
+            'tlb_flushes': self.flushes,
+            'tlb_shootdowns': self.shootdowns
+        }
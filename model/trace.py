@@ -0,0 +1,440 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+from model.config import MachineConfig
+from model.memory import MemorySimulator
+from model.policies import available_policies, build_next_use, create_policy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TEXT_FORMAT = "lackey"
+RAW_FORMAT = "raw"
+TAGGED_FORMAT = "tagged"
+TRACE_FORMATS = (TEXT_FORMAT, RAW_FORMAT, TAGGED_FORMAT)
+
+# Registro binario "tagged": pid (uint32), banderas (uint32, bit 0 = escritura), dirección (int64).
+TAGGED_RECORD = struct.Struct("<IIq")
+# Las direcciones se guardan como int64; las de texto se recortan a 63 bits.
+ADDRESS_MASK = (1 << 63) - 1
+RAW_RECORD_SIZE = 8
+WRITE_OPERATIONS = (b"S", b"M")
+
+
+class TraceReader:
+    def __init__(self, path, trace_format=TEXT_FORMAT, default_pid="1", chunk_size=1 << 20):
+        """
+        Lector de trazas de referencias a memoria respaldado por un archivo mapeado en memoria.
+        Formatos soportados:
+            lackey: texto estilo Valgrind lackey ("I 0400d7d4,8", " L 7ff000398,8"), con un
+                    PID opcional como primera columna ("P2 S 7ff000398,8").
+            raw:    direcciones uint64 little-endian consecutivas, todas de lectura.
+            tagged: registros binarios <pid uint32, banderas uint32, dirección int64>.
+        Args:
+            path (str): Ruta del archivo de traza.
+            trace_format (str): Uno de TRACE_FORMATS.
+            default_pid (str): PID asignado a registros que no indican proceso.
+            chunk_size (int): Bytes decodificados por bloque.
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Formato de traza desconocido: {trace_format}")
+        self.path = path
+        self.trace_format = trace_format
+        self.default_pid = default_pid
+        self.chunk_size = max(int(chunk_size), TAGGED_RECORD.size)
+
+    def runs(self):
+        """
+        Recorre la traza por bloques sin cargarla completa en memoria.
+        Yields:
+            tuple: (pid, direcciones, escrituras) para cada racha consecutiva de registros
+            del mismo proceso; direcciones es array('q') y escrituras un bytearray.
+        """
+        if os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb") as trace_file:
+            with mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if self.trace_format == TEXT_FORMAT:
+                    yield from self._decode_text(self._text_chunks(mapped))
+                elif self.trace_format == RAW_FORMAT:
+                    yield from self._decode_raw(mapped)
+                else:
+                    yield from self._decode_tagged(mapped)
+
+    def _text_chunks(self, mapped):
+        """
+        Divide el mapa de memoria en bloques de texto que terminan en un salto de línea.
+        Yields:
+            bytes: Bloque de líneas completas.
+        """
+        size = len(mapped)
+        position = 0
+        while position < size:
+            end = min(position + self.chunk_size, size)
+            if end < size:
+                newline = mapped.rfind(b"\n", position, end)
+                if newline == -1:
+                    newline = mapped.find(b"\n", end)
+                    end = size if newline == -1 else newline + 1
+                else:
+                    end = newline + 1
+            yield mapped[position:end]
+            position = end
+
+    def _decode_text(self, chunks):
+        """
+        Decodifica bloques de texto lackey en rachas por proceso.
+        Args:
+            chunks (iterable): Bloques de bytes con líneas completas.
+        Yields:
+            tuple: (pid, direcciones, escrituras).
+        """
+        default_pid = self.default_pid
+        for chunk in chunks:
+            pid = None
+            addresses = array("q")
+            writes = bytearray()
+            for line in chunk.split(b"\n"):
+                parts = line.split()
+                if not parts or parts[0].startswith(b"="):
+                    continue
+                if len(parts) == 3:
+                    record_pid = parts[0].decode()
+                    operation, operand = parts[1], parts[2]
+                elif len(parts) == 2:
+                    record_pid = default_pid
+                    operation, operand = parts
+                else:
+                    continue
+                try:
+                    address = int(operand.split(b",", 1)[0], 16) & ADDRESS_MASK
+                except ValueError:
+                    continue
+                if record_pid != pid:
+                    if addresses:
+                        yield pid, addresses, writes
+                        addresses = array("q")
+                        writes = bytearray()
+                    pid = record_pid
+                addresses.append(address)
+                writes.append(operation in WRITE_OPERATIONS)
+            if addresses:
+                yield pid, addresses, writes
+
+    def _decode_raw(self, mapped):
+        """
+        Decodifica direcciones uint64 en bloques de tamaño fijo.
+        Yields:
+            tuple: (pid, direcciones, escrituras).
+        """
+        records_per_chunk = max(1, self.chunk_size // RAW_RECORD_SIZE)
+        total = len(mapped) // RAW_RECORD_SIZE
+        for first in range(0, total, records_per_chunk):
+            count = min(records_per_chunk, total - first)
+            start = first * RAW_RECORD_SIZE
+            addresses = array("q")
+            addresses.frombytes(mapped[start:start + count * RAW_RECORD_SIZE])
+            if sys.byteorder != "little":
+                addresses.byteswap()
+            yield self.default_pid, addresses, bytearray(count)
+
+    def _decode_tagged(self, mapped):
+        """
+        Decodifica registros binarios con PID y separa las rachas de cada proceso.
+        Yields:
+            tuple: (pid, direcciones, escrituras).
+        """
+        record_size = TAGGED_RECORD.size
+        records_per_chunk = max(1, self.chunk_size // record_size)
+        total = len(mapped) // record_size
+        for first in range(0, total, records_per_chunk):
+            count = min(records_per_chunk, total - first)
+            start = first * record_size
+            block = mapped[start:start + count * record_size]
+            pid = None
+            addresses = array("q")
+            writes = bytearray()
+            for raw_pid, flags, address in TAGGED_RECORD.iter_unpack(block):
+                if raw_pid != pid:
+                    if addresses:
+                        yield str(pid), addresses, writes
+                        addresses = array("q")
+                        writes = bytearray()
+                    pid = raw_pid
+                addresses.append(address)
+                writes.append(flags & 1)
+            if addresses:
+                yield str(pid), addresses, writes
+
+
+def write_raw_trace(path, addresses):
+    """
+    Escribe direcciones en formato "raw" (uint64 little-endian), para reproducirlas después
+    con TraceReader sin decodificar texto.
+    Args:
+        path (str): Ruta del archivo.
+        addresses (iterable): Direcciones virtuales.
+    Returns:
+        int: Número de direcciones escritas.
+    """
+    records = array("q", addresses)
+    if sys.byteorder != "little":
+        records.byteswap()
+    with open(path, "wb") as trace_file:
+        records.tofile(trace_file)
+    return len(records)
+
+
+def replay_trace(simulator, reader, process_size_kb=None, fold=True, progress_callback=None):
+    """
+    Alimenta el simulador con una traza por rachas, cambiando el proceso activo según cada registro.
+    Args:
+        simulator (MemorySimulator): Simulador a alimentar.
+        reader (TraceReader): Lector de la traza.
+        process_size_kb (int, opcional): Tamaño con el que se crean los procesos que aparecen
+            en la traza y no existen; por defecto el máximo espacio virtual.
+        fold (bool): Si es True, las direcciones se reducen módulo el tamaño del proceso para
+            que las trazas reales caigan dentro del espacio simulado.
+        progress_callback (callable, opcional): Recibe el número de accesos procesados.
+    Returns:
+        dict: Accesos procesados, registros descartados, tiempo transcurrido, accesos por segundo
+        y estadísticas finales del simulador.
+    """
+    accesses = 0
+    skipped = 0
+    start = time.perf_counter()
+    for pid, addresses, writes in reader.runs():
+        process_data, addresses = _prepare_run(simulator, pid, addresses, process_size_kb, fold)
+        if process_data is None:
+            skipped += len(addresses)
+            continue
+        simulator.current_process = pid
+        simulator.access_batch(pid, addresses, writes)
+        accesses += len(addresses)
+        if progress_callback:
+            progress_callback(accesses)
+    elapsed = time.perf_counter() - start
+    return {
+        'accesses': accesses,
+        'skipped': skipped,
+        'elapsed_seconds': elapsed,
+        'accesses_per_second': accesses / elapsed if elapsed > 0 else 0.0,
+        'statistics': simulator.get_statistics()
+    }
+
+
+def replay_trace_optimal(simulator, reader, process_size_kb=None, fold=True, progress_callback=None):
+    """
+    Reproduce una traza con el reemplazo óptimo de Belady. Una primera pasada sobre la traza
+    obtiene la página de cada acceso y construye el índice de próximo uso; la segunda la
+    reproduce como replay_trace con la política OPT, de modo que las estadísticas son
+    comparables con las de cualquier otro algoritmo.
+    Args:
+        simulator (MemorySimulator): Simulador a alimentar.
+        reader (TraceReader): Lector de la traza (se recorre dos veces).
+        process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+        progress_callback (callable, opcional): Recibe el número de accesos procesados.
+    Returns:
+        dict: Igual que replay_trace, más el tiempo de preprocesamiento.
+    """
+    start = time.perf_counter()
+    keys = collect_page_keys(simulator, reader, process_size_kb, fold)
+    policy = create_policy("OPT", simulator)
+    policy.set_future(build_next_use(keys))
+    simulator.set_policy(policy)
+    preprocessing = time.perf_counter() - start
+    result = replay_trace(simulator, reader, process_size_kb, fold, progress_callback)
+    result['preprocessing_seconds'] = preprocessing
+    return result
+
+
+def collect_page_keys(simulator, reader, process_size_kb=None, fold=True):
+    """
+    Obtiene en un solo arreglo los identificadores de página de toda la traza.
+    Args:
+        simulator (MemorySimulator): Simulador donde se crean los procesos.
+        reader (TraceReader): Lector de la traza.
+        process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+    Returns:
+        array.array: Identificadores de página en orden de acceso.
+    """
+    keys = array("q")
+    for chunk in iter_page_keys(simulator, reader, process_size_kb, fold):
+        keys.extend(chunk)
+    return keys
+
+
+def iter_page_keys(simulator, reader, process_size_kb=None, fold=True):
+    """
+    Recorre la traza y produce un identificador entero por cada acceso que el simulador
+    contará, creando los procesos como lo haría replay_trace. Cada par (pid, página) recibe
+    un identificador denso en orden de primera aparición, así que dos procesos nunca
+    comparten identificador sea cual sea el ancho de sus números de página.
+    Args:
+        simulator (MemorySimulator): Simulador donde se crean los procesos.
+        reader (TraceReader): Lector de la traza.
+        process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+    Yields:
+        array.array: Identificadores de página de cada racha, en orden de acceso.
+    """
+    page_ids = {}
+    page_size = simulator.page_size
+    for pid, addresses, _ in reader.runs():
+        process_data, addresses = _prepare_run(simulator, pid, addresses, process_size_kb, fold)
+        if process_data is None:
+            continue
+        limit = process_data['pages_needed']
+        keys = array("q")
+        if np is not None:
+            pages = np.asarray(addresses, dtype=np.int64) // page_size
+            pages = pages[(pages >= 0) & (pages < limit)]
+            unique_pages, inverse = np.unique(pages, return_inverse=True)
+            run_ids = np.array([page_ids.setdefault((pid, page), len(page_ids))
+                                for page in unique_pages.tolist()], dtype=np.int64)
+            keys.frombytes(run_ids[inverse].tobytes())
+        else:
+            for address in addresses:
+                page = address // page_size
+                if 0 <= page < limit:
+                    keys.append(page_ids.setdefault((pid, page), len(page_ids)))
+        yield keys
+
+
+def _prepare_run(simulator, pid, addresses, process_size_kb, fold):
+    """
+    Asegura que el proceso de una racha exista y ajusta sus direcciones.
+    Args:
+        simulator (MemorySimulator): Simulador.
+        pid (str): Proceso de la racha.
+        addresses (array.array): Direcciones de la racha.
+        process_size_kb (int or None): Tamaño para crear el proceso si no existe.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+    Returns:
+        tuple: (datos del proceso o None si no pudo crearse, direcciones a usar).
+    """
+    process_data = simulator.processes.get(pid)
+    if process_data is None:
+        if process_size_kb is None:
+            process_size_kb = simulator.virtual_page_limit() * simulator.page_size // 1024
+        success, _ = simulator.create_process(pid, process_size_kb)
+        if not success:
+            return None, addresses
+        process_data = simulator.processes[pid]
+    if fold:
+        addresses = _fold_addresses(addresses, process_data['pages_needed'] * simulator.page_size)
+    return process_data, addresses
+
+
+def _fold_addresses(addresses, span):
+    """
+    Reduce las direcciones de una racha módulo el tamaño del espacio virtual del proceso.
+    Args:
+        addresses (array.array): Direcciones originales.
+        span (int): Tamaño en bytes del espacio virtual del proceso.
+    Returns:
+        numpy.ndarray | array.array: Direcciones dentro de [0, span).
+    """
+    if np is not None:
+        return np.frombuffer(addresses, dtype=np.int64) % span
+    return array("q", [address % span for address in addresses])
+
+
+def main(argv=None):
+    """
+    Punto de entrada sin interfaz gráfica: reproduce una traza e imprime el resultado en JSON.
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Reproduce una traza de referencias a memoria en el simulador MMU.")
+    parser.add_argument("trace", help="Archivo de traza")
+    parser.add_argument("--format", choices=TRACE_FORMATS, default=TEXT_FORMAT, help="Formato de la traza")
+    parser.add_argument("--pid", default="1", help="PID para registros sin proceso")
+    parser.add_argument("--size-kb", type=int, default=None, help="Tamaño de los procesos creados automáticamente")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20, help="Bytes por bloque de decodificación")
+    parser.add_argument("--algorithm", default="FIFO", choices=available_policies(include_offline=True),
+                        help="Algoritmo de reemplazo")
+    parser.add_argument("--no-fold", action="store_true", help="No reducir las direcciones al tamaño del proceso")
+    parser.add_argument("--compare-opt", action="store_true",
+                        help="Reproducir también con OPT e informar la distancia al óptimo")
+    parser.add_argument("--config", default=None, help="Archivo JSON con la geometría de la máquina")
+    parser.add_argument("--frames", type=int, default=None, help="Marcos físicos (reemplaza al de --config)")
+    parser.add_argument("--page-size", type=int, default=None, help="Tamaño de página en bytes")
+    args = parser.parse_args(argv)
+
+    config = machine_config(args)
+    reader = TraceReader(args.trace, args.format, args.pid, args.chunk_size)
+    result = run_trace(reader, args.algorithm, args.size_kb, fold=not args.no_fold,
+                       simulator=MemorySimulator(config))
+    if args.compare_opt and args.algorithm != "OPT":
+        optimal = run_trace(reader, "OPT", args.size_kb, fold=not args.no_fold,
+                            simulator=MemorySimulator(config))
+        result['optimal_statistics'] = optimal['statistics']
+        result['gap_vs_optimal_percent'] = optimal_gap(result['statistics'], optimal['statistics'])
+    print(json.dumps(result, indent=2))
+
+
+def machine_config(args):
+    """
+    Arma la configuración de la máquina a partir de los argumentos --config, --frames y --page-size.
+    Args:
+        args (argparse.Namespace): Argumentos ya interpretados.
+    Returns:
+        MachineConfig: Configuración validada.
+    """
+    config = MachineConfig.load(args.config) if args.config else MachineConfig()
+    changes = {}
+    if args.frames is not None:
+        changes['physical_pages'] = args.frames
+    if args.page_size is not None:
+        changes['page_size'] = args.page_size
+    return config.replace(**changes) if changes else config
+
+
+def run_trace(reader, algorithm, process_size_kb=None, fold=True, simulator=None):
+    """
+    Reproduce una traza con el algoritmo indicado sobre un simulador nuevo (o el dado).
+    Args:
+        reader (TraceReader): Lector de la traza.
+        algorithm (str): Nombre de la política; "OPT" usa replay_trace_optimal.
+        process_size_kb (int, opcional): Tamaño de los procesos creados automáticamente.
+        fold (bool): Reducir las direcciones al tamaño del proceso.
+        simulator (MemorySimulator, opcional): Simulador a usar.
+    Returns:
+        dict: Resultado de la reproducción.
+    """
+    if simulator is None:
+        simulator = MemorySimulator()
+    if algorithm == "OPT":
+        return replay_trace_optimal(simulator, reader, process_size_kb, fold)
+    simulator.set_replacement_algorithm(algorithm)
+    return replay_trace(simulator, reader, process_size_kb, fold)
+
+
+def optimal_gap(statistics, optimal_statistics):
+    """
+    Calcula cuántos fallos de página más que el óptimo tuvo una simulación.
+    Args:
+        statistics (dict): Estadísticas del algoritmo evaluado.
+        optimal_statistics (dict): Estadísticas de OPT sobre la misma traza.
+    Returns:
+        float: Porcentaje de fallos por encima del óptimo.
+    """
+    optimal_faults = optimal_statistics['page_faults']
+    if optimal_faults == 0:
+        return 0.0
+    return (statistics['page_faults'] - optimal_faults) / optimal_faults * 100
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import random
+from array import array
+from functools import lru_cache
+from itertools import accumulate
+
+RANDOM_PATTERN = "random"
+SEQUENTIAL_PATTERN = "sequential"
+ZIPF_PATTERN = "zipf"
+WORKLOAD_PATTERNS = (RANDOM_PATTERN, SEQUENTIAL_PATTERN, ZIPF_PATTERN)
+
+
+def generate_addresses(pattern, count, pages, page_size, seed=None, start=0, skew=1.0):
+    """
+    Genera direcciones virtuales sintéticas para un proceso.
+    Patrones:
+        random:     página y desplazamiento uniformes en todo el proceso.
+        sequential: recorre las páginas en orden (desde start) y vuelve a empezar al final.
+        zipf:       la página de rango k (la 0 es la más popular) se elige con peso 1 / (k + 1)^skew.
+    Args:
+        pattern (str): Uno de WORKLOAD_PATTERNS.
+        count (int): Número de direcciones.
+        pages (int): Páginas virtuales del proceso.
+        page_size (int): Tamaño de página en bytes.
+        seed (int, opcional): Semilla, para que la carga sea reproducible.
+        start (int): Posición de la primera dirección dentro del patrón (para continuar una
+            carga generada por bloques).
+        skew (float): Exponente de la distribución zipf.
+    Returns:
+        array.array: Direcciones virtuales como array('q').
+    """
+    if pattern not in WORKLOAD_PATTERNS:
+        raise ValueError(f"Patrón de carga desconocido: {pattern}")
+    if pages < 1:
+        return array('q')
+    if pattern == SEQUENTIAL_PATTERN:
+        return array('q', [(position % pages) * page_size for position in range(start, start + count)])
+    rng = random.Random(seed)
+    if pattern == ZIPF_PATTERN:
+        chosen = rng.choices(range(pages), cum_weights=zipf_cumulative_weights(pages, skew), k=count)
+        return array('q', [page * page_size + rng.randrange(page_size) for page in chosen])
+    span = pages * page_size
+    return array('q', [rng.randrange(span) for _ in range(count)])
+
+
+@lru_cache(maxsize=8)
+def zipf_cumulative_weights(pages, skew):
+    """
+    Obtiene los pesos acumulados de la distribución zipf. Se calculan una vez por (pages, skew)
+    y se reutilizan entre los bloques de una misma carga, que piden la misma distribución.
+    Args:
+        pages (int): Páginas del proceso.
+        skew (float): Exponente de la distribución.
+    Returns:
+        array.array: Pesos acumulados como array('d'), uno por rango de página.
+    """
+    return array('d', accumulate(1.0 / (rank + 1) ** skew for rank in range(pages)))
+
+
+def generate_writes(count, write_ratio, seed=None):
+    """
+    Genera las marcas de escritura de una carga sintética.
+    Args:
+        count (int): Número de accesos.
+        write_ratio (float): Fracción de accesos que son escrituras, entre 0 y 1.
+        seed (int, opcional): Semilla, para que la carga sea reproducible.
+    Returns:
+        bytearray or None: 1 para escritura y 0 para lectura, o None si no hay escrituras.
+    """
+    if not 0.0 <= write_ratio <= 1.0:
+        raise ValueError(f"La fracción de escrituras debe estar entre 0 y 1: {write_ratio}")
+    if write_ratio == 0.0:
+        return None
+    rng = random.Random(seed)
+    return bytearray(rng.random() < write_ratio for _ in range(count))
@@ -0,0 +1,73 @@
+import random
+
+from model.memory import MemorySimulator
+
+PAGE_SIZE = 4096
+
+
+def workload(kind, count, pages, seed=1):
+    """
+    Direcciones y marcas de escritura de una carga de prueba con rachas de aciertos y fallos.
+    """
+    rng = random.Random(seed)
+    addresses = []
+    page = 0
+    for i in range(count):
+        if kind == "sequential":
+            page = (i // 8) % pages
+        elif kind == "mixed":
+            page = rng.randrange(pages) if rng.random() < 0.1 else (page + 1) % pages
+        else:
+            page = rng.randrange(pages)
+        addresses.append(page * PAGE_SIZE + rng.randrange(PAGE_SIZE))
+    # Algunas direcciones fuera del proceso: ambas rutas deben descartarlas igual.
+    addresses[::97] = [pages * PAGE_SIZE + 5] * len(addresses[::97])
+    writes = [rng.random() < 0.3 for _ in range(count)]
+    return addresses, writes
+
+
+def new_simulator(algorithm, organization, tlb_entries, prefetch, swap_pages=None):
+    simulator = MemorySimulator(page_size=PAGE_SIZE, physical_pages=24, virtual_pages=256, swap_pages=swap_pages)
+    simulator.set_replacement_algorithm(algorithm)
+    simulator.configure_tlb(tlb_entries)
+    simulator.configure_page_table(organization)
+    simulator.configure_prefetch(prefetch)
+    for pid in ("1", "2"):
+        simulator.create_process(pid, 96 * PAGE_SIZE // 1024)
+    return simulator
+
+
+def run_scalar(simulator, pid, addresses, writes):
+    simulator.current_process = pid
+    translate = simulator.translate_virtual_to_physical
+    return [translate(address, write) for address, write in zip(addresses, writes)]
+
+
+def run_batch(simulator, pid, addresses, writes, chunk=500):
+    physical = []
+    for start in range(0, len(addresses), chunk):
+        result, _ = simulator.access_batch(pid, addresses[start:start + chunk], writes[start:start + chunk])
+        physical.extend(None if address < 0 else int(address) for address in result)
+    return physical
+
+
+def belady_faults(pages, frames):
+    """
+    Fallos del reemplazo óptimo por fuerza bruta: ante cada fallo con la memoria llena se
+    busca hacia adelante el próximo uso de cada página residente.
+    """
+    resident = set()
+    faults = 0
+    for position, page in enumerate(pages):
+        if page in resident:
+            continue
+        faults += 1
+        if len(resident) == frames:
+            def next_use(candidate):
+                for later in range(position + 1, len(pages)):
+                    if pages[later] == candidate:
+                        return later
+                return len(pages)
+            resident.remove(max(resident, key=next_use))
+        resident.add(page)
+    return faults
@@ -0,0 +1,17 @@
+import pytest
+
+from model.policies import available_policies
+from support import new_simulator, run_batch, run_scalar, workload
+
+
+@pytest.mark.parametrize("algorithm", available_policies())
+@pytest.mark.parametrize("organization", ["flat", "radix", "inverted"])
+@pytest.mark.parametrize("tlb_entries", [16, 0])
+@pytest.mark.parametrize("kind", ["sequential", "mixed", "random"])
+def test_access_batch_matches_scalar(algorithm, organization, tlb_entries, kind):
+    addresses, writes = workload(kind, 1500, 96)
+    scalar = new_simulator(algorithm, organization, tlb_entries, prefetch=False)
+    batch = new_simulator(algorithm, organization, tlb_entries, prefetch=False)
+    for pid in ("1", "2", "1"):
+        assert run_batch(batch, pid, addresses, writes) == run_scalar(scalar, pid, addresses, writes)
+    assert batch.get_statistics() == scalar.get_statistics()
@@ -0,0 +1,36 @@
+import os
+import subprocess
+import sys
+
+from model.sparse_page_table import HashedInvertedTable
+
+FRAMES = 256
+PROBES = ("from model.sparse_page_table import HashedInvertedTable\n"
+          "table = HashedInvertedTable(256)\n"
+          "for frame in range(256):\n"
+          "    table.insert(('a', 'b')[frame % 2], frame // 2, frame)\n"
+          "print(sum(table.probes(pid, page) for pid in 'ab' for page in range(128)))\n")
+
+
+def fill(table):
+    for frame in range(FRAMES):
+        table.insert(("a", "b")[frame % 2], frame // 2, frame)
+
+
+def test_chains_stay_short_and_lookups_resolve():
+    table = HashedInvertedTable(FRAMES)
+    fill(table)
+    for frame in range(FRAMES):
+        assert table.lookup(("a", "b")[frame % 2], frame // 2) == frame
+    assert max(table.probes(pid, page) for pid in "ab" for page in range(FRAMES // 2)) <= 8
+
+
+def test_buckets_do_not_depend_on_hash_seed():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    totals = set()
+    for seed in ("1", "2"):
+        environment = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=root)
+        result = subprocess.run([sys.executable, "-c", PROBES], env=environment, capture_output=True,
+                                text=True, check=True)
+        totals.add(result.stdout.strip())
+    assert len(totals) == 1
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from model.frame_list import FrequencyBuckets
+from model.memory import MemorySimulator
+from model.policies import build_next_use, create_policy, NEVER
+from support import PAGE_SIZE, belady_faults
+
+
+def replay_with_opt(pages, frames, tlb_entries=16):
+    simulator = MemorySimulator(page_size=PAGE_SIZE, physical_pages=frames, virtual_pages=64)
+    simulator.configure_tlb(tlb_entries)
+    simulator.create_process("1", 64 * PAGE_SIZE // 1024)
+    simulator.current_process = "1"
+    policy = create_policy("OPT", simulator)
+    policy.set_future(build_next_use(pages))
+    simulator.set_policy(policy)
+    for page in pages:
+        simulator.translate_virtual_to_physical(page * PAGE_SIZE)
+    return simulator.get_statistics()['page_faults']
+
+
+def test_build_next_use():
+    assert list(build_next_use([1, 2, 1, 3, 2])) == [2, 4, NEVER, NEVER, NEVER]
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("frames", [1, 3, 8])
+def test_opt_matches_brute_force_belady(seed, frames):
+    rng = random.Random(seed)
+    pages = [rng.randrange(12) if rng.random() < 0.7 else rng.randrange(40) for _ in range(600)]
+    assert replay_with_opt(pages, frames) == belady_faults(pages, frames)
+    assert replay_with_opt(pages, frames, tlb_entries=0) == belady_faults(pages, frames)
+
+
+@pytest.mark.parametrize("algorithm", ["FIFO", "LRU", "LFU", "Clock"])
+def test_opt_is_a_lower_bound(algorithm):
+    rng = random.Random(7)
+    pages = [rng.randrange(24) for _ in range(1000)]
+    simulator = MemorySimulator(page_size=PAGE_SIZE, physical_pages=6, virtual_pages=64)
+    simulator.set_replacement_algorithm(algorithm)
+    simulator.create_process("1", 64 * PAGE_SIZE // 1024)
+    for page in pages:
+        simulator.translate_virtual_to_physical(page * PAGE_SIZE)
+    assert belady_faults(pages, 6) <= simulator.get_statistics()['page_faults']
+
+
+def test_frequency_buckets_track_the_exact_minimum():
+    rng = random.Random(3)
+    buckets = FrequencyBuckets()
+    frequency, order, clock = {}, {}, 0
+    for _ in range(5000):
+        clock += 1
+        frame = rng.randrange(32)
+        operation = rng.random()
+        if frame not in frequency:
+            buckets.add(frame)
+            frequency[frame], order[frame] = 1, clock
+        elif operation < 0.8:
+            amount = rng.choice((1, 1, 1, 3, 7))
+            buckets.increment(frame, amount)
+            frequency[frame] += amount
+            order[frame] = clock
+        else:
+            buckets.discard(frame)
+            del frequency[frame], order[frame]
+            continue
+        # Solo una quita que vació el cubo mínimo puede dejarlo desconocido.
+        assert buckets.min_frequency in (None, min(frequency.values()))
+        expected = min(frequency, key=lambda candidate: (frequency[candidate], order[candidate]))
+        assert buckets.peek_victim() == expected
+        assert buckets.min_frequency == min(frequency.values())
@@ -0,0 +1,59 @@
+import pytest
+
+from model.policies import build_next_use, create_policy
+from model.prefetch import Prefetcher
+from support import PAGE_SIZE, belady_faults, new_simulator, run_batch, run_scalar, workload
+
+
+def test_stride_detection_and_adaptive_window():
+    prefetcher = Prefetcher(initial_window=2, max_window=4)
+    assert list(prefetcher.on_fault("1", 10, 100, 64)) == []
+    assert list(prefetcher.on_fault("1", 13, 100, 64)) == []
+    assert list(prefetcher.on_fault("1", 16, 100, 64)) == [19, 22]
+    # El flujo sigue desde el final de lo anticipado.
+    assert list(prefetcher.on_fault("1", 25, 100, 64)) == [28, 31]
+    for _ in range(5):
+        prefetcher.on_useful("1")
+    assert prefetcher.window("1") == 4
+    prefetcher.on_wasted("1")
+    assert prefetcher.window("1") == 2
+    assert list(prefetcher.on_fault("1", 34, 38, 64)) == [37]
+    assert prefetcher.stride_readaheads == 3
+    assert list(prefetcher.on_fault("2", 0, 100, 64)) == []
+
+
+@pytest.mark.parametrize("algorithm", ["FIFO", "LRU", "Clock"])
+@pytest.mark.parametrize("kind", ["sequential", "mixed"])
+def test_access_batch_matches_scalar_with_prefetch(algorithm, kind):
+    addresses, writes = workload(kind, 3000, 96)
+    scalar = new_simulator(algorithm, "flat", 16, prefetch=True)
+    batch = new_simulator(algorithm, "flat", 16, prefetch=True)
+    for pid in ("1", "2"):
+        assert run_batch(batch, pid, addresses, writes) == run_scalar(scalar, pid, addresses, writes)
+    statistics = batch.get_statistics()
+    assert statistics == scalar.get_statistics()
+    assert statistics['prefetch_issued'] == (statistics['prefetch_useful'] + statistics['prefetch_wasted']
+                                             + sum(batch.prefetched))
+
+
+def test_prefetch_reduces_sequential_faults():
+    addresses, writes = workload("sequential", 4000, 96)
+    faults = {}
+    for prefetch in (False, True):
+        simulator = new_simulator("LRU", "flat", 16, prefetch)
+        run_scalar(simulator, "1", addresses, writes)
+        faults[prefetch] = simulator.get_statistics()['page_faults']
+    assert faults[True] < faults[False] / 3
+
+
+def test_opt_ignores_readahead():
+    # OPT solo conoce los accesos de la traza: con una política fuera de línea no se anticipa.
+    pages = [page for _ in range(3) for page in range(32)]
+    simulator = new_simulator("FIFO", "flat", 16, prefetch=True)
+    policy = create_policy("OPT", simulator)
+    policy.set_future(build_next_use(pages))
+    simulator.set_policy(policy)
+    run_scalar(simulator, "1", [page * PAGE_SIZE for page in pages], [False] * len(pages))
+    statistics = simulator.get_statistics()
+    assert statistics['prefetch_issued'] == 0
+    assert statistics['page_faults'] == belady_faults(pages, simulator.physical_pages)
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from model.memory import MemorySimulator
+from model.stack_distance import StackDistanceAnalyzer
+
+PAGE_SIZE = 4096
+
+
+def lru_faults(pages, frames):
+    """
+    Fallos de LRU reproduciendo la secuencia en el simulador.
+    """
+    simulator = MemorySimulator(page_size=PAGE_SIZE, physical_pages=frames, virtual_pages=128)
+    simulator.set_replacement_algorithm("LRU")
+    simulator.create_process("1", 128 * PAGE_SIZE // 1024)
+    for page in pages:
+        simulator.translate_virtual_to_physical(page * PAGE_SIZE)
+    return simulator.get_statistics()['page_faults']
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_miss_ratio_curve_matches_lru_replay(seed):
+    rng = random.Random(seed)
+    pages = [rng.randrange(16) if rng.random() < 0.6 else rng.randrange(100) for _ in range(1500)]
+    # Capacidad chica para forzar varias compactaciones del árbol.
+    analyzer = StackDistanceAnalyzer(capacity=64)
+    analyzer.feed(pages)
+    faults = analyzer.fault_counts(48)
+    for frames in (1, 2, 5, 16, 33, 48):
+        assert faults[frames] == lru_faults(pages, frames)
+    curve = analyzer.miss_ratio_curve(48)
+    assert curve[0] == 1.0
+    assert all(curve[frames] >= curve[frames + 1] for frames in range(48))
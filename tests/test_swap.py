@@ -0,0 +1,84 @@
+from model.swap import CLUSTER_SLOTS, INITIAL_SLOTS, SwapDevice
+from support import PAGE_SIZE, new_simulator, run_scalar
+
+SLOT_SIZE = 512
+
+
+def test_consecutive_writes_fill_a_cluster():
+    device = SwapDevice(SLOT_SIZE)
+    slots = [device.write(("1", page)) for page in range(2 * CLUSTER_SLOTS)]
+    assert slots == list(range(2 * CLUSTER_SLOTS))
+    assert device.get_statistics()['swap_clusters'] == 2
+    device.close()
+
+
+def test_roundtrip_and_release():
+    device = SwapDevice(SLOT_SIZE)
+    data = bytes(range(256)) * 2
+    device.write(("1", 7), data)
+    assert ("1", 7) in device
+    assert device.read(("1", 7), release=False) == data
+    assert ("1", 7) in device
+    assert device.read(("1", 7)) == data
+    assert ("1", 7) not in device
+    assert device.read(("1", 7)) is None
+    statistics = device.get_statistics()
+    assert statistics['swap_reads'] == 2
+    assert statistics['swap_bytes_read'] == 2 * SLOT_SIZE
+    device.close()
+
+
+def test_bounded_device_rejects_when_full_and_reuses_freed_slots():
+    device = SwapDevice(SLOT_SIZE, capacity=10)
+    for page in range(10):
+        assert device.write(("1", page)) is not None
+    assert device.is_full()
+    assert device.write(("1", 10)) is None
+    assert device.get_statistics()['swap_full_rejections'] == 1
+    freed = device.slot_of(("1", 3))
+    assert device.free(("1", 3))
+    assert device.write(("1", 10)) == freed
+    # Reescribir una página conserva su ranura.
+    assert device.write(("1", 10)) == freed
+    assert len(device) == 10
+    device.close()
+
+
+def test_unbounded_device_grows_only_when_full():
+    device = SwapDevice(SLOT_SIZE)
+    for page in range(INITIAL_SLOTS):
+        device.write(("1", page))
+    for page in range(0, INITIAL_SLOTS, 2):
+        device.free(("1", page))
+    # Mientras queden ranuras libres el mapa de bits no crece.
+    for page in range(INITIAL_SLOTS // 2):
+        assert device.write(("2", page)) < INITIAL_SLOTS
+    assert device.total_slots == INITIAL_SLOTS
+    assert device.write(("3", 0)) == INITIAL_SLOTS
+    assert device.total_slots == 2 * INITIAL_SLOTS
+    slots = [device.slot_of(key) for key in device]
+    assert len(set(slots)) == len(slots)
+    device.close()
+
+
+def test_configure_clears_slots_and_counters():
+    device = SwapDevice(SLOT_SIZE, capacity=4)
+    device.write(("1", 0))
+    device.configure(2 * SLOT_SIZE, 8)
+    assert len(device) == 0
+    assert device.get_statistics()['swap_writes'] == 0
+    assert device.write(("1", 0)) == 0
+    assert device.get_statistics()['swap_bytes_written'] == 2 * SLOT_SIZE
+    device.close()
+
+
+def test_full_swap_leaves_victim_in_place():
+    simulator = new_simulator("FIFO", "flat", 0, prefetch=False, swap_pages=4)
+    addresses = [page * PAGE_SIZE for page in range(40)]
+    physical = run_scalar(simulator, "1", addresses, [True] * len(addresses))
+    assert physical[:28].count(None) == 0
+    assert physical[28:].count(None) == 12
+    statistics = simulator.get_statistics()
+    assert statistics['swaps_out'] == 4
+    assert statistics['swap_full_rejections'] > 0
+    assert len(simulator.swap_space) == 4
@@ -0,0 +1,36 @@
+import pytest
+
+from model.memory import MemorySimulator
+from model.stack_distance import analyze_trace
+from model.trace import TAGGED_RECORD, TraceReader, collect_page_keys, replay_trace
+
+PAGE_SIZE = 4096
+
+
+def write_tagged(path, records):
+    with open(path, "wb") as trace_file:
+        for pid, address in records:
+            trace_file.write(TAGGED_RECORD.pack(pid, 0, address))
+
+
+@pytest.mark.parametrize("organization", ["flat", "radix", "inverted"])
+def test_trace_keys_do_not_collide_across_processes(tmp_path, organization):
+    path = str(tmp_path / "trace.bin")
+    # Con tablas dispersas la página 2^32 del proceso 1 no debe confundirse con la 0 del 2.
+    high = (1 << 32) * PAGE_SIZE if organization != "flat" else 5 * PAGE_SIZE
+    write_tagged(path, [(1, high), (2, 0)] * 8)
+    simulator = MemorySimulator(page_size=PAGE_SIZE, physical_pages=4, virtual_pages=64)
+    simulator.configure_page_table(organization)
+    keys = collect_page_keys(simulator, TraceReader(path, "tagged"), fold=False)
+    assert len(set(keys)) == 2
+
+    scratch = MemorySimulator(page_size=PAGE_SIZE, physical_pages=4, virtual_pages=64)
+    scratch.configure_page_table(organization)
+    _, curve = analyze_trace(TraceReader(path, "tagged"), scratch, max_frames=2, fold=False)
+    assert list(curve) == [1.0, 1.0, 2 / 16]
+
+    replay = MemorySimulator(page_size=PAGE_SIZE, physical_pages=2, virtual_pages=64)
+    replay.configure_page_table(organization)
+    replay.set_replacement_algorithm("LRU")
+    result = replay_trace(replay, TraceReader(path, "tagged"), fold=False)
+    assert result['statistics']['page_faults'] == 2
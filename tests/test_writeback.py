@@ -0,0 +1,43 @@
+from model.events import SWAP_OUT, PAGE_DROPPED
+from model.page_table import STATUS_MASK, VALID, SWAPPED, MODIFIED
+from support import PAGE_SIZE, new_simulator, run_scalar, workload
+
+
+def test_dirty_writeback_counters():
+    addresses, writes = workload("random", 5000, 96)
+    simulator = new_simulator("LRU", "flat", 16, prefetch=False)
+    events = {}
+    simulator.subscribe(lambda batch: [events.__setitem__(event.type, events.get(event.type, 0) + event.count)
+                                       for event in batch])
+    run_scalar(simulator, "1", addresses, writes)
+    simulator.flush_events()
+    statistics = simulator.get_statistics()
+    evictions = statistics['swaps_out'] + statistics['clean_evictions']
+    assert statistics['clean_evictions'] > 0
+    assert events.get(SWAP_OUT, 0) == statistics['swaps_out']
+    assert events.get(PAGE_DROPPED, 0) == statistics['clean_evictions']
+    assert statistics['swap_writes'] == statistics['swaps_out']
+    assert statistics['swap_bytes_written'] == statistics['swaps_out'] * PAGE_SIZE
+    assert statistics['swap_reads'] == statistics['swaps_in']
+    assert statistics['page_faults'] == evictions + simulator.physical_pages
+    # Una página residente tiene ranura solo si está limpia; las desalojadas siempre la tienen.
+    page_table = simulator.get_page_table("1")
+    for page in range(simulator.processes["1"]['pages_needed']):
+        flags = page_table.flags[page]
+        in_swap = ("1", page) in simulator.swap_space
+        if flags & STATUS_MASK == SWAPPED:
+            assert in_swap
+        elif flags & STATUS_MASK == VALID and flags & MODIFIED:
+            assert not in_swap
+
+
+def test_read_only_reload_is_not_written_back():
+    simulator = new_simulator("FIFO", "flat", 0, prefetch=False)
+    pages = list(range(48))
+    run_scalar(simulator, "1", [page * PAGE_SIZE for page in pages], [True] * len(pages))
+    written = simulator.swaps_out
+    run_scalar(simulator, "1", [page * PAGE_SIZE for page in pages] * 2, [False] * (2 * len(pages)))
+    statistics = simulator.get_statistics()
+    # Las páginas modificadas se escriben una vez; al volver limpias se descartan sin E/S.
+    assert statistics['swaps_out'] == written + 24
+    assert statistics['clean_evictions'] > 0
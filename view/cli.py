@@ -0,0 +1,138 @@
+import argparse
+import json
+import sys
+
+from controller.controller import Controller, MachineConfig
+from model.events import EventLogger
+from model.policies import available_policies
+from model.trace import TRACE_FORMATS, TEXT_FORMAT
+from model.workload import WORKLOAD_PATTERNS, RANDOM_PATTERN
+
+
+def build_parser():
+    """
+    Crea el intérprete de argumentos de la ejecución sin interfaz gráfica.
+    Returns:
+        argparse.ArgumentParser: Intérprete configurado.
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Ejecuta el simulador MMU sin interfaz gráfica: reproduce una traza o una carga "
+                    "sintética e imprime las estadísticas en JSON.")
+    parser.add_argument("--config", default=None, help="Archivo JSON con la geometría de la máquina")
+    parser.add_argument("--frames", type=int, default=None, help="Marcos físicos")
+    parser.add_argument("--page-size", type=int, default=None, help="Tamaño de página en bytes")
+    parser.add_argument("--virtual-pages", type=int, default=None, help="Páginas virtuales por proceso")
+    parser.add_argument("--swap-pages", type=int, default=None, help="Capacidad de swap en páginas")
+    parser.add_argument("--algorithm", default="FIFO", choices=available_policies(),
+                        help="Algoritmo de reemplazo")
+    parser.add_argument("--trace", default=None, help="Archivo de traza a reproducir")
+    parser.add_argument("--format", choices=TRACE_FORMATS, default=TEXT_FORMAT, help="Formato de la traza")
+    parser.add_argument("--pattern", choices=WORKLOAD_PATTERNS, default=RANDOM_PATTERN,
+                        help="Patrón de la carga sintética (si no se da --trace)")
+    parser.add_argument("--accesses", type=int, default=10000, help="Accesos de la carga sintética")
+    parser.add_argument("--processes", type=int, default=1, help="Procesos de la carga sintética")
+    parser.add_argument("--size-kb", type=int, default=None,
+                        help="Tamaño de cada proceso; por defecto el máximo espacio virtual")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla de la carga sintética")
+    parser.add_argument("--write-ratio", type=float, default=0.0,
+                        help="Fracción de escrituras de la carga sintética (entre 0 y 1)")
+    parser.add_argument("--prefetch", action="store_true",
+                        help="Activar la lectura anticipada secuencial y por paso en los fallos")
+    parser.add_argument("--prefetch-window", type=int, default=4,
+                        help="Ventana inicial de lectura anticipada en páginas")
+    parser.add_argument("--profile", action="store_true",
+                        help="Incluir el perfil por fases (llamadas y tiempos) en el resultado")
+    parser.add_argument("--events", default=None,
+                        help="Archivo donde exportar los eventos agrupados (una línea JSON por evento)")
+    parser.add_argument("--output", default=None, help="Archivo donde escribir el JSON (por defecto stdout)")
+    return parser
+
+
+def machine_config(args):
+    """
+    Arma la configuración de la máquina a partir del archivo y de las opciones sueltas.
+    Args:
+        args (argparse.Namespace): Argumentos ya interpretados.
+    Returns:
+        MachineConfig: Configuración validada.
+    """
+    config = MachineConfig.load(args.config) if args.config else MachineConfig()
+    changes = {name: value for name, value in (('physical_pages', args.frames), ('page_size', args.page_size),
+                                               ('virtual_pages', args.virtual_pages),
+                                               ('swap_pages', args.swap_pages)) if value is not None}
+    return config.replace(**changes) if changes else config
+
+
+def run(args):
+    """
+    Ejecuta la simulación descrita por los argumentos.
+    Args:
+        args (argparse.Namespace): Argumentos ya interpretados.
+    Returns:
+        dict: Resultado con la configuración usada, throughput y estadísticas.
+    """
+    config = machine_config(args)
+    controller = Controller(config)
+    controller.change_algorithm(args.algorithm)
+    controller.enable_profiling(args.profile)
+    if args.prefetch:
+        controller.configure_prefetch(True, args.prefetch_window, max(args.prefetch_window, 64))
+    events_file = open(args.events, 'w', encoding='utf-8') if args.events else None
+    try:
+        if events_file is not None:
+            logger = EventLogger(events_file)
+            controller.subscribe(logger)
+        if args.trace:
+            result = controller.replay_trace(args.trace, args.format, process_size_kb=args.size_kb)
+        else:
+            simulator = controller.simulator
+            size_kb = args.size_kb
+            if size_kb is None:
+                size_kb = simulator.virtual_page_limit() * simulator.page_size // 1024
+            for index in range(1, args.processes + 1):
+                success, message = controller.create_process(str(index), size_kb)
+                if not success:
+                    raise ValueError(message)
+            result = controller.run_workload(args.pattern, args.accesses, args.seed, write_ratio=args.write_ratio)
+            result['pattern'] = args.pattern
+            result['write_ratio'] = args.write_ratio
+        if events_file is not None:
+            controller.flush_events()
+            result['event_batches'] = logger.batches
+    finally:
+        if events_file is not None:
+            events_file.close()
+    result['config'] = config.to_dict()
+    if args.profile:
+        result['profile'] = controller.get_profile()
+    return result
+
+
+def main(argv=None):
+    """
+    Punto de entrada sin interfaz gráfica. No importa tkinter, así que funciona en
+    servidores sin pantalla.
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    Returns:
+        int: Código de salida.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        result = run(args)
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,21 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from controller.controller import Controller, ReplacementAlgorithm 
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from controller.controller import Controller, MachineConfig, PageStatus
+from model.events import (PAGE_HIT, FRAME_LOADED, PAGE_EVICTED, SWAP_IN, SWAP_OUT, PAGE_DROPPED,
+                          PROCESS_CREATED, SYSTEM_RESET)
+from view.memory_map import MemoryMap, FREE_COLOR
+from view.virtual_table import VirtualTable
+import bisect
 import random
 import time
 
+# Paneles que se redibujan solo cuando los eventos del simulador indican cambios.
+PANELS = ('processes', 'memory', 'page_table', 'swap')
+PROCESS_COLORS = ('#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c', '#d35400', '#7f8c8d')
+# Refrescos de pantalla por segundo durante la carga intensiva y duración de cada tanda de accesos.
+LOAD_REFRESH_FPS = 10
+LOAD_SLICE_SECONDS = 0.015
+
 class MMUSimulatorGUI:
     def __init__(self, root):
         """
@@ -17,6 +29,10 @@ class MMUSimulatorGUI:
         self.root.configure(bg='#2c3e50')
 
         self.controller = Controller()
+        self.load_job = None
+        self.process_color_map = {}
+        self.dirty_panels = set(PANELS)
+        self.controller.subscribe(self.on_simulator_events)
 
         self.setup_styles()
         self.create_widgets()
@@ -141,24 +157,17 @@ class MMUSimulatorGUI:
         # Botón para reiniciar sistema
         reiniciar_btn = ttk.Button(process_frame, text="Reiniciar sistema", command=self.reset_system)
         reiniciar_btn.grid(row=0, column=6, padx=10)
+
+        config_btn = ttk.Button(process_frame, text="🛠️ Configurar máquina", command=self.open_config_dialog)
+        config_btn.grid(row=0, column=7, padx=10)
         
         list_frame = ttk.LabelFrame(frame, text="Lista de Procesos", padding=10)
         list_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
-        self.process_tree = ttk.Treeview(list_frame, 
-                                       columns=('PID', 'Tamaño', 'Páginas', 'Estado'),
-                                       show='headings')
-        
-        self.process_tree.heading('PID', text='PID')
-        self.process_tree.heading('Tamaño', text='Tamaño (KB)')
-        self.process_tree.heading('Páginas', text='Páginas')
-        self.process_tree.heading('Estado', text='Estado')
-        
-        self.process_tree.column('PID', width=80, anchor='center')
-        self.process_tree.column('Tamaño', width=100, anchor='center')
-        self.process_tree.column('Páginas', width=80, anchor='center')
-        self.process_tree.column('Estado', width=100, anchor='center')
-        
+        self.process_tree = VirtualTable(list_frame,
+                                         columns=('PID', 'Tamaño', 'Páginas', 'Estado'),
+                                         widths={'PID': 80, 'Tamaño': 100, 'Páginas': 80, 'Estado': 100},
+                                         headings={'Tamaño': 'Tamaño (KB)'})
         self.process_tree.pack(fill='both', expand=True)
     
     def create_system_status_tab(self, parent):
@@ -185,7 +194,7 @@ class MMUSimulatorGUI:
         self.algorithm_var2 = tk.StringVar(value="FIFO")
         algorithm_combo2 = ttk.Combobox(active_frame,
                                         textvariable=self.algorithm_var2,
-                                        values=["FIFO", "LRU"],
+                                        values=self.controller.get_available_algorithms(),
                                         state='readonly')
         algorithm_combo2.grid(row=0, column=3, padx=5)
         algorithm_combo2.bind('<<ComboboxSelected>>', self.change_algorithm)
@@ -200,37 +209,42 @@ class MMUSimulatorGUI:
         ttk.Button(access_frame, text="Reiniciar Sistema",
                    command=self.reset_system).pack(side='left', padx=5)
 
+        ttk.Label(access_frame, text="Accesos:").pack(side='left', padx=(20, 2))
+        self.load_count_var = tk.StringVar(value="1000")
+        ttk.Entry(access_frame, textvariable=self.load_count_var, width=9).pack(side='left')
+        ttk.Label(access_frame, text="Tasa (acc/s, 0 = máx.):").pack(side='left', padx=(10, 2))
+        self.load_rate_var = tk.StringVar(value="0")
+        ttk.Entry(access_frame, textvariable=self.load_rate_var, width=8).pack(side='left')
+        ttk.Label(access_frame, text="% Escrituras:").pack(side='left', padx=(10, 2))
+        self.write_percent_var = tk.StringVar(value="30")
+        ttk.Entry(access_frame, textvariable=self.write_percent_var, width=5).pack(side='left')
+        self.load_progress = ttk.Progressbar(access_frame, length=160, mode='determinate')
+        self.load_progress.pack(side='left', padx=10)
+        self.load_cancel_btn = ttk.Button(access_frame, text="Cancelar", state=tk.DISABLED,
+                                          command=self.cancel_intensive_load)
+        self.load_cancel_btn.pack(side='left', padx=5)
+
         main_pane = ttk.PanedWindow(frame, orient=tk.HORIZONTAL)
         main_pane.pack(fill='both', expand=True, padx=10, pady=10)
 
         # 1. Tabla de páginas (izquierda)
         page_table_frame = ttk.LabelFrame(main_pane, text="Tabla de Páginas del Proceso Activo", padding=10)
-        self.page_table_tree = ttk.Treeview(page_table_frame,
-                                            columns=('Página', 'Marco', 'Estado', 'Acceso'),
-                                            show='headings')
-        for col in ['Página', 'Marco', 'Estado', 'Acceso']:
-            self.page_table_tree.heading(col, text=col)
-            self.page_table_tree.column(col, width=90, anchor='center')
-        self.page_table_tree.column('Estado', width=90)
+        self.page_table_tree = VirtualTable(page_table_frame, columns=('Página', 'Marco', 'Estado', 'Acceso'))
         self.page_table_tree.pack(fill='both', expand=True)
         main_pane.add(page_table_frame, weight=1)  # 30%
 
         # 2. Swap (centro)
         swap_frame = ttk.LabelFrame(main_pane, text="Espacio de Intercambio (Swap)", padding=10)
-        self.swap_tree = ttk.Treeview(swap_frame, columns=('PID', 'Página', 'Accesos'), show='headings')
-        self.swap_tree.heading('PID', text='PID')
-        self.swap_tree.heading('Página', text='Página')
-        self.swap_tree.heading('Accesos', text='Accesos')
-        self.swap_tree.column('PID', width=80, anchor='center')
-        self.swap_tree.column('Página', width=80, anchor='center')
-        self.swap_tree.column('Accesos', width=80, anchor='center')
+        self.swap_tree = VirtualTable(swap_frame, columns=('PID', 'Página', 'Accesos'),
+                                      widths={'PID': 80, 'Página': 80, 'Accesos': 80})
         self.swap_tree.pack(fill='both', expand=True)
+        self.swap_rows = None
         main_pane.add(swap_frame, weight=2)        # 20%
 
         # 3. Memoria física (derecha)
         memory_frame = ttk.LabelFrame(main_pane, text="Memoria Física", padding=10)
-        self.memory_canvas = tk.Canvas(memory_frame, bg='white', highlightthickness=0)
-        self.memory_canvas.pack(fill='both', expand=True)
+        self.memory_map = MemoryMap(memory_frame, self.frame_color, self.frame_label)
+        self.memory_map.pack(fill='both', expand=True)
         main_pane.add(memory_frame, weight=5)      # 50%
     
     def create_analysis_tab(self, parent):
@@ -252,7 +266,11 @@ class MMUSimulatorGUI:
         stats_items = [
             ('Accesos Totales:', 'access_count'), ('Page Hits:', 'page_hits'), ('Page Faults:', 'page_faults'),
             ('Tasa de Aciertos:', 'hit_rate'), ('Tasa de Fallos:', 'fault_rate'), ('Swaps In:', 'swaps_in'),
-            ('Swaps Out:', 'swaps_out'), ('Páginas en Swap:', 'pages_in_swap'), ('Algoritmo:', 'algorithm')
+            ('Swaps Out:', 'swaps_out'), ('Páginas en Swap:', 'pages_in_swap'), ('Algoritmo:', 'algorithm'),
+            ('TLB Hits:', 'tlb_hits'), ('TLB Misses:', 'tlb_misses'), ('Tasa de Aciertos TLB:', 'tlb_hit_rate'),
+            ('Recorridos de Tabla:', 'page_walks'), ('Profundidad Media:', 'avg_walk_depth'),
+            ('Memoria de Tablas (B):', 'page_table_bytes'), ('Bytes Leídos de Swap:', 'swap_bytes_read'),
+            ('Bytes Escritos a Swap:', 'swap_bytes_written'), ('Desalojos Limpios:', 'clean_evictions')
         ]
         
         row, col_limit = 0, 3
@@ -265,6 +283,20 @@ class MMUSimulatorGUI:
             if (i + 1) % col_limit == 0:
                 row += 1
         
+        profile_frame = ttk.LabelFrame(frame, text="Perfil de Caminos Críticos", padding=10)
+        profile_frame.pack(fill='x', padx=10, pady=(0, 10))
+
+        self.profiling_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(profile_frame, text="Activar instrumentación", variable=self.profiling_var,
+                        command=self.toggle_profiling).pack(anchor='w')
+        self.profile_tree = ttk.Treeview(profile_frame, columns=('Fase', 'Llamadas', 'Total', 'Media'),
+                                         show='headings', height=5)
+        for col, heading, width in (('Fase', 'Fase', 140), ('Llamadas', 'Llamadas', 100),
+                                    ('Total', 'Tiempo total (ms)', 130), ('Media', 'Media (µs)', 100)):
+            self.profile_tree.heading(col, text=heading)
+            self.profile_tree.column(col, width=width, anchor='center')
+        self.profile_tree.pack(fill='x', pady=(5, 0))
+
         analysis_frame = ttk.LabelFrame(frame, text="Análisis de Rendimiento", padding=10)
         analysis_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
@@ -280,6 +312,21 @@ class MMUSimulatorGUI:
                                                      wrap=tk.WORD)
         self.analysis_text.pack(fill='both', expand=True)
         self.analysis_text.config(state=tk.DISABLED)
+
+        mrc_frame = ttk.LabelFrame(frame, text="Curva de Tasa de Fallos (LRU)", padding=10)
+        mrc_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        mrc_controls = ttk.Frame(mrc_frame)
+        mrc_controls.pack(fill='x')
+        ttk.Label(mrc_controls, text="Formato de traza:").pack(side='left', padx=5)
+        self.trace_format_var = tk.StringVar(value="lackey")
+        ttk.Combobox(mrc_controls, textvariable=self.trace_format_var,
+                     values=["lackey", "raw", "tagged"], state='readonly', width=10).pack(side='left', padx=5)
+        ttk.Button(mrc_controls, text="📈 Calcular desde traza...",
+                   command=self.compute_miss_ratio_curve).pack(side='left', padx=5)
+
+        self.mrc_canvas = tk.Canvas(mrc_frame, bg='white', height=200, highlightthickness=0)
+        self.mrc_canvas.pack(fill='both', expand=True, pady=(5, 0))
         
         self.show_initial_analysis()
     
@@ -362,6 +409,7 @@ class MMUSimulatorGUI:
         selected_pid = self.active_process_var2.get()
         if selected_pid:
             self.controller.set_current_process(selected_pid)
+            self.dirty_panels.update(('processes', 'page_table'))
             self.active_process_var2.set(selected_pid)
             self.update_displays()
 
@@ -390,40 +438,66 @@ class MMUSimulatorGUI:
             messagebox.showinfo("Información", f"El proceso {current_pid} no tiene páginas o no existe.")
             return
 
+        write_ratio = self.get_write_ratio()
+        if write_ratio is None:
+            return
+
         max_address = process_data['pages_needed'] * self.controller.get_page_size() - 1
         random_address = random.randint(0, max_address)
-        
+        write = random.random() < write_ratio
+
         # Call the corrected simulate_memory_access
-        self.simulate_gui_memory_access(random_address) # Esto ya hace el acceso
+        self.simulate_gui_memory_access(random_address, write) # Esto ya hace el acceso
 
         page_num = random_address // self.controller.get_page_size()
+        kind = "Escritura" if write else "Lectura"
 
         self.translation_text.config(state=tk.NORMAL)
-        self.translation_text.insert(tk.END, f"\n---\n[Acceso Aleatorio] Proceso: {current_pid}, Dir Virtual: 0x{random_address:08X} (Página {page_num})\n")
+        self.translation_text.insert(tk.END, f"\n---\n[Acceso Aleatorio - {kind}] Proceso: {current_pid}, Dir Virtual: 0x{random_address:08X} (Página {page_num})\n")
         self.translation_text.see(tk.END) # Scroll to end
         self.translation_text.config(state=tk.DISABLED)
 
 
-    def simulate_gui_memory_access(self, address): 
+    def get_write_ratio(self):
+        """
+        Lee el porcentaje de escrituras de la interfaz.
+        Returns:
+            float or None: Fracción de escrituras, o None si el valor no es válido.
+        """
+        try:
+            percent = float(self.write_percent_var.get() or 0)
+            if not 0 <= percent <= 100:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "El porcentaje de escrituras debe estar entre 0 y 100.")
+            return None
+        return percent / 100
+
+    def simulate_gui_memory_access(self, address, write=False): 
         """
         Simula el acceso a una dirección virtual desde la GUI y actualiza la interfaz.
         Args:
             address (int): Dirección virtual a acceder.
+            write (bool): El acceso es una escritura.
         """
         current_pid = self.controller.get_current_process()
         if not current_pid:
             # This should be caught by the caller (e.g., gui_random_access)
             return
             
-        self.controller.simulate_memory_access(address)
+        self.controller.simulate_memory_access(address, write)
         
         # After access, update all relevant displays
         self.update_displays()
 
     def gui_intensive_load(self): 
         """
-        Realiza múltiples accesos aleatorios para simular una carga intensiva desde la GUI.
+        Inicia una carga intensiva de accesos aleatorios sin bloquear la interfaz: los accesos
+        se hacen por tandas programadas con after(), respetando la tasa objetivo, y la pantalla
+        se refresca como mucho LOAD_REFRESH_FPS veces por segundo.
         """
+        if self.load_job is not None:
+            return
         current_pid = self.controller.get_current_process()
         if not current_pid:
             messagebox.showwarning("Advertencia", "Seleccione un proceso activo.")
@@ -434,38 +508,101 @@ class MMUSimulatorGUI:
             messagebox.showinfo("Información", f"El proceso {current_pid} no tiene páginas para carga intensiva.")
             return
 
+        try:
+            num_accesses = int(self.load_count_var.get())
+            rate = float(self.load_rate_var.get() or 0)
+            if num_accesses <= 0 or rate < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Ingrese un número de accesos positivo y una tasa mayor o igual a 0.")
+            return
+        write_ratio = self.get_write_ratio()
+        if write_ratio is None:
+            return
+
         # Provide feedback in translation tab
         self.translation_text.config(state=tk.NORMAL)
         self.translation_text.delete(1.0, tk.END) # Clear previous
         self.translation_text.insert(tk.END, f"INICIANDO CARGA INTENSIVA PARA PROCESO {current_pid}\n")
+        self.translation_text.insert(tk.END, f"{num_accesses} accesos a {'máxima velocidad' if not rate else f'{rate:g} acc/s'}\n")
         self.translation_text.insert(tk.END, "=" * 60 + "\n\n")
         self.translation_text.config(state=tk.DISABLED)
 
-        num_accesses = 20 # Reduced for faster UI response, was 50
-        for i in range(num_accesses):
-            max_address = process_data['pages_needed'] * self.controller.get_page_size() - 1
-            random_address = random.randint(0, max_address)
-        
-            self.simulate_gui_memory_access(random_address) # This updates displays internally too
+        now = time.perf_counter()
+        self.load_state = {'pid': current_pid, 'total': num_accesses, 'rate': rate, 'done': 0,
+                           'write_ratio': write_ratio, 'start': now, 'last_refresh': now, 'cancelled': False}
+        self.load_progress.config(maximum=num_accesses, value=0)
+        self.load_cancel_btn.config(state=tk.NORMAL)
+        self.load_job = self.root.after(0, self.intensive_load_step)
 
-            # Update translation tab with info about this specific access
-            page_num = random_address // self.controller.get_page_size()
-            self.translation_text.config(state=tk.NORMAL)
-            self.translation_text.insert(tk.END, f"Acceso {i+1}/{num_accesses}: Dir Virtual 0x{random_address:08X} (Página {page_num})\n")
+    def intensive_load_step(self):
+        """
+        Ejecuta una tanda de la carga intensiva y programa la siguiente.
+        """
+        state = self.load_state
+        now = time.perf_counter()
+        if state['cancelled'] or self.controller.get_current_process() != state['pid']:
+            self.finish_intensive_load()
+            return
+        slice_end = now + LOAD_SLICE_SECONDS
+        target = state['total']
+        if state['rate']:
+            target = min(target, int((now - state['start']) * state['rate']) + 1)
+        while state['done'] < target and time.perf_counter() < slice_end:
+            chunk = min(256, target - state['done'])
+            if not self.controller.random_accesses(chunk, state['write_ratio']):
+                state['cancelled'] = True
+                break
+            state['done'] += chunk
+        now = time.perf_counter()
+        if state['done'] >= state['total'] or state['cancelled']:
+            self.finish_intensive_load()
+            return
+        if now - state['last_refresh'] >= 1 / LOAD_REFRESH_FPS:
+            state['last_refresh'] = now
+            self.refresh_intensive_load()
+        delay = 1
+        if state['rate']:
+            due = state['start'] + (state['done'] + 1) / state['rate']
+            delay = max(1, int((due - now) * 1000))
+        self.load_job = self.root.after(delay, self.intensive_load_step)
 
-            self.translation_text.see(tk.END) # Scroll to end
-            self.translation_text.config(state=tk.DISABLED)
+    def refresh_intensive_load(self):
+        """
+        Muestra el avance de la carga intensiva y actualiza los paneles.
+        """
+        state = self.load_state
+        elapsed = time.perf_counter() - state['start']
+        self.load_progress.config(value=state['done'])
+        self.translation_text.config(state=tk.NORMAL)
+        self.translation_text.insert(tk.END, f"Acceso {state['done']}/{state['total']} "
+                                             f"({state['done'] / elapsed if elapsed > 0 else 0:,.0f} acc/s)\n")
+        self.translation_text.see(tk.END) # Scroll to end
+        self.translation_text.config(state=tk.DISABLED)
+        self.update_displays()
 
-            time.sleep(0.02) # Shorter sleep for faster simulation
-            self.root.update_idletasks() 
-        
+    def cancel_intensive_load(self):
+        """
+        Cancela la carga intensiva en curso; se detiene al terminar la tanda actual.
+        """
+        if self.load_job is not None:
+            self.load_state['cancelled'] = True
+
+    def finish_intensive_load(self):
+        """
+        Cierra la carga intensiva: último refresco, estado de los controles y análisis.
+        """
+        state = self.load_state
+        self.load_job = None
+        self.load_cancel_btn.config(state=tk.DISABLED)
+        self.refresh_intensive_load()
         self.translation_text.config(state=tk.NORMAL)
-        self.translation_text.insert(tk.END, "\nCARGA INTENSIVA COMPLETADA\n")
+        self.translation_text.insert(tk.END, "\nCARGA INTENSIVA CANCELADA\n" if state['cancelled']
+                                     else "\nCARGA INTENSIVA COMPLETADA\n")
         self.translation_text.see(tk.END)
         self.translation_text.config(state=tk.DISABLED)
-
-        self.check_thrashing() 
-        self.update_displays() # Final comprehensive update
+        if not state['cancelled']:
+            self.check_thrashing()
 
 
     def reset_system(self):
@@ -473,6 +610,7 @@ class MMUSimulatorGUI:
         Reinicia el sistema, eliminando todos los procesos y estadísticas, y actualiza la interfaz.
         """
         if messagebox.askyesno("Confirmar Reinicio", "Esto eliminará todos los procesos y estadísticas. ¿Continuar?"):
+            self.cancel_intensive_load()
             self.controller.reset_system()
             self.active_process_var2.set("")  # Limpia selección del combo de proceso activo
             self.active_process_combo2['values'] = []  # Limpia la lista de procesos en el combo
@@ -483,12 +621,98 @@ class MMUSimulatorGUI:
             self.show_initial_analysis()
             messagebox.showinfo("Sistema Reiniciado", "Todos los procesos y estadísticas han sido reiniciados.")
 
+    def open_config_dialog(self):
+        """
+        Abre el diálogo para cambiar la geometría de la máquina (tamaño de página, marcos,
+        páginas virtuales y capacidad de swap), con opción de cargarla o guardarla en JSON.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Configuración de la máquina")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        body = ttk.Frame(dialog, padding=15)
+        body.pack(fill='both', expand=True)
+
+        fields = [('Tamaño de página (bytes):', 'page_size'), ('Marcos físicos:', 'physical_pages'),
+                  ('Páginas virtuales por proceso:', 'virtual_pages'),
+                  ('Capacidad de swap (páginas, vacío = ilimitada):', 'swap_pages')]
+        variables = {}
+
+        def show(config):
+            for _, name in fields:
+                value = getattr(config, name)
+                variables[name].set("" if value is None else str(value))
+
+        for row, (label_text, name) in enumerate(fields):
+            ttk.Label(body, text=label_text).grid(row=row, column=0, sticky='w', pady=3)
+            variables[name] = tk.StringVar()
+            ttk.Entry(body, textvariable=variables[name], width=14).grid(row=row, column=1, padx=5, pady=3)
+        show(self.controller.get_config())
+
+        def read_config():
+            values = {}
+            for label_text, name in fields:
+                text = variables[name].get().strip()
+                if name == 'swap_pages' and not text:
+                    values[name] = None
+                    continue
+                try:
+                    values[name] = int(text)
+                except ValueError:
+                    raise ValueError(f"{label_text} '{text}' no es un entero.")
+            return MachineConfig.from_dict(values)
+
+        def load():
+            path = filedialog.askopenfilename(parent=dialog, title="Cargar configuración",
+                                              filetypes=[("JSON", "*.json"), ("Todos", "*")])
+            if not path:
+                return
+            try:
+                show(MachineConfig.load(path))
+            except (OSError, ValueError) as error:
+                messagebox.showerror("Error", f"No se pudo cargar la configuración: {error}", parent=dialog)
+
+        def save():
+            try:
+                config = read_config()
+            except ValueError as error:
+                messagebox.showerror("Error", str(error), parent=dialog)
+                return
+            path = filedialog.asksaveasfilename(parent=dialog, title="Guardar configuración",
+                                                defaultextension=".json", filetypes=[("JSON", "*.json")])
+            if path:
+                try:
+                    config.save(path)
+                except OSError as error:
+                    messagebox.showerror("Error", f"No se pudo guardar la configuración: {error}", parent=dialog)
+
+        def apply():
+            try:
+                config = read_config()
+            except ValueError as error:
+                messagebox.showerror("Error", str(error), parent=dialog)
+                return
+            if not messagebox.askyesno("Confirmar", "Cambiar la configuración reinicia el sistema. ¿Continuar?",
+                                       parent=dialog):
+                return
+            self.controller.apply_config(config)
+            dialog.destroy()
+            self.active_process_var2.set("")
+            self.update_displays()
+            self.show_initial_analysis()
+
+        buttons = ttk.Frame(body)
+        buttons.grid(row=len(fields), column=0, columnspan=2, pady=(10, 0))
+        ttk.Button(buttons, text="Cargar...", command=load).pack(side='left', padx=5)
+        ttk.Button(buttons, text="Guardar...", command=save).pack(side='left', padx=5)
+        ttk.Button(buttons, text="Aplicar", command=apply).pack(side='left', padx=5)
+        ttk.Button(buttons, text="Cancelar", command=dialog.destroy).pack(side='left', padx=5)
+        dialog.grab_set()
+
     def update_process_list(self):
         """
         Actualiza la lista de procesos mostrada en la interfaz.
         """
-        self.process_tree.delete(*self.process_tree.get_children())
-        
         processes_dict = self.controller.get_processes()
         process_pids = list(processes_dict.keys())
         self.active_process_combo2['values'] = process_pids
@@ -512,103 +736,125 @@ class MMUSimulatorGUI:
             self.controller.set_current_process(None)
             self.active_process_var2.set("")
 
-        for pid, data in processes_dict.items():
-            status = "Activo" if pid == self.controller.get_current_process() else "Inactivo"
-            self.process_tree.insert('', 'end', 
-                                  values=(pid, data['size_kb'], data['pages_needed'], status))
+        current_pid = self.controller.get_current_process()
+
+        def process_row(pid):
+            data = processes_dict[pid]
+            status = "Activo" if pid == current_pid else "Inactivo"
+            return (pid, data['size_kb'], data['pages_needed'], status)
+
+        self.process_tree.set_rows(process_pids, process_row)
 
     def update_memory_display(self):
         """
-        Actualiza la visualización gráfica de la memoria física en la interfaz.
+        Actualiza la visualización gráfica de la memoria física en la interfaz. Solo se
+        repintan los marcos que cambiaron según los eventos del simulador.
         """
-        self.memory_canvas.delete("all")
-        self.root.update_idletasks()
-        canvas_width = self.memory_canvas.winfo_width()
-        canvas_height = self.memory_canvas.winfo_height()
-
-        max_frames = 10
-        physical_memory = self.controller.get_physical_memory()[:max_frames]
-        physical_pages_count = len(physical_memory)
-
-        if canvas_width <= 1 or canvas_height <= 1:
-            self.memory_canvas.create_text(50, 20, text="Cargando memoria...", fill="gray", anchor="nw")
-            return
+        self.memory_map.set_frames(self.controller.get_physical_memory())
 
-        if physical_pages_count == 0:
-            self.memory_canvas.create_text(canvas_width/2, canvas_height/2, text="No hay memoria física", fill="red")
-            return
-
-        frame_height = canvas_height / physical_pages_count
-
-        if not hasattr(self, 'process_color_map'):
-            self.process_color_map = {}
-
-        base_colors = ['#3498db', '#2ecc71', '#e74c3c', '#f39c12', '#9b59b6', '#1abc9c', '#d35400', '#7f8c8d']
-
-        for i in range(physical_pages_count):
-            y1 = i * frame_height
-            y2 = (i + 1) * frame_height
-
-            content = physical_memory[i]
-            text_fill = '#2c3e50'
+    def frame_color(self, content):
+        """
+        Obtiene el color de un marco: el de su proceso, o el de marco libre.
+        Args:
+            content (tuple): (pid, página) o None.
+        Returns:
+            str: Color en formato #rrggbb.
+        """
+        if content is None:
+            return FREE_COLOR
+        pid = content[0]
+        color = self.process_color_map.get(pid)
+        if color is None:
+            color = PROCESS_COLORS[len(self.process_color_map) % len(PROCESS_COLORS)]
+            self.process_color_map[pid] = color
+        return color
 
-            if content is None:
-                frame_color = '#ecf0f1'
-                text = f"Marco {i} | Libre"
-            else:
-                pid, page = content
-                if pid not in self.process_color_map:
-                    self.process_color_map[pid] = base_colors[len(self.process_color_map) % len(base_colors)]
-                frame_color = self.process_color_map[pid]
-                page_table = self.controller.get_page_table(pid)
-                access_count = "-"
-                if page in page_table:
-                    access_count = page_table[page].get('access_count', '-')
-                text = f"Marco {i} | PID: {pid} | Página: {page} | Accesos: {access_count}"
-                text_fill = '#ffffff'
-
-            self.memory_canvas.create_rectangle(5, y1, canvas_width-5, y2,
-                                               fill=frame_color, outline='#7f8c8d', width=1)
-            self.memory_canvas.create_text(canvas_width/2, y1 + frame_height/2,
-                                          text=text, font=('Arial', 8 if frame_height > 30 else 7), fill=text_fill, justify=tk.CENTER)
+    def frame_label(self, index, content):
+        """
+        Obtiene el texto descriptivo de un marco.
+        Args:
+            index (int): Número de marco.
+            content (tuple): (pid, página) o None.
+        Returns:
+            str: Descripción del marco.
+        """
+        if content is None:
+            return f"Marco {index} | Libre"
+        pid, page = content
+        page_table = self.controller.get_page_table(pid)
+        access_count = "-"
+        if page_table and page in page_table:
+            access_count = page_table[page].get('access_count', '-')
+        return f"Marco {index} | PID: {pid} | Página: {page} | Accesos: {access_count}"
 
     def update_page_table_display(self):
         """
-        Actualiza la tabla de páginas del proceso activo en la interfaz.
+        Actualiza la tabla de páginas del proceso activo en la interfaz. Solo se arman las
+        filas visibles, así que el costo no depende del tamaño del proceso.
         """
-        self.page_table_tree.delete(*self.page_table_tree.get_children())
         current_pid = self.controller.get_current_process()
-        if not current_pid:
-            return
-        
-        page_table = self.controller.get_page_table(current_pid)
+        page_table = self.controller.get_page_table(current_pid) if current_pid else {}
         if not page_table:
+            self.page_table_tree.clear()
             return
 
-        for page_num, entry in sorted(page_table.items()):
-            frame = entry.get('physical_frame', '-') if entry.get('physical_frame') is not None else "-"
+        def page_row(page_num):
+            entry = page_table[page_num]
+            frame = entry.get('physical_frame')
             status_val = entry.get('status')
             status_str = status_val.value if hasattr(status_val, 'value') else str(status_val)
-            access_t = entry.get('access_time', '-')
-            accesses = entry.get('access_count', '-')
-            self.page_table_tree.insert('', 'end', 
-                                      values=(page_num, frame, status_str, accesses))
+            return (page_num, "-" if frame is None else frame, status_str, entry.get('access_count', '-'))
+
+        # La tabla plana tiene todas sus páginas; las dispersas se recorren como sus páginas tocadas.
+        pages = range(len(page_table)) if page_table.contiguous else list(page_table)
+        self.page_table_tree.set_rows(pages, page_row)
 
     def update_swap_display(self):
         """
-        Actualiza la tabla de páginas en swap en la interfaz.
+        Actualiza la tabla de páginas en swap en la interfaz. La lista ordenada de páginas en
+        swap se mantiene con los eventos swap_in/swap_out/page_dropped y solo se reconstruye tras
+        un reinicio.
         """
-        self.swap_tree.delete(*self.swap_tree.get_children())
-        swap_space = self.controller.get_swap_space()
-        for key in sorted(swap_space.keys()):
-            pid, pagina = key.split('_')
+        if self.swap_rows is None:
+            self.swap_rows = sorted(key for key in self.controller.get_swap_space() if self.is_swapped_out(*key))
+
+        def swap_row(row):
+            pid, pagina = row
             page_table = self.controller.get_page_table(pid)
             accesos = "-"
-            if page_table and pagina.isdigit():
-                entry = page_table.get(int(pagina))
+            if page_table:
+                entry = page_table.get(pagina)
                 if entry:
                     accesos = entry.get('access_count', '-')
-            self.swap_tree.insert('', 'end', values=(pid, pagina, accesos))
+            return (pid, pagina, accesos)
+
+        self.swap_tree.set_rows(self.swap_rows, swap_row)
+
+    def is_swapped_out(self, pid, page):
+        """
+        Indica si una página está en swap y no en memoria. Una página traída de swap conserva
+        su ranura mientras siga limpia, pero ya no se lista en la tabla de swap.
+        """
+        page_table = self.controller.get_page_table(pid)
+        return bool(page_table) and page in page_table and page_table[page]['status'] == PageStatus.SWAPPED
+
+    def apply_swap_event(self, event):
+        """
+        Refleja en la lista ordenada de swap un evento swap_in/swap_out/page_dropped, según el
+        estado final de la página (los eventos llegan agrupados).
+        Args:
+            event (MemoryEvent): Evento de swap.
+        """
+        if self.swap_rows is None:
+            return
+        row = (event.pid, event.page)
+        index = bisect.bisect_left(self.swap_rows, row)
+        present = index < len(self.swap_rows) and self.swap_rows[index] == row
+        in_swap = self.is_swapped_out(event.pid, event.page)
+        if in_swap and not present:
+            self.swap_rows.insert(index, row)
+        elif present and not in_swap:
+            del self.swap_rows[index]
 
     def update_stats_display(self):
         """
@@ -617,11 +863,29 @@ class MMUSimulatorGUI:
         stats = self.controller.get_statistics()
         for key, value in stats.items():
             if key in self.stats_labels:
-                if key in ['hit_rate', 'fault_rate']:
+                if key in ['hit_rate', 'fault_rate', 'tlb_hit_rate']:
                     self.stats_labels[key].config(text=f"{float(value):.2f}%")
+                elif key == 'avg_walk_depth':
+                    self.stats_labels[key].config(text=f"{float(value):.2f}")
                 else:
                     self.stats_labels[key].config(text=str(value))
 
+    def toggle_profiling(self):
+        """
+        Activa o desactiva la instrumentación del simulador según la casilla del panel de perfil.
+        """
+        self.controller.enable_profiling(self.profiling_var.get())
+        self.update_profile_display()
+
+    def update_profile_display(self):
+        """
+        Actualiza el panel con las llamadas y tiempos acumulados por fase.
+        """
+        self.profile_tree.delete(*self.profile_tree.get_children())
+        for phase, data in self.controller.get_profile().items():
+            self.profile_tree.insert('', 'end', values=(phase, data['calls'], f"{data['total_ns'] / 1e6:.3f}",
+                                                        f"{data['mean_ns'] / 1e3:.2f}"))
+
     def check_thrashing(self):
         """
         Analiza y muestra si hay hiperpaginación (thrashing) en el sistema.
@@ -655,6 +919,64 @@ class MMUSimulatorGUI:
         self.analysis_text.config(state=tk.DISABLED)
 
 
+    def compute_miss_ratio_curve(self):
+        """
+        Pide un archivo de traza, calcula su curva de tasa de fallos y la dibuja.
+        """
+        path = filedialog.askopenfilename(title="Seleccionar traza")
+        if not path:
+            return
+        try:
+            curve, accesses = self.controller.miss_ratio_curve(path, self.trace_format_var.get())
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Error", f"No se pudo analizar la traza: {error}")
+            return
+        if accesses == 0:
+            messagebox.showinfo("Información", "La traza no contiene accesos válidos.")
+            return
+        self.draw_miss_ratio_curve(curve)
+
+    def draw_miss_ratio_curve(self, curve):
+        """
+        Dibuja la curva de tasa de fallos y marca la cantidad de marcos configurada.
+        Args:
+            curve (array.array): Tasa de fallos indexada por número de marcos.
+        """
+        canvas = self.mrc_canvas
+        canvas.delete("all")
+        self.root.update_idletasks()
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        margin = 40
+        max_frames = len(curve) - 1
+        if width <= 2 * margin or height <= 2 * margin or max_frames < 1:
+            return
+        plot_width = width - 2 * margin
+        plot_height = height - 2 * margin
+
+        def to_canvas(frames, ratio):
+            return margin + frames / max_frames * plot_width, margin + (1 - ratio) * plot_height
+
+        canvas.create_line(margin, margin, margin, height - margin, fill='#2c3e50')
+        canvas.create_line(margin, height - margin, width - margin, height - margin, fill='#2c3e50')
+        canvas.create_text(margin - 5, margin, text="100%", anchor='e', font=('Arial', 8))
+        canvas.create_text(margin - 5, height - margin, text="0%", anchor='e', font=('Arial', 8))
+        canvas.create_text(width - margin, height - margin + 12, text=f"{max_frames} marcos", anchor='e', font=('Arial', 8))
+
+        step = max(1, max_frames // plot_width)
+        points = []
+        for frames in range(1, max_frames + 1, step):
+            points.extend(to_canvas(frames, curve[frames]))
+        if len(points) >= 4:
+            canvas.create_line(*points, fill='#e74c3c', width=2)
+
+        current = self.controller.get_physical_pages()
+        if 1 <= current <= max_frames:
+            x, y = to_canvas(current, curve[current])
+            canvas.create_line(x, margin, x, height - margin, fill='#3498db', dash=(4, 2))
+            canvas.create_text(x + 4, y - 8, anchor='w', font=('Arial', 8),
+                               text=f"{current} marcos: {curve[current]:.2%} fallos")
+
     def show_initial_analysis(self):
         """
         Muestra el análisis y explicación inicial del simulador en la pestaña de análisis.
@@ -668,7 +990,7 @@ class MMUSimulatorGUI:
         self.analysis_text.insert(tk.END, "   Observe cómo las direcciones simbólicas se transforman en físicas a través de la MMU y tablas de páginas.\n\n")
         self.analysis_text.insert(tk.END, "🔹 Paginación por Demanda:\n")
         self.analysis_text.insert(tk.END, "   Las páginas se cargan en memoria física solo cuando son necesarias (accedidas).\n\n")
-        self.analysis_text.insert(tk.END, "🔹 Algoritmos de Reemplazo (FIFO/LRU):\n")
+        self.analysis_text.insert(tk.END, "🔹 Algoritmos de Reemplazo (FIFO/LRU/LFU/Clock/NRU...):\n")
         self.analysis_text.insert(tk.END, "   Cuando la memoria está llena, se elige una página víctima para enviar a swap.\n\n")
         self.analysis_text.insert(tk.END, "🔹 Detección de Hiperpaginación (Thrashing):\n")
         self.analysis_text.insert(tk.END, "   Identifique cuándo el sistema gasta demasiado tiempo en paginación, afectando el rendimiento.\n\n")
@@ -681,12 +1003,52 @@ class MMUSimulatorGUI:
         self.analysis_text.insert(tk.END, "  6. Pulse 'Detectar Hiperpaginación' después de una carga intensiva.\n")
         self.analysis_text.config(state=tk.DISABLED)
 
-    def update_displays(self):
+    def on_simulator_events(self, events):
+        """
+        Recibe un lote de eventos del simulador y marca los paneles afectados.
+        Args:
+            events (list): MemoryEvent agrupados.
+        """
+        current_pid = self.controller.get_current_process()
+        dirty = self.dirty_panels
+        for event in events:
+            kind = event.type
+            if kind in (SYSTEM_RESET, PROCESS_CREATED):
+                if kind == SYSTEM_RESET:
+                    self.swap_rows = None
+                dirty.update(PANELS)
+                continue
+            if kind in (SWAP_IN, SWAP_OUT, PAGE_DROPPED):
+                self.apply_swap_event(event)
+                dirty.add('swap')
+            if kind in (PAGE_HIT, FRAME_LOADED, PAGE_EVICTED):
+                dirty.add('memory')
+                if kind != PAGE_HIT:
+                    self.memory_map.mark_frames((event.frame,))
+            if event.pid == current_pid:
+                dirty.add('page_table')
+
+    def update_displays(self, force=False):
         """
-        Actualiza todos los paneles y visualizaciones de la interfaz gráfica.
+        Actualiza los paneles de la interfaz gráfica que cambiaron desde la última vez, según
+        los eventos del simulador; las estadísticas siempre se actualizan.
+        Args:
+            force (bool): Redibujar todos los paneles.
         """
-        self.update_process_list() # Order matters: update process list first to ensure current_process is set
-        self.update_memory_display()
-        self.update_page_table_display()
-        self.update_swap_display()
+        self.controller.flush_events()
+        if force:
+            self.dirty_panels.update(PANELS)
+            self.memory_map.mark_all()
+        dirty = self.dirty_panels
+        if 'processes' in dirty:
+            self.update_process_list() # Order matters: update process list first to ensure current_process is set
+            dirty.add('page_table')  # update_process_list puede cambiar el proceso activo
+        if 'memory' in dirty:
+            self.update_memory_display()
+        if 'page_table' in dirty:
+            self.update_page_table_display()
+        if 'swap' in dirty:
+            self.update_swap_display()
+        dirty.clear()
         self.update_stats_display()
+        self.update_profile_display()
@@ -0,0 +1,413 @@
+import tkinter as tk
+from tkinter import ttk
+
+FREE_COLOR = '#ecf0f1'
+EMPTY_COLOR = '#bdc3c7'
+
+
+class MemoryMap:
+    """
+    Vista de la memoria física sobre un Canvas cuyo costo de refresco depende de los píxeles
+    de la pantalla y no de la cantidad de marcos.
+    Con pocos marcos se dibuja una fila por marco (rectángulo y texto), pero solo para las
+    filas visibles: los ítems del Canvas se reutilizan y solo se reconfiguran los que cambiaron.
+    Por encima de HEATMAP_THRESHOLD marcos se dibuja un mapa de calor en un PhotoImage: cada
+    celda (de cell_px píxeles de lado) representa frames_per_cell marcos consecutivos y su color
+    es el del proceso dueño, aclarado según la ocupación. Se puede acercar, alejar y desplazar;
+    entre refrescos solo se repintan las celdas de los marcos marcados como modificados.
+    """
+    ROW_HEIGHT = 22
+    HEATMAP_THRESHOLD = 512
+    # Lado de celda mínimo y máximo en píxeles: con 2 se calcula un color por cada 4 píxeles.
+    MIN_CELL_PX = 2
+    MAX_CELL_PX = 16
+    # Marcos muestreados por celda para calcular su color cuando agrupa muchos marcos.
+    CELL_SAMPLES = 4
+
+    def __init__(self, parent, color_of, label_of):
+        """
+        Args:
+            parent (tk.Widget): Contenedor.
+            color_of (callable): Recibe el contenido de un marco ((pid, página) o None) y devuelve su color.
+            label_of (callable): Recibe el índice y el contenido de un marco y devuelve el texto de su fila.
+        """
+        self.color_of = color_of
+        self.label_of = label_of
+        self.frame = ttk.Frame(parent)
+        toolbar = ttk.Frame(self.frame)
+        toolbar.pack(side='top', fill='x')
+        ttk.Button(toolbar, text="−", width=3, command=self.zoom_out).pack(side='left')
+        ttk.Button(toolbar, text="+", width=3, command=self.zoom_in).pack(side='left', padx=2)
+        ttk.Button(toolbar, text="Ajustar", command=self.zoom_fit).pack(side='left')
+        self.info_var = tk.StringVar(value="")
+        ttk.Label(toolbar, textvariable=self.info_var).pack(side='left', padx=8)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas = tk.Canvas(self.frame, bg='white', highlightthickness=0)
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.canvas.bind('<Configure>', lambda event: self.invalidate())
+        self.canvas.bind('<Motion>', self.on_motion)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.canvas.bind(sequence, self.on_wheel)
+            self.canvas.bind('<Control-' + sequence[1:], self.on_zoom_wheel)
+
+        self.frames = []
+        self.offset = 0
+        self.frames_per_cell = None  # None: ajustar a la ventana
+        self.cell_px = self.MIN_CELL_PX
+        self.dirty = None  # None: repintar todo; set: marcos modificados
+        self.mode = None
+        self.size = (0, 0)
+        self.slots = []
+        self.shown = []
+        self.image = None
+        self.image_item = None
+        self.message_item = None
+        self.blend_cache = {}
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    def set_frames(self, frames):
+        """
+        Cambia la lista de marcos mostrada y refresca la vista. Si es una lista distinta de la
+        anterior (reinicio o cambio de configuración) se repinta todo.
+        Args:
+            frames (list): Contenido de cada marco: (pid, página) o None.
+        """
+        if frames is not self.frames:
+            self.frames = frames
+            self.offset = 0
+            self.frames_per_cell = None
+            self.cell_px = self.MIN_CELL_PX
+            self.dirty = None
+        self.refresh()
+
+    def mark_frames(self, frames):
+        """
+        Marca marcos cuyo contenido cambió para repintarlos en el próximo refresco.
+        Args:
+            frames (iterable): Índices de marco.
+        """
+        if self.dirty is not None:
+            self.dirty.update(frame for frame in frames if frame is not None)
+
+    def mark_all(self):
+        """
+        Marca toda la vista para repintarla en el próximo refresco.
+        """
+        self.dirty = None
+
+    def invalidate(self):
+        """
+        Repinta toda la vista.
+        """
+        self.mark_all()
+        self.refresh()
+
+    def refresh(self):
+        """
+        Sincroniza el Canvas con el contenido de los marcos.
+        """
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+        if (width, height) != self.size:
+            self.size = (width, height)
+            self.dirty = None
+        mode = 'rows' if len(self.frames) <= self.HEATMAP_THRESHOLD else 'heatmap'
+        if mode != self.mode:
+            self.clear_items()
+            self.mode = mode
+            self.dirty = None
+        if not self.frames:
+            self.show_message("No hay memoria física")
+        elif mode == 'rows':
+            self.refresh_rows()
+        else:
+            self.refresh_heatmap()
+        self.dirty = set()
+
+    def clear_items(self):
+        self.canvas.delete("all")
+        self.slots = []
+        self.shown = []
+        self.image = None
+        self.image_item = None
+        self.message_item = None
+
+    def show_message(self, text):
+        if self.message_item is None:
+            self.clear_items()
+            self.mode = None
+            self.message_item = self.canvas.create_text(self.size[0] / 2, self.size[1] / 2, text=text, fill="red")
+        self.info_var.set("")
+        self.scrollbar.set(0.0, 1.0)
+
+    # Una fila por marco
+
+    def refresh_rows(self):
+        """
+        Dibuja las filas visibles reutilizando los ítems del Canvas.
+        """
+        width, height = self.size
+        total = len(self.frames)
+        row_height = max(self.ROW_HEIGHT, height / total)
+        count = min(total, int(height // row_height) + 1)
+        self.offset = max(0, min(self.offset, total - count + 1 if count < total else 0))
+        canvas = self.canvas
+        while len(self.slots) < count:
+            self.slots.append((canvas.create_rectangle(0, 0, 0, 0, outline='#7f8c8d', width=1),
+                               canvas.create_text(0, 0, justify=tk.CENTER)))
+            self.shown.append(None)
+        while len(self.slots) > count:
+            canvas.delete(*self.slots.pop())
+            self.shown.pop()
+        font = ('Arial', 8 if row_height > 30 else 7)
+        for slot, (rectangle, text) in enumerate(self.slots):
+            index = self.offset + slot
+            if index >= total:
+                state = (index, None, None, None)
+                if self.shown[slot] != state:
+                    canvas.itemconfig(rectangle, state='hidden')
+                    canvas.itemconfig(text, state='hidden')
+                    self.shown[slot] = state
+                continue
+            content = self.frames[index]
+            state = (index, row_height, self.color_of(content), self.label_of(index, content))
+            if self.shown[slot] == state and self.dirty is not None:
+                continue
+            y1 = slot * row_height
+            canvas.coords(rectangle, 5, y1, width - 5, y1 + row_height)
+            canvas.itemconfig(rectangle, fill=state[2], state='normal')
+            canvas.coords(text, width / 2, y1 + row_height / 2)
+            canvas.itemconfig(text, text=state[3], font=font, state='normal',
+                              fill='#2c3e50' if content is None else '#ffffff')
+            self.shown[slot] = state
+        self.info_var.set(f"{total} marcos")
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + count) / total))
+
+    # Mapa de calor
+
+    def grid(self):
+        """
+        Calcula la geometría del mapa de calor para el tamaño y el zoom actuales.
+        Returns:
+            tuple: (columnas, filas visibles, filas totales, marcos por celda).
+        """
+        width, height = self.size
+        columns = max(1, width // self.cell_px)
+        visible_rows = max(1, height // self.cell_px)
+        frames_per_cell = self.frames_per_cell or self.fit_frames_per_cell()
+        cells = -(-len(self.frames) // frames_per_cell)
+        return columns, visible_rows, -(-cells // columns), frames_per_cell
+
+    def fit_frames_per_cell(self):
+        width, height = self.size
+        pixels = max(1, (width // self.cell_px) * (height // self.cell_px))
+        return max(1, -(-len(self.frames) // pixels))
+
+    def cell_color(self, cell, frames_per_cell):
+        """
+        Obtiene el color de una celda muestreando hasta CELL_SAMPLES de sus marcos.
+        Args:
+            cell (int): Índice lineal de la celda.
+            frames_per_cell (int): Marcos por celda.
+        Returns:
+            str: Color en formato #rrggbb.
+        """
+        frames = self.frames
+        start = cell * frames_per_cell
+        span = min(frames_per_cell, len(frames) - start)
+        if span <= 0:
+            return EMPTY_COLOR
+        if span == 1:
+            return self.color_of(frames[start])
+        step = max(1, span // self.CELL_SAMPLES)
+        sampled = frames[start:start + span:step][:self.CELL_SAMPLES]
+        free = sampled.count(None)
+        if free == len(sampled):
+            return FREE_COLOR
+        owner = sampled[0] if sampled[0] is not None else next(content for content in sampled if content is not None)
+        return self.blend(self.color_of(owner), len(sampled) - free, len(sampled))
+
+    def blend(self, color, occupied, samples):
+        """
+        Mezcla el color del proceso con el de marco libre según la fracción ocupada.
+        """
+        key = (color, occupied, samples)
+        mixed = self.blend_cache.get(key)
+        if mixed is None:
+            ratio = occupied / samples
+            channels = []
+            for position in (1, 3, 5):
+                full = int(color[position:position + 2], 16)
+                free = int(FREE_COLOR[position:position + 2], 16)
+                channels.append(round(free + (full - free) * ratio))
+            mixed = '#%02x%02x%02x' % tuple(channels)
+            self.blend_cache[key] = mixed
+        return mixed
+
+    def refresh_heatmap(self):
+        """
+        Repinta el mapa de calor: completo si cambió la geometría, o solo las celdas de los
+        marcos modificados.
+        """
+        width, height = self.size
+        columns, visible_rows, total_rows, frames_per_cell = self.grid()
+        self.offset = max(0, min(self.offset, total_rows - visible_rows))
+        cell_px = self.cell_px
+        first_cell = self.offset * columns
+        last_cell = first_cell + visible_rows * columns
+        if self.image is None or (self.image.width(), self.image.height()) != (width, height):
+            self.image = tk.PhotoImage(width=width, height=height)
+            if self.image_item is None:
+                self.image_item = self.canvas.create_image(0, 0, anchor='nw', image=self.image)
+            else:
+                self.canvas.itemconfig(self.image_item, image=self.image)
+            self.dirty = None
+        dirty_cells = None
+        if self.dirty is not None:
+            dirty_cells = {frame // frames_per_cell for frame in self.dirty}
+            dirty_cells = [cell for cell in dirty_cells if first_cell <= cell < last_cell]
+            if len(dirty_cells) > visible_rows * columns // 4:
+                dirty_cells = None
+        if dirty_cells is None:
+            rows = []
+            frames, color_of = self.frames, self.color_of
+            for row in range(visible_rows):
+                start = first_cell + row * columns
+                if frames_per_cell == 1:
+                    colors = [color_of(content) for content in frames[start:start + columns]]
+                    colors.extend([EMPTY_COLOR] * (columns - len(colors)))
+                else:
+                    colors = [self.cell_color(cell, frames_per_cell) for cell in range(start, start + columns)]
+                if cell_px > 1:
+                    colors = [color for color in colors for _ in range(cell_px)]
+                line = "{" + " ".join(colors) + "}"
+                rows.extend([line] * cell_px)
+            self.image.blank()
+            self.image.put(" ".join(rows), to=(0, 0))
+        else:
+            for cell in dirty_cells:
+                row, column = divmod(cell - first_cell, columns)
+                x, y = column * cell_px, row * cell_px
+                self.image.put(self.cell_color(cell, frames_per_cell), to=(x, y, x + cell_px, y + cell_px))
+        zoom = f"{frames_per_cell} marcos/celda" if frames_per_cell > 1 else f"1 marco = {cell_px} px"
+        self.info_var.set(f"{len(self.frames)} marcos · {zoom}")
+        if total_rows:
+            self.scrollbar.set(self.offset / total_rows, min(1.0, (self.offset + visible_rows) / total_rows))
+
+    def frame_at(self, x, y):
+        """
+        Obtiene el primer marco bajo un punto del Canvas.
+        Returns:
+            int: Índice del marco, o None si no hay marco en ese punto.
+        """
+        if self.mode == 'rows' and self.shown:
+            row_height = self.shown[0][1] if self.shown[0] and self.shown[0][1] else self.ROW_HEIGHT
+            index = self.offset + int(y // row_height)
+        elif self.mode == 'heatmap':
+            columns, _, _, frames_per_cell = self.grid()
+            column = int(x // self.cell_px)
+            if column >= columns:
+                return None
+            index = ((self.offset + int(y // self.cell_px)) * columns + column) * frames_per_cell
+        else:
+            return None
+        return index if 0 <= index < len(self.frames) else None
+
+    def on_motion(self, event):
+        if self.mode != 'heatmap':
+            return
+        index = self.frame_at(event.x, event.y)
+        if index is not None:
+            self.info_var.set(self.label_of(index, self.frames[index]))
+
+    # Zoom y desplazamiento
+
+    def set_zoom(self, frames_per_cell, cell_px):
+        if self.mode != 'heatmap':
+            return
+        _, _, _, old_frames_per_cell = self.grid()
+        columns = max(1, self.size[0] // self.cell_px)
+        first_frame = self.offset * columns * old_frames_per_cell
+        self.frames_per_cell = frames_per_cell
+        self.cell_px = cell_px
+        columns = max(1, self.size[0] // self.cell_px)
+        self.offset = first_frame // (columns * (frames_per_cell or self.fit_frames_per_cell()))
+        self.invalidate()
+
+    def zoom_in(self):
+        """
+        Acerca: primero reduce los marcos por celda a la mitad y, con un marco por celda,
+        duplica los píxeles por celda.
+        """
+        if self.mode != 'heatmap':
+            return
+        frames_per_cell = self.grid()[3]
+        if frames_per_cell > 1:
+            self.set_zoom(frames_per_cell // 2, self.cell_px)
+        elif self.cell_px < self.MAX_CELL_PX:
+            self.set_zoom(1, self.cell_px * 2)
+
+    def zoom_out(self):
+        """
+        Aleja, hasta que toda la memoria cabe en la ventana.
+        """
+        if self.mode != 'heatmap':
+            return
+        frames_per_cell = self.grid()[3]
+        if self.cell_px > self.MIN_CELL_PX:
+            self.set_zoom(1, self.cell_px // 2)
+        elif frames_per_cell < self.fit_frames_per_cell():
+            fit = self.fit_frames_per_cell()
+            self.set_zoom(None if frames_per_cell * 2 >= fit else frames_per_cell * 2, self.cell_px)
+
+    def zoom_fit(self):
+        """
+        Vuelve a mostrar toda la memoria en la ventana.
+        """
+        self.offset = 0
+        self.set_zoom(None, self.MIN_CELL_PX)
+
+    def scroll_to(self, offset):
+        offset = max(0, int(offset))
+        if offset != self.offset:
+            self.offset = offset
+            self.invalidate()
+
+    def on_scroll(self, action, amount, unit=None):
+        """
+        Atiende los comandos de la barra de desplazamiento ('moveto' o 'scroll').
+        """
+        if self.mode == 'heatmap':
+            total, page = self.grid()[2], self.grid()[1]
+        else:
+            total, page = len(self.frames), max(1, len(self.slots) - 1)
+        if action == 'moveto':
+            self.scroll_to(float(amount) * total)
+        elif action == 'scroll':
+            step = page if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def on_wheel(self, event):
+        """
+        Desplaza la vista con la rueda del ratón (MouseWheel o botones 4/5 en X11).
+        """
+        step = 3 if self.mode == 'rows' else max(1, self.grid()[1] // 10)
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.offset - step)
+        else:
+            self.scroll_to(self.offset + step)
+        return 'break'
+
+    def on_zoom_wheel(self, event):
+        """
+        Acerca o aleja con Control + rueda del ratón.
+        """
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.zoom_in()
+        else:
+            self.zoom_out()
+        return 'break'
@@ -0,0 +1,140 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class VirtualTable:
+    """
+    Treeview virtualizado: la tabla completa es una secuencia de claves más una función que
+    arma los valores de una fila, y solo las filas visibles existen como ítems del Treeview.
+    Cada actualización compara la ventana visible con lo que ya se muestra y solo inserta,
+    modifica, mueve o borra las filas que cambiaron, así que el costo depende de lo que se
+    ve y de lo que cambió, no del tamaño de la tabla.
+    """
+    ROW_HEIGHT = 20
+    HEADER_HEIGHT = 25
+
+    def __init__(self, parent, columns, widths=None, headings=None):
+        """
+        Args:
+            parent (tk.Widget): Contenedor.
+            columns (tuple): Identificadores de columna.
+            widths (dict, opcional): Ancho por columna.
+            headings (dict, opcional): Título por columna; por defecto el identificador.
+        """
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings')
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+        for column in columns:
+            self.tree.heading(column, text=(headings or {}).get(column, column))
+            self.tree.column(column, width=(widths or {}).get(column, 90), anchor='center')
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.on_wheel)
+        self.tree.bind('<Configure>', lambda event: self.refresh())
+        self.keys = ()
+        self.row_source = None
+        self.offset = 0
+        self.iids = {}
+        self.shown = {}
+        self.next_iid = 0
+
+    def pack(self, **options):
+        self.frame.pack(**options)
+
+    def column(self, column, **options):
+        self.tree.column(column, **options)
+
+    def visible_rows(self):
+        """
+        Obtiene cuántas filas caben en el alto actual del Treeview.
+        Returns:
+            int: Filas visibles (con una de margen).
+        """
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return 30
+        return max(1, (height - self.HEADER_HEIGHT) // self.ROW_HEIGHT + 1)
+
+    def set_rows(self, keys, row_source):
+        """
+        Cambia el contenido de la tabla y redibuja la ventana visible.
+        Args:
+            keys (secuencia): Claves de todas las filas, en orden (admite range o listas).
+            row_source (callable): Recibe una clave y devuelve la tupla de valores de su fila.
+        """
+        self.keys = keys
+        self.row_source = row_source
+        self.refresh()
+
+    def refresh(self):
+        """
+        Sincroniza los ítems del Treeview con la ventana visible de la tabla.
+        """
+        if self.row_source is None:
+            return
+        total = len(self.keys)
+        count = self.visible_rows()
+        self.offset = max(0, min(self.offset, total - count))
+        window = self.keys[self.offset:self.offset + count]
+        wanted = set(window)
+        tree = self.tree
+        for key in [key for key in self.iids if key not in wanted]:
+            tree.delete(self.iids.pop(key))
+            del self.shown[key]
+        order = []
+        for key in window:
+            values = self.row_source(key)
+            iid = self.iids.get(key)
+            if iid is None:
+                iid = f"r{self.next_iid}"
+                self.next_iid += 1
+                self.iids[key] = iid
+                tree.insert('', 'end', iid=iid, values=values)
+            elif self.shown[key] != values:
+                tree.item(iid, values=values)
+            self.shown[key] = values
+            order.append(iid)
+        if tuple(order) != tree.get_children():
+            tree.set_children('', *order)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def clear(self):
+        """
+        Vacía la tabla.
+        """
+        self.set_rows((), lambda key: ())
+
+    def scroll_to(self, offset):
+        """
+        Desplaza la ventana visible a otra fila inicial.
+        Args:
+            offset (int): Índice de la primera fila visible.
+        """
+        offset = max(0, int(offset))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def on_scroll(self, action, amount, unit=None):
+        """
+        Atiende los comandos de la barra de desplazamiento ('moveto' o 'scroll').
+        """
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.keys))
+        elif action == 'scroll':
+            step = self.visible_rows() - 1 if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(amount) * max(1, step))
+
+    def on_wheel(self, event):
+        """
+        Desplaza la ventana con la rueda del ratón (MouseWheel o botones 4/5 en X11).
+        """
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.scroll_to(self.offset - 3)
+        else:
+            self.scroll_to(self.offset + 3)
+        return 'break'